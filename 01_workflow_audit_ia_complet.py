@@ -7,20 +7,27 @@ Combinaison parfaite de l'analyse IA de contenu et du crawl Screaming Frog
 import subprocess
 import os
 import csv
-import requests
 from bs4 import BeautifulSoup
 from urllib.parse import urljoin, urlparse
 from typing import List, Optional
-from ext_detecteur_contenu_ia import IntelligentContentDetector
-import json
+from ext_detecteur_contenu_ia import IntelligentContentDetector, HTML_PARSER, RateLimiter
 import time
 import glob
+import heapq
+from concurrent.futures import ThreadPoolExecutor
+
+# Pages sources récupérées et analysées en parallèle lors du filtrage des liens
+PAGE_FETCH_WORKERS = 6
+# Débit maximal de ces récupérations (requêtes par seconde) : limiteur propre au workflow,
+# celui du détecteur (1 requête/s) reste réservé à l'échantillonnage des pages analysées par l'IA
+PAGE_FETCH_RATE = 10.0
 
 class FinalIntelligentWorkflow:
     """Workflow final combinant IA + Screaming Frog + Analyse sémantique"""
     
     def __init__(self):
         self.detector = IntelligentContentDetector()
+        self.page_rate_limiter = RateLimiter(PAGE_FETCH_RATE)
         self.xpath_content = ""
         self.xpath_links = ""
         self.ai_analysis = {}
@@ -31,7 +38,7 @@ class FinalIntelligentWorkflow:
             import xml.etree.ElementTree as ET
 
             print(f"   📥 Téléchargement du sitemap...")
-            response = requests.get(sitemap_url, timeout=30)
+            response = self.detector.session.get(sitemap_url, timeout=30)
             response.raise_for_status()
 
             # Parser le XML
@@ -183,7 +190,7 @@ class FinalIntelligentWorkflow:
                     with open('/proc/version', 'r') as f:
                         if 'microsoft' in f.read().lower():
                             is_wsl = True
-            except:
+            except Exception:
                 pass
 
             if is_wsl:
@@ -351,29 +358,28 @@ class FinalIntelligentWorkflow:
         processed_pages = {}
         
         base_domain = urlparse(website_url).netloc
+        internal_prefixes = (f"http://{base_domain}", f"https://{base_domain}")
         
         print(f"   🔍 Analyse page par page avec détection IA...")
         
-        for i, link in enumerate(sf_links):
-            source_url = link.get('Source', '')
-            dest_url = link.get('Destination', '')
-            anchor_text = link.get('Anchor', '') or link.get('Ancrage', '')
-            
-            # Filtrer les liens internes uniquement
-            if not dest_url.startswith(f"http://{base_domain}") and not dest_url.startswith(f"https://{base_domain}"):
-                continue
-            
-            # Vérifier si la page source a déjà été analysée
-            if source_url not in processed_pages:
-                page_editorial_links = self.extract_editorial_links_from_page_with_ai(source_url)
+        # Filtrer les liens internes uniquement
+        internal_links = [link for link in sf_links if link.get('Destination', '').startswith(internal_prefixes)]
+        
+        # Chaque page source n'est analysée qu'une fois ; les pages sont récupérées en parallèle,
+        # au plus PAGE_FETCH_RATE requêtes par seconde pour ne pas surcharger le site audité
+        source_urls = list(dict.fromkeys(link.get('Source', '') for link in internal_links))
+        with ThreadPoolExecutor(max_workers=PAGE_FETCH_WORKERS) as executor:
+            results = executor.map(self.extract_editorial_links_from_page_with_ai, source_urls)
+            for source_url, page_editorial_links in zip(source_urls, results):
                 processed_pages[source_url] = page_editorial_links
                 
                 # Afficher le progrès
                 if (len(processed_pages)) % 10 == 0:
                     print(f"      📊 Analysé {len(processed_pages)} pages uniques...")
-            
+        
+        for link in internal_links:
             # Vérifier si ce lien spécifique est éditorial
-            editorial_links_on_page = processed_pages[source_url]
+            editorial_links_on_page = processed_pages[link.get('Source', '')]
             
             if self.is_link_editorial_advanced(link, editorial_links_on_page, website_url):
                 editorial_links.append(link)
@@ -383,13 +389,12 @@ class FinalIntelligentWorkflow:
     def extract_editorial_links_from_page_with_ai(self, page_url: str) -> list:
         """Extraire les liens éditoriaux d'une page en utilisant l'analyse IA"""
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(page_url, headers=headers, timeout=10)
+            # Session keep-alive du détecteur (même User-Agent) : les pages du site réutilisent ses connexions
+            self.page_rate_limiter.wait()
+            response = self.detector.session.get(page_url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.text, 'html.parser')
+            soup = BeautifulSoup(response.text, HTML_PARSER)
             
             # Utiliser l'analyse IA pour identifier les zones de contenu
             editorial_link_elements = self.find_editorial_links_with_ai_xpath(soup)
@@ -499,7 +504,7 @@ class FinalIntelligentWorkflow:
                 context = parent.get_text(strip=True)
                 # Limiter la longueur du contexte
                 return context[:100] + "..." if len(context) > 100 else context
-        except:
+        except Exception:
             pass
         return ""
     
@@ -535,7 +540,8 @@ class FinalIntelligentWorkflow:
         output_file = f"./exports/editorial_links_intelligent.csv"
         
         try:
-            with open(output_file, 'w', newline='', encoding='utf-8') as f:
+            # Tampon de 1 Mo : les lignes sont écrites en quelques gros appels système
+            with open(output_file, 'w', newline='', encoding='utf-8', buffering=1 << 20) as f:
                 if editorial_links:
                     fieldnames = editorial_links[0].keys()
                     writer = csv.DictWriter(f, fieldnames=fieldnames)
@@ -545,13 +551,13 @@ class FinalIntelligentWorkflow:
             print(f"   💾 Rapport intelligent généré: {output_file}")
             
             # Statistiques finales
-            internal_editorial = [link for link in editorial_links 
-                                if link.get('Destination', '').startswith(website_url)]
+            internal_editorial_count = sum(1 for link in editorial_links
+                                           if link.get('Destination', '').startswith(website_url))
             
             print(f"   📊 STATISTIQUES FINALES:")
             print(f"      🌐 Total liens crawlés: {total_links}")
             print(f"      ✍️  Liens éditoriaux détectés: {len(editorial_links)}")
-            print(f"      🏠 Liens éditoriaux internes: {len(internal_editorial)}")
+            print(f"      🏠 Liens éditoriaux internes: {internal_editorial_count}")
             print(f"      📊 Ratio d'efficacité: {len(editorial_links)/total_links*100:.1f}%")
             
             # Analyser les domaines de destination
@@ -561,7 +567,7 @@ class FinalIntelligentWorkflow:
                 domains[domain] = domains.get(domain, 0) + 1
             
             print(f"      🌍 Top domaines liés:")
-            for domain, count in sorted(domains.items(), key=lambda x: x[1], reverse=True)[:5]:
+            for domain, count in heapq.nlargest(5, domains.items(), key=lambda x: x[1]):
                 print(f"         • {domain}: {count} liens")
             
             return output_file
@@ -614,9 +620,9 @@ class FinalIntelligentWorkflow:
 
         try:
             # Import direct de l'analyseur sémantique pour avoir plus de contrôle
-            from ext_audit_maillage_classique import CompleteLinkAuditor
+            from ext_audit_maillage_classique import get_link_auditor
 
-            auditor = CompleteLinkAuditor()
+            auditor = get_link_auditor()
 
             # Analyser le fichier CSV filtré avec génération complète du rapport HTML
             print(f"   📊 Analyse des données avec CamemBERT...")
@@ -660,9 +666,9 @@ class FinalIntelligentWorkflow:
         
         try:
             # Import direct de l'analyseur sémantique pour avoir plus de contrôle
-            from ext_audit_maillage_classique import CompleteLinkAuditor
+            from ext_audit_maillage_classique import get_link_auditor
             
-            auditor = CompleteLinkAuditor()
+            auditor = get_link_auditor()
             
             # Analyser le fichier CSV filtré avec génération complète du rapport HTML
             print(f"   📊 Analyse des données avec CamemBERT...")
@@ -8,11 +8,35 @@ Version sans dépendances externes
 import csv
 import re
 import os
-import json
 from datetime import datetime
 from collections import Counter
+from itertools import islice
 from urllib.parse import urlparse
 
+# Patterns d'ancres mécaniques
+MECHANICAL_ANCHOR_PATTERNS = [
+    r'^(accueil|home|menu|navigation)$',
+    r'^(suivant|précédent|next|previous|page \d+)$',
+    r'^(lire la suite|en savoir plus|voir plus|read more)$',
+    r'^(contact|à propos|mentions légales|cgv|politique)$',
+    r'^\d+$',  # Seulement des chiffres
+    r'^(cliquez ici|cliquer ici|ici|click here)$',
+    r'^(retour|back|retour accueil)$',
+    r'^(passer au contenu)$',
+    r'^$'  # Ancres vides
+]
+
+# Patterns XPath mécaniques
+MECHANICAL_XPATH_PATTERNS = [
+    r'header|footer|nav|navigation|menu',
+    r'breadcrumb|pagination',
+    r'sidebar|widget'
+]
+
+# Compilés une seule fois, chaque liste en une alternative : une recherche par lien au lieu d'une par pattern
+MECHANICAL_ANCHOR_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in MECHANICAL_ANCHOR_PATTERNS))
+MECHANICAL_XPATH_RE = re.compile('|'.join(f'(?:{pattern})' for pattern in MECHANICAL_XPATH_PATTERNS))
+
 def load_csv_file(csv_path):
     """Charge le CSV avec gestion d'encodage"""
     if not os.path.exists(csv_path):
@@ -55,7 +79,7 @@ def is_internal_link(source_url, dest_url):
         source_domain = urlparse(source_url).netloc
         dest_domain = urlparse(dest_url).netloc
         return source_domain == dest_domain
-    except:
+    except Exception:
         return False
 
 def is_mechanical_link(row):
@@ -69,34 +93,13 @@ def is_mechanical_link(row):
     if origin in ['navigation', 'en-tête', 'pied de page']:
         return True
     
-    # Patterns d'ancres mécaniques
-    mechanical_anchors = [
-        r'^(accueil|home|menu|navigation)$',
-        r'^(suivant|précédent|next|previous|page \d+)$',
-        r'^(lire la suite|en savoir plus|voir plus|read more)$',
-        r'^(contact|à propos|mentions légales|cgv|politique)$',
-        r'^\d+$',  # Seulement des chiffres
-        r'^(cliquez ici|cliquer ici|ici|click here)$',
-        r'^(retour|back|retour accueil)$',
-        r'^(passer au contenu)$',
-        r'^$'  # Ancres vides
-    ]
-    
     # Vérifier les ancres
-    for pattern in mechanical_anchors:
-        if re.search(pattern, anchor):
-            return True
-    
-    # Patterns XPath mécaniques
-    mechanical_xpath_patterns = [
-        r'header|footer|nav|navigation|menu',
-        r'breadcrumb|pagination',
-        r'sidebar|widget'
-    ]
-    
-    for pattern in mechanical_xpath_patterns:
-        if re.search(pattern, xpath):
-            return True
+    if MECHANICAL_ANCHOR_RE.search(anchor):
+        return True
+    
+    # Vérifier le XPath
+    if MECHANICAL_XPATH_RE.search(xpath):
+        return True
             
     return False
 
@@ -196,7 +199,8 @@ def generate_html_report(analysis, website_url):
     
     stats = analysis['stats']
     
-    html_content = f"""
+    html_parts = []
+    html_parts.append(f"""
     <!DOCTYPE html>
     <html>
     <head>
@@ -248,61 +252,62 @@ def generate_html_report(analysis, website_url):
                     <div class="stat-label">Liens éditoriaux/page</div>
                 </div>
             </div>
-    """
+    """)
     
     # Pages les plus liées
     if analysis['most_linked_pages']:
-        html_content += """
+        html_parts.append("""
         <div class="section">
             <h2>📈 Pages les Plus Liées (liens entrants éditoriaux)</h2>
             <table>
                 <tr><th>URL</th><th>Liens entrants</th></tr>
-        """
-        for url, count in list(analysis['most_linked_pages'].items())[:15]:
-            html_content += f"<tr><td class='url'>{url}</td><td><strong>{count}</strong></td></tr>"
-        html_content += "</table></div>"
+        """)
+        for url, count in islice(analysis['most_linked_pages'].items(), 15):
+            html_parts.append(f"<tr><td class='url'>{url}</td><td><strong>{count}</strong></td></tr>")
+        html_parts.append("</table></div>")
     
     # Pages orphelines
     if analysis['orphan_pages']:
-        html_content += f"""
+        html_parts.append(f"""
         <div class="section">
             <h2>⚠️ Pages Orphelines</h2>
             <div class="warning">
                 <p><strong>{len(analysis['orphan_pages'])} pages sans liens entrants éditoriaux:</strong></p>
                 <ul class="orphan-list">
-        """
-        for orphan in analysis['orphan_pages'][:30]:
-            html_content += f"<li class='url'>{orphan}</li>"
-        if len(analysis['orphan_pages']) > 30:
-            html_content += f"<li><em>... et {len(analysis['orphan_pages']) - 30} autres</em></li>"
-        html_content += "</ul></div></div>"
+        """)
+        for orphan in islice(analysis['orphan_pages'], 30):
+            html_parts.append(f"<li class='url'>{orphan}</li>")
+        remaining = len(analysis['orphan_pages']) - 30
+        if remaining > 0:
+            html_parts.append(f"<li><em>... et {remaining} autres</em></li>")
+        html_parts.append("</ul></div></div>")
     
     # Ancres sur-optimisées
     if analysis['over_optimized_anchors']:
-        html_content += """
+        html_parts.append("""
         <div class="section">
             <h2>⚠️ Ancres Potentiellement Sur-optimisées</h2>
             <div class="warning">
                 <table>
                     <tr><th>Ancre</th><th>Occurrences</th></tr>
-        """
-        for anchor, count in list(analysis['over_optimized_anchors'].items())[:10]:
-            html_content += f"<tr><td>{anchor}</td><td><strong>{count}</strong></td></tr>"
-        html_content += "</table></div></div>"
+        """)
+        for anchor, count in islice(analysis['over_optimized_anchors'].items(), 10):
+            html_parts.append(f"<tr><td>{anchor}</td><td><strong>{count}</strong></td></tr>")
+        html_parts.append("</table></div></div>")
     
     # Pages qui lient le plus
     if analysis['top_linking_pages']:
-        html_content += """
+        html_parts.append("""
         <div class="section">
             <h2>🔗 Pages avec le Plus de Liens Sortants</h2>
             <table>
                 <tr><th>URL</th><th>Liens sortants</th></tr>
-        """
-        for url, count in list(analysis['top_linking_pages'].items())[:15]:
-            html_content += f"<tr><td class='url'>{url}</td><td><strong>{count}</strong></td></tr>"
-        html_content += "</table></div>"
+        """)
+        for url, count in islice(analysis['top_linking_pages'].items(), 15):
+            html_parts.append(f"<tr><td class='url'>{url}</td><td><strong>{count}</strong></td></tr>")
+        html_parts.append("</table></div>")
     
-    html_content += """
+    html_parts.append("""
         <div class="recommendations">
             <h2>💡 Recommandations</h2>
             <ul>
@@ -316,10 +321,10 @@ def generate_html_report(analysis, website_url):
     </div>
     </body>
     </html>
-    """
+    """)
     
     with open(report_file, 'w', encoding='utf-8') as f:
-        f.write(html_content)
+        f.writelines(html_parts)
     
     return report_file
 
@@ -5,12 +5,29 @@ Analyseur intelligent de contenu HTML avec l'API Anthropic
 
 import os
 import requests
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, List, Optional
 import json
 import time
-from urllib.parse import urlparse
 import re
 
+# Blocs retirés du HTML avant l'analyse, compilés une seule fois
+SCRIPT_RE = re.compile(r'<script[^>]*>.*?</script>', re.DOTALL | re.IGNORECASE)
+STYLE_RE = re.compile(r'<style[^>]*>.*?</style>', re.DOTALL | re.IGNORECASE)
+HTML_COMMENT_RE = re.compile(r'<!--.*?-->', re.DOTALL)
+
+# Balises structurelles importantes : une ligne est gardée si elle en contient une
+IMPORTANT_TAGS = (
+    'html', 'body', 'header', 'nav', 'main', 'article', 'section',
+    'aside', 'footer', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
+    'p', 'a', 'ul', 'ol', 'li', 'span'
+)
+# Nombre maximal de lignes examinées (évite le spam)
+MAX_ANALYSIS_LINES = 200
+
+# Pages lues en flux par blocs de 64 Ko, au plus 256 Ko : seul le début du document est analysé
+PAGE_CHUNK_BYTES = 64 * 1024
+MAX_PAGE_BYTES = 256 * 1024
+
 try:
     import anthropic
     ANTHROPIC_AVAILABLE = True
@@ -45,9 +62,14 @@ class AnthropicContentAnalyzer:
             headers = {
                 'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/91.0.4472.124 Safari/537.36'
             }
-            response = requests.get(url, headers=headers, timeout=timeout)
-            response.raise_for_status()
-            return response.text
+            with requests.get(url, headers=headers, timeout=timeout, stream=True) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=PAGE_CHUNK_BYTES):
+                    body += chunk
+                    if len(body) >= MAX_PAGE_BYTES:
+                        break
+                return body[:MAX_PAGE_BYTES].decode(response.encoding or 'utf-8', errors='replace')
         except Exception as e:
             print(f"❌ Erreur récupération {url}: {e}")
             return None
@@ -130,27 +152,18 @@ Analysez le HTML et répondez UNIQUEMENT avec le JSON, sans explication."""
         """Nettoyer le HTML pour garder seulement la structure pertinente"""
         
         # Enlever les scripts, styles, commentaires
-        html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
-        html = re.sub(r'<!--.*?-->', '', html, flags=re.DOTALL)
-        
-        # Garder seulement les balises structurelles importantes
-        important_tags = [
-            'html', 'body', 'header', 'nav', 'main', 'article', 'section', 
-            'aside', 'footer', 'div', 'h1', 'h2', 'h3', 'h4', 'h5', 'h6',
-            'p', 'a', 'ul', 'ol', 'li', 'span'
-        ]
-        
-        # Pattern pour garder seulement les balises importantes avec leurs attributs class/id
-        pattern = r'<(?!/?)(' + '|'.join(important_tags) + r')(\s+[^>]*)?>'
+        html = SCRIPT_RE.sub('', html)
+        html = STYLE_RE.sub('', html)
+        html = HTML_COMMENT_RE.sub('', html)
         
-        # Simplifier en gardant la structure
-        lines = html.split('\n')
+        # Simplifier en gardant la structure : seules les premières lignes sont découpées,
+        # le reste du document reste dans le dernier élément, ignoré
         cleaned_lines = []
         
-        for line in lines[:200]:  # Limiter à 200 lignes pour éviter le spam
+        for line in html.split('\n', MAX_ANALYSIS_LINES)[:MAX_ANALYSIS_LINES]:
             line = line.strip()
-            if line and (any(tag in line.lower() for tag in important_tags) or '<a ' in line.lower()):
+            lowered = line.lower()
+            if line and (any(tag in lowered for tag in IMPORTANT_TAGS) or '<a ' in lowered):
                 cleaned_lines.append(line)
         
         return '\n'.join(cleaned_lines)
@@ -4,23 +4,88 @@ Module d'analyse sémantique avancée avec CamemBERT pour l'audit de maillage in
 """
 
 import os
+import sys
 import json
+import time
+import socket
+import getpass
 import hashlib
-import pickle
+import tempfile
+import subprocess
+import importlib.util
 from collections import defaultdict, Counter
 import numpy as np
 from typing import Dict, List, Tuple, Optional
 
-# Import conditionnel des dépendances ML
+# Dépendances ML importées au premier besoin (torch seul demande plusieurs secondes) :
+# None tant que l'import n'a pas été tenté
+DEPENDENCIES_AVAILABLE = None
+
+def _import_ml_dependencies() -> bool:
+    """Importer les dépendances ML si ce n'est pas déjà fait, et indiquer si elles sont disponibles"""
+    global SentenceTransformer, st_util, torch, DEPENDENCIES_AVAILABLE
+    if DEPENDENCIES_AVAILABLE is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            from sentence_transformers import util as st_util
+            import torch
+            DEPENDENCIES_AVAILABLE = True
+        except ImportError:
+            DEPENDENCIES_AVAILABLE = False
+            print("⚠️  Dépendances ML non installées. Fonctionnalités avancées désactivées.")
+            print("💡 Installez avec: pip install sentence-transformers scikit-learn")
+    return DEPENDENCIES_AVAILABLE
+
+# Import optionnel d'orjson pour lire/écrire l'index du cache (un hash par texte encodé)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import optionnel de fcntl (absent sous Windows) pour verrouiller le cache partagé entre deux audits
 try:
-    from sentence_transformers import SentenceTransformer
-    from sklearn.metrics.pairwise import cosine_similarity
-    from sklearn.cluster import DBSCAN
-    DEPENDENCIES_AVAILABLE = True
+    import fcntl
+    FCNTL_AVAILABLE = True
 except ImportError:
-    DEPENDENCIES_AVAILABLE = False
-    print("⚠️  Dépendances ML non installées. Fonctionnalités avancées désactivées.")
-    print("💡 Installez avec: pip install sentence-transformers scikit-learn")
+    FCNTL_AVAILABLE = False
+
+# Cache des embeddings : une matrice float16 (une ligne par texte) projetée en mémoire,
+# et un index JSON hash du texte -> ligne, au lieu d'un fichier pickle par texte.
+# La demi-précision divise la taille du cache par deux, sans effet sensible sur la similarité cosinus
+CACHE_EMBEDDINGS_FILE = "embeddings.f16"
+CACHE_INDEX_FILE = "index.json"
+# Verrou pris pendant l'ajout d'embeddings et l'écriture de l'index (plusieurs audits peuvent
+# partager le même dossier de cache)
+CACHE_LOCK_FILE = "cache.lock"
+CACHE_DTYPE = np.float16
+# Fichiers d'anciens formats du cache, supprimés avec lui
+LEGACY_CACHE_FILES = ("embeddings.f32",)
+
+# Serveur d'embeddings (ext_serveur_semantique.py) : garde le modèle chargé entre deux exécutions.
+# Démarré à la demande, il s'arrête après SEMANTIC_SERVER_IDLE_TIMEOUT secondes d'inactivité
+# (AUDIT_SEMANTIC_SERVER=0 pour toujours charger le modèle dans le processus courant)
+SEMANTIC_SERVER_SOCKET = os.path.join(tempfile.gettempdir(), f"audit_maillage_semantique_{getpass.getuser()}.sock")
+SEMANTIC_SERVER_SCRIPT = os.path.join(os.path.dirname(os.path.abspath(__file__)), "ext_serveur_semantique.py")
+# Démarrage : le premier lancement peut télécharger le modèle, d'où un délai large (le serveur
+# est arrêté s'il ne répond toujours pas, avant le repli sur un chargement local)
+SEMANTIC_SERVER_START_TIMEOUT = 15 * 60
+# Délai par opération sur la socket : un serveur bloqué ne doit pas figer l'audit
+SEMANTIC_SERVER_REQUEST_TIMEOUT = 10 * 60
+SEMANTIC_SERVER_PING_TIMEOUT = 5
+SEMANTIC_SERVER_IDLE_TIMEOUT = 30 * 60
+
+# Au-delà de ce nombre de pages, find_semantic_gaps ne construit plus la matrice de similarité
+# complète (N² valeurs) mais cherche les paires par blocs avec sentence-transformers
+DENSE_SIMILARITY_MAX_PAGES = 2000
+
+# Mots vides français ignorés pour nommer les thèmes
+FRENCH_STOP_WORDS = frozenset({
+    'dans', 'avec', 'pour', 'sur', 'sous', 'vers', 'chez', 'sans', 'contre',
+    'depuis', 'pendant', 'avant', 'après', 'entre', 'parmi', 'selon',
+    'notre', 'votre', 'leur', 'cette', 'ces', 'tous', 'toutes',
+    'plus', 'moins', 'très', 'bien', 'encore', 'aussi', 'donc'
+})
 
 class CamemBERTSemanticAnalyzer:
     """Analyseur sémantique avancé avec CamemBERT et cache intelligent"""
@@ -28,6 +93,9 @@ class CamemBERTSemanticAnalyzer:
     def __init__(self, cache_dir="./semantic_cache"):
         self.cache_dir = cache_dir
         self.model = None
+        self._cache_index = None
+        self._cache_matrix = None
+        self.device = 'cuda' if _import_ml_dependencies() and torch.cuda.is_available() else 'cpu'
         # Modèles français par ordre de préférence
         self.french_models = [
             "sentence-transformers/paraphrase-multilingual-MiniLM-L12-v2",  # Multilingue avec bon français
@@ -44,13 +112,14 @@ class CamemBERTSemanticAnalyzer:
     
     def _load_model(self):
         """Charger le meilleur modèle français disponible"""
-        if self.model is None and DEPENDENCIES_AVAILABLE:
+        if self.model is None and _import_ml_dependencies():
             print(f"🧠 Chargement du modèle sémantique français...")
             
             for model_name in self.french_models:
                 try:
                     print(f"🔄 Tentative: {model_name}")
-                    self.model = SentenceTransformer(model_name)
+                    self.model = SentenceTransformer(model_name, device=self.device)
+                    self._optimize_model()
                     print(f"✅ Modèle chargé avec succès: {model_name}")
                     self.current_model_name = model_name
                     break
@@ -64,32 +133,124 @@ class CamemBERTSemanticAnalyzer:
                 
         return self.model is not None
     
+    def _optimize_model(self):
+        """Accélérer l'inférence : FP16 sur GPU, quantification int8 dynamique sur CPU"""
+        try:
+            if self.device == 'cuda':
+                self.model = self.model.half()
+                print("⚡ Inférence GPU en FP16")
+            else:
+                from torch.quantization import quantize_dynamic
+                self.model = quantize_dynamic(self.model, {torch.nn.Linear}, dtype=torch.qint8)
+                print("⚡ Inférence CPU quantifiée (int8)")
+        except Exception as e:
+            # Le modèle FP32 d'origine reste utilisable
+            print(f"⚠️  Optimisation du modèle impossible: {str(e)[:100]}")
+    
     def _get_cache_key(self, text: str) -> str:
         """Générer une clé de cache basée sur le hash du texte"""
-        return hashlib.md5(text.encode('utf-8')).hexdigest()
+        # BLAKE2b (16 octets) : même longueur de clé que MD5, plus rapide sur les longs contenus
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
     
-    def _get_cached_embedding(self, text: str) -> Optional[np.ndarray]:
-        """Récupérer un embedding depuis le cache"""
-        cache_key = self._get_cache_key(text)
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.pkl")
-        
-        if os.path.exists(cache_file):
-            try:
-                with open(cache_file, 'rb') as f:
-                    return pickle.load(f)
-            except Exception:
-                # Cache corrompu, supprimer
-                os.remove(cache_file)
-        return None
+    def _load_cache_index(self) -> Dict[str, int]:
+        """Charger l'index du cache (hash du texte -> ligne dans le fichier d'embeddings)"""
+        if self._cache_index is not None:
+            return self._cache_index
+        
+        dim = self.model.get_sentence_embedding_dimension()
+        with self._cache_lock():
+            self._cache_index = self._read_valid_cache_index(dim)
+            if not self._cache_index:
+                self._reset_cache_files()
+        return self._cache_index
     
-    def _cache_embedding(self, text: str, embedding: np.ndarray):
-        """Sauvegarder un embedding dans le cache"""
-        cache_key = self._get_cache_key(text)
-        cache_file = os.path.join(self.cache_dir, f"{cache_key}.pkl")
-        
+    def _read_valid_cache_index(self, dim: int) -> Dict[str, int]:
+        """Index présent sur le disque, limité aux lignes entièrement écrites ({} si absent ou corrompu)"""
+        try:
+            data = self._read_cache_index_file()
+            rows_on_disk = os.path.getsize(os.path.join(self.cache_dir, CACHE_EMBEDDINGS_FILE)) // (dim * CACHE_DTYPE().itemsize)
+            if data.get("dim") == dim:
+                return {key: row for key, row in data["rows"].items() if row < rows_on_disk}
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+        return {}
+    
+    def _cache_lock(self):
+        """Verrou exclusif sur le dossier de cache (fichier ouvert à fermer en sortie de bloc)"""
+        lock_file = open(os.path.join(self.cache_dir, CACHE_LOCK_FILE), 'a')
+        if FCNTL_AVAILABLE:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)  # Libéré à la fermeture du fichier
+        return lock_file
+    
+    def _read_cache_index_file(self) -> Dict:
+        """Lire le fichier d'index du cache (orjson si disponible)"""
+        with open(os.path.join(self.cache_dir, CACHE_INDEX_FILE), 'rb') as f:
+            data = f.read()
+        return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+    
+    def _reset_cache_files(self):
+        """Vider les fichiers du cache d'embeddings"""
+        for filename in (CACHE_EMBEDDINGS_FILE, CACHE_INDEX_FILE) + LEGACY_CACHE_FILES:
+            path = os.path.join(self.cache_dir, filename)
+            if os.path.exists(path):
+                os.remove(path)
+        self._cache_matrix = None
+    
+    def _get_cached_embeddings(self, cache_keys: List[str]) -> List[Optional[np.ndarray]]:
+        """Récupérer des embeddings depuis le cache (None pour ceux qui n'y sont pas)"""
+        index = self._load_cache_index()
+        rows = [index.get(key) for key in cache_keys]
+        if all(row is None for row in rows):
+            return rows
+        
+        # Fichier projeté en mémoire : seules les lignes demandées sont lues
+        # Projection rouverte si le fichier a grandi depuis : le nombre de lignes du fichier peut
+        # dépasser celui de l'index (lignes orphelines d'un ajout interrompu, ou d'un autre audit)
+        dim = self.model.get_sentence_embedding_dimension()
+        if self._cache_matrix is None or max(row for row in rows if row is not None) >= len(self._cache_matrix):
+            self._cache_matrix = np.memmap(os.path.join(self.cache_dir, CACHE_EMBEDDINGS_FILE),
+                                           dtype=CACHE_DTYPE, mode='r').reshape(-1, dim)
+        # Lignes lues en un seul accès, renormalisées (l'arrondi float16 décale légèrement la norme)
+        hits = [i for i, row in enumerate(rows) if row is not None]
+        block = self._cache_matrix[[rows[i] for i in hits]].astype(np.float32)
+        norms = np.linalg.norm(block, axis=1, keepdims=True)
+        block /= np.where(norms == 0, 1, norms)
+        
+        cached = [None] * len(rows)
+        for i, embedding in zip(hits, block):
+            cached[i] = embedding
+        return cached
+    
+    def _cache_embeddings(self, cache_keys: List[str], embeddings: np.ndarray):
+        """Ajouter un lot d'embeddings au cache : une écriture pour le lot, puis l'index"""
+        index = self._load_cache_index()
         try:
-            with open(cache_file, 'wb') as f:
-                pickle.dump(embedding, f)
+            dim = int(embeddings.shape[1])
+            embeddings_path = os.path.join(self.cache_dir, CACHE_EMBEDDINGS_FILE)
+            row_bytes = dim * CACHE_DTYPE().itemsize
+            # Ajout et index sous verrou : un autre audit sur le même cache ne peut ni écrire
+            # ses lignes aux mêmes positions, ni perdre ses entrées quand l'index est réécrit
+            with self._cache_lock():
+                with open(embeddings_path, 'ab') as f:
+                    # Ligne partielle d'un ajout interrompu : la tronquer pour rester aligné
+                    size = f.seek(0, os.SEEK_END)
+                    if size % row_bytes:
+                        f.truncate(size - size % row_bytes)
+                    f.write(np.ascontiguousarray(embeddings, dtype=CACHE_DTYPE).tobytes())
+                    # Position relevée après l'écriture : premières lignes du lot
+                    first_row = f.tell() // row_bytes - len(cache_keys)
+                
+                # Entrées ajoutées entre-temps par un autre audit, puis celles de ce lot
+                index.update(self._read_valid_cache_index(dim))
+                for offset, key in enumerate(cache_keys):
+                    index[key] = first_row + offset
+                # Index écrit dans un fichier temporaire puis renommé : une interruption pendant
+                # l'écriture laisse l'ancien index intact (les lignes ajoutées sont alors ignorées)
+                data = {"dim": dim, "rows": index}
+                index_path = os.path.join(self.cache_dir, CACHE_INDEX_FILE)
+                with open(index_path + '.tmp', 'wb') as f:
+                    f.write(orjson.dumps(data) if ORJSON_AVAILABLE else json.dumps(data).encode('utf-8'))
+                os.replace(index_path + '.tmp', index_path)
         except Exception as e:
             print(f"⚠️  Impossible de sauvegarder le cache: {e}")
     
@@ -98,36 +259,42 @@ class CamemBERTSemanticAnalyzer:
         if not self._load_model():
             return np.array([])
         
+        # Clés de cache calculées une seule fois (None : texte trop court, embedding nul sans recherche)
+        keys = [self._get_cache_key(text) if text and len(text.strip()) >= 3 else None for text in texts]
+        lookup_keys = [key for key in keys if key is not None]
+        cached = dict(zip(lookup_keys, self._get_cached_embeddings(lookup_keys)))
+        zero_embedding = np.zeros(self.model.get_sentence_embedding_dimension(), dtype=np.float32)
+        
         embeddings = []
         texts_to_encode = []
-        cache_indices = {}
+        new_keys = {}  # Clé -> position dans texts_to_encode (un texte répété n'est encodé qu'une fois)
         
         # Vérifier le cache pour chaque texte
-        for i, text in enumerate(texts):
-            if not text or len(text.strip()) < 3:
-                embeddings.append(np.zeros(self.model.get_sentence_embedding_dimension()))
-                continue
-                
-            cached_embedding = self._get_cached_embedding(text)
-            if cached_embedding is not None:
-                embeddings.append(cached_embedding)
+        for text, key in zip(texts, keys):
+            if key is None:
+                embeddings.append(zero_embedding)
+            elif cached[key] is not None:
+                embeddings.append(cached[key])
             else:
-                cache_indices[len(texts_to_encode)] = i
-                texts_to_encode.append(text)
+                if key not in new_keys:
+                    new_keys[key] = len(texts_to_encode)
+                    texts_to_encode.append(text)
                 embeddings.append(None)  # Placeholder
         
         # Encoder les textes non mis en cache
         if texts_to_encode:
             print(f"🔄 Encodage de {len(texts_to_encode)} nouveaux textes...")
-            new_embeddings = self.model.encode(texts_to_encode, show_progress_bar=True)
+            # Embeddings normalisés : la similarité cosinus se réduit à un produit scalaire
+            new_embeddings = self.model.encode(texts_to_encode, batch_size=64, show_progress_bar=True,
+                                               convert_to_numpy=True, normalize_embeddings=True)
             
-            # Insérer les nouveaux embeddings et les mettre en cache
-            for j, embedding in enumerate(new_embeddings):
-                original_idx = cache_indices[j]
-                embeddings[original_idx] = embedding
-                self._cache_embedding(texts_to_encode[j], embedding)
+            # Insérer les nouveaux embeddings, puis les mettre en cache en un seul lot
+            for i, key in enumerate(keys):
+                if embeddings[i] is None:
+                    embeddings[i] = new_embeddings[new_keys[key]]
+            self._cache_embeddings(list(new_keys), np.asarray(new_embeddings))
         
-        return np.array(embeddings)
+        return np.array(embeddings, dtype=np.float32)
     
     def analyze_semantic_coherence(self, anchors: List[str], page_contents: List[str]) -> List[float]:
         """Analyser la cohérence sémantique entre ancres et contenus de pages"""
@@ -143,16 +310,13 @@ class CamemBERTSemanticAnalyzer:
         if anchor_embeddings.size == 0 or content_embeddings.size == 0:
             return [0.0] * len(anchors)
         
-        # Calculer la similarité cosinus
-        similarities = []
-        for i in range(len(anchors)):
-            if i < len(content_embeddings):
-                sim = cosine_similarity([anchor_embeddings[i]], [content_embeddings[i]])[0][0]
-                similarities.append(float(sim))
-            else:
-                similarities.append(0.0)
+        # Similarité cosinus de chaque paire (ancre i, contenu i) en un seul calcul vectorisé :
+        # les embeddings étant normalisés (ou nuls pour les textes trop courts), c'est un produit scalaire
+        n = min(len(anchor_embeddings), len(content_embeddings))
+        similarities = np.zeros(len(anchors))
+        similarities[:n] = np.einsum('ij,ij->i', anchor_embeddings[:n], content_embeddings[:n])
         
-        return similarities
+        return similarities.tolist()
     
     def cluster_semantic_themes(self, anchor_texts: List[str], min_cluster_size: int = 3) -> Dict[str, List[str]]:
         """Clustering sémantique des ancres par thèmes"""
@@ -183,9 +347,14 @@ class CamemBERTSemanticAnalyzer:
         if embeddings.size == 0:
             return {}
         
+        # Seul scikit-learn est nécessaire ici (pas torch, avec le serveur d'embeddings)
+        from sklearn.cluster import DBSCAN
+        
         # Clustering DBSCAN avec paramètres ajustés pour éviter un seul gros cluster
         # eps plus petit = clusters plus stricts
-        clustering = DBSCAN(eps=0.2, min_samples=min_cluster_size, metric='cosine')
+        # Embeddings normalisés : une distance cosinus d correspond à une distance euclidienne sqrt(2d),
+        # ce qui permet à DBSCAN d'utiliser un index spatial plutôt que toutes les distances deux à deux
+        clustering = DBSCAN(eps=np.sqrt(2 * 0.2), min_samples=min_cluster_size, metric='euclidean')
         cluster_labels = clustering.fit_predict(embeddings)
         
         # Si un seul cluster contient >50% des données, essayer avec eps plus petit
@@ -194,35 +363,30 @@ class CamemBERTSemanticAnalyzer:
             max_cluster_size = counts[unique_labels != -1][0] if len(counts[unique_labels != -1]) > 0 else 0
             if max_cluster_size > len(filtered_anchors) * 0.5:
                 print("   🔄 Cluster trop large, affinement avec eps=0.15...")
-                clustering = DBSCAN(eps=0.15, min_samples=max(2, min_cluster_size-1), metric='cosine')
+                clustering = DBSCAN(eps=np.sqrt(2 * 0.15), min_samples=max(2, min_cluster_size-1), metric='euclidean')
                 cluster_labels = clustering.fit_predict(embeddings)
         
-        # Grouper par clusters
+        # Grouper par clusters (indices des ancres)
         clusters = defaultdict(list)
-        for anchor, label in zip(filtered_anchors, cluster_labels):
+        for i, label in enumerate(cluster_labels):
             if label != -1:  # Ignorer le bruit (-1)
-                clusters[f"Thème {int(label) + 1}"].append(anchor)
-        
-        # Nommer les clusters intelligemment avec stop words français
-        french_stop_words = {
-            'dans', 'avec', 'pour', 'sur', 'sous', 'vers', 'chez', 'sans', 'contre',
-            'depuis', 'pendant', 'avant', 'après', 'entre', 'parmi', 'selon',
-            'notre', 'votre', 'leur', 'cette', 'ces', 'tous', 'toutes',
-            'plus', 'moins', 'très', 'bien', 'encore', 'aussi', 'donc'
-        }
+                clusters[f"Thème {int(label) + 1}"].append(i)
+        
+        # Mots significatifs de chaque ancre (hors stop words français), calculés une seule fois
+        anchor_words = [[w for w in anchor.lower().split() if len(w) > 3 and w not in FRENCH_STOP_WORDS]
+                        for anchor in filtered_anchors]
         
+        # Nommer les clusters intelligemment
         named_clusters = {}
-        for cluster_id, anchors in clusters.items():
-            if len(anchors) >= min_cluster_size:
-                # Trouver les mots les plus fréquents (hors stop words)
-                all_words = []
-                for anchor in anchors:
-                    words = anchor.lower().split()
-                    meaningful_words = [w for w in words if len(w) > 3 and w not in french_stop_words]
-                    all_words.extend(meaningful_words)
+        for cluster_id, indices in clusters.items():
+            if len(indices) >= min_cluster_size:
+                anchors = [filtered_anchors[i] for i in indices]
+                # Trouver les mots les plus fréquents
+                word_freq = Counter()
+                for i in indices:
+                    word_freq.update(anchor_words[i])
                 
-                if all_words:
-                    word_freq = Counter(all_words)
+                if word_freq:
                     # Prendre les 2-3 mots les plus fréquents
                     top_words = [word for word, count in word_freq.most_common(3) if count >= 2]
                     if len(top_words) >= 2:
@@ -252,49 +416,166 @@ class CamemBERTSemanticAnalyzer:
         if embeddings.size == 0:
             return []
         
-        # Calculer la matrice de similarité
-        similarity_matrix = cosine_similarity(embeddings)
+        if len(urls) > DENSE_SIMILARITY_MAX_PAGES:
+            return self._mine_similar_pairs(urls, embeddings, threshold)
         
-        # Trouver les paires similaires
-        opportunities = []
-        for i in range(len(urls)):
-            for j in range(i + 1, len(urls)):
-                similarity = similarity_matrix[i][j]
-                if similarity > threshold:
-                    opportunities.append((urls[i], urls[j], float(similarity)))
+        # Matrice de similarité cosinus : produit scalaire des embeddings normalisés
+        similarity_matrix = embeddings @ embeddings.T
         
-        # Trier par similarité décroissante
-        opportunities.sort(key=lambda x: x[2], reverse=True)
+        # Paires similaires (i < j) : triangle supérieur strict au-delà du seuil, dans l'ordre de parcours
+        i_idx, j_idx = np.nonzero(np.triu(similarity_matrix > threshold, k=1))
+        sims = similarity_matrix[i_idx, j_idx]
         
-        return opportunities[:20]  # Top 20 opportunités
+        # Top 20 opportunités par similarité décroissante : présélection par partition,
+        # puis tri stable (à égalité, l'ordre de parcours est conservé)
+        top = np.arange(len(sims))
+        if len(sims) > 20:
+            top = np.nonzero(sims >= np.partition(sims, -20)[-20])[0]
+        top = top[np.argsort(-sims[top], kind='stable')][:20]
+        
+        return [(urls[i_idx[k]], urls[j_idx[k]], float(sims[k])) for k in top]
+    
+    def _mine_similar_pairs(self, urls: List[str], embeddings: np.ndarray,
+                            threshold: float) -> List[Tuple[str, str, float]]:
+        """Top 20 des paires similaires par blocs (sur GPU si disponible), sans matrice N×N complète"""
+        _import_ml_dependencies()
+        pairs = st_util.paraphrase_mining_embeddings(
+            torch.from_numpy(np.asarray(embeddings, dtype=np.float32)).to(self.device),
+            query_chunk_size=1000, corpus_chunk_size=10000,
+            max_pairs=100, top_k=20, score_function=st_util.dot_score
+        )
+        return [(urls[i], urls[j], float(score)) for score, i, j in pairs if score > threshold][:20]
     
     def get_cache_stats(self) -> Dict[str, int]:
         """Obtenir les statistiques du cache"""
         if not os.path.exists(self.cache_dir):
             return {"files": 0, "size_mb": 0}
         
-        files = [f for f in os.listdir(self.cache_dir) if f.endswith('.pkl')]
-        total_size = sum(os.path.getsize(os.path.join(self.cache_dir, f)) for f in files)
+        # os.scandir fournit le nom et la taille sans appel stat supplémentaire par fichier
+        with os.scandir(self.cache_dir) as it:
+            sizes = {e.name: e.stat().st_size for e in it if e.name in (CACHE_EMBEDDINGS_FILE, CACHE_INDEX_FILE)}
+        total_size = sum(sizes.values())
+        entries = len(self._cache_index) if self._cache_index is not None else 0
+        if self._cache_index is None and CACHE_INDEX_FILE in sizes:
+            try:
+                entries = len(self._read_cache_index_file().get("rows", {}))
+            except (OSError, ValueError, AttributeError):
+                entries = 0
         
         return {
-            "files": len(files),
+            "files": entries,
             "size_mb": round(total_size / (1024 * 1024), 2)
         }
     
     def clear_cache(self):
         """Vider le cache"""
         if os.path.exists(self.cache_dir):
-            for file in os.listdir(self.cache_dir):
-                if file.endswith('.pkl'):
-                    os.remove(os.path.join(self.cache_dir, file))
+            with os.scandir(self.cache_dir) as it:
+                for entry in it:
+                    # Anciens formats (un fichier pickle par texte, matrice float32) compris
+                    if (entry.name.endswith('.pkl') or entry.name in LEGACY_CACHE_FILES
+                            or entry.name in (CACHE_EMBEDDINGS_FILE, CACHE_INDEX_FILE)):
+                        os.remove(entry.path)
+            self._cache_index = None
+            self._cache_matrix = None
             print("🧹 Cache vidé")
 
+def semantic_server_request(request: Dict, timeout: float = SEMANTIC_SERVER_REQUEST_TIMEOUT) -> Tuple[Dict, bytes]:
+    """Envoyer une requête au serveur d'embeddings : (réponse JSON, données binaires éventuelles)
+    
+    socket.timeout (sous-classe d'OSError) est levée si le serveur ne répond pas dans le délai
+    """
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        sock.settimeout(timeout)
+        sock.connect(SEMANTIC_SERVER_SOCKET)
+        sock.sendall(json.dumps(request).encode('utf-8') + b'\n')
+        with sock.makefile('rb') as f:
+            header = json.loads(f.readline())
+            payload = f.read(header.get("nbytes", 0))
+    return header, payload
+
+class RemoteSemanticAnalyzer(CamemBERTSemanticAnalyzer):
+    """Analyseur dont les embeddings et le cache sont ceux du serveur d'embeddings"""
+    
+    def __init__(self):
+        # Ni modèle ni cache local : tout passe par le serveur
+        self.model = None
+        self.device = 'cpu'
+        self.current_model_name = "serveur d'embeddings"
+        self._local_analyzer = None
+    
+    def _load_model(self):
+        return True
+    
+    def _fallback(self) -> CamemBERTSemanticAnalyzer:
+        """Analyseur local, si le serveur s'est arrêté entre-temps"""
+        if self._local_analyzer is None:
+            print("⚠️  Serveur d'embeddings injoignable, chargement local du modèle")
+            self._local_analyzer = CamemBERTSemanticAnalyzer()
+        return self._local_analyzer
+    
+    def encode_with_cache(self, texts: List[str]) -> np.ndarray:
+        """Encoder des textes via le serveur (qui gère le cache)"""
+        try:
+            header, payload = semantic_server_request({"op": "encode", "texts": list(texts)})
+        except (OSError, ValueError):
+            return self._fallback().encode_with_cache(texts)
+        if "error" in header:
+            return np.array([])
+        return np.frombuffer(payload, dtype=np.float32).reshape(header["shape"])
+    
+    def get_cache_stats(self) -> Dict[str, int]:
+        try:
+            return semantic_server_request({"op": "stats"})[0]
+        except (OSError, ValueError):
+            return self._fallback().get_cache_stats()
+    
+    def clear_cache(self):
+        try:
+            semantic_server_request({"op": "clear"})
+            print("🧹 Cache vidé")
+        except (OSError, ValueError):
+            self._fallback().clear_cache()
+
+def _ping_semantic_server() -> bool:
+    """Vérifier qu'un serveur d'embeddings répond"""
+    try:
+        return semantic_server_request({"op": "ping"}, timeout=SEMANTIC_SERVER_PING_TIMEOUT)[0].get("ok", False)
+    except (OSError, ValueError):
+        return False
+
+def _connect_semantic_server() -> Optional[RemoteSemanticAnalyzer]:
+    """Se connecter au serveur d'embeddings, en le démarrant au besoin (None si indisponible)"""
+    # Simple présence du module : inutile d'importer torch dans ce processus si le serveur répond
+    if (importlib.util.find_spec('sentence_transformers') is None or not hasattr(socket, 'AF_UNIX')
+            or os.getenv('AUDIT_SEMANTIC_SERVER', '1') == '0'):
+        return None
+    if _ping_semantic_server():
+        print("⚡ Serveur d'embeddings actif : modèle déjà chargé")
+        return RemoteSemanticAnalyzer()
+    
+    print("🚀 Démarrage du serveur d'embeddings (le modèle restera chargé pour les prochaines exécutions)...")
+    process = subprocess.Popen([sys.executable, SEMANTIC_SERVER_SCRIPT],
+                               stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, start_new_session=True)
+    deadline = time.time() + SEMANTIC_SERVER_START_TIMEOUT
+    while time.time() < deadline and process.poll() is None:
+        time.sleep(0.5)
+        if _ping_semantic_server():
+            return RemoteSemanticAnalyzer()
+    
+    # Serveur toujours muet : l'arrêter pour ne pas charger le modèle deux fois
+    if process.poll() is None:
+        process.kill()
+        process.wait()
+    print("⚠️  Serveur d'embeddings indisponible, chargement local du modèle")
+    return None
+
 # Instance globale pour éviter de recharger le modèle
 _semantic_analyzer = None
 
 def get_semantic_analyzer() -> CamemBERTSemanticAnalyzer:
-    """Obtenir l'instance singleton de l'analyseur sémantique"""
+    """Obtenir l'instance singleton de l'analyseur sémantique (via le serveur d'embeddings si possible)"""
     global _semantic_analyzer
     if _semantic_analyzer is None:
-        _semantic_analyzer = CamemBERTSemanticAnalyzer()
+        _semantic_analyzer = _connect_semantic_server() or CamemBERTSemanticAnalyzer()
     return _semantic_analyzer
\ No newline at end of file
@@ -6,26 +6,336 @@ Propose soit un nouveau crawl soit l'analyse de CSV existants
 """
 
 import subprocess
+import shutil
 import csv
 import re
 import os
 import json
 import time
+import codecs
+import gzip
+import heapq
+import bisect
+import mmap
+import importlib.util
+import atexit
 from datetime import datetime
-from collections import Counter
+from array import array
+from collections import Counter, defaultdict
+from functools import lru_cache
+from itertools import chain, cycle, islice
+from html import escape
 
-# Import de l'analyseur sémantique
+# Import optionnel d'orjson pour sérialiser les données du graphique de réseau
 try:
-    from ext_analyseur_semantique import get_semantic_analyzer
-    SEMANTIC_ANALYSIS_AVAILABLE = True
+    import orjson
+    ORJSON_AVAILABLE = True
 except ImportError:
-    SEMANTIC_ANALYSIS_AVAILABLE = False
+    ORJSON_AVAILABLE = False
+
+# Import optionnel de NumPy pour les calculs sur le graphe de maillage
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Import optionnel de pyahocorasick pour rechercher les sélecteurs mécaniques en une passe
+try:
+    import ahocorasick
+    AHOCORASICK_AVAILABLE = True
+except ImportError:
+    AHOCORASICK_AVAILABLE = False
+
+# Import optionnel de readline (absent sous Windows) pour l'historique des saisies du menu
+try:
+    import readline
+    READLINE_AVAILABLE = True
+except ImportError:
+    READLINE_AVAILABLE = False
+
+# Analyseur sémantique : importé seulement au moment de l'analyse avancée, car il charge
+# sentence-transformers et scikit-learn (plusieurs secondes au démarrage)
+SEMANTIC_ANALYSIS_AVAILABLE = NUMPY_AVAILABLE and importlib.util.find_spec('ext_analyseur_semantique') is not None
 from urllib.parse import urlparse
 import glob
 
+# Séparateurs de mots pour la détection des pages de conversion (URL + titre)
+_CONVERSION_WORD_SPLIT_RE = re.compile(r'[\W_]+')
+
+# Menu principal (affiché à chaque retour au menu)
+MAIN_MENU_TEXT = "\n".join([
+    "🔗 AUDIT DE MAILLAGE INTERNE",
+    "="*50,
+    "Choisissez une option :",
+    "",
+    "1. 🕷️  Nouveau crawl Screaming Frog + Analyse",
+    "2. 📊 Analyser un CSV existant",
+    "3. 📁 Lister les CSV disponibles",
+    "4. ⚙️  Configuration",
+    "5. ❌ Quitter",
+    "",
+])
+
+# Colonnes des exports de liens gardées en mémoire : seules celles dont le nom contient un de
+# ces termes sont lues par l'analyse (source, destination, ancre, origine, chemin, type de lien)
+LINK_COLUMN_TERMS = ('source', 'dest', 'target', 'url', 'anchor', 'ancrage', 'text',
+                     'origin', 'origine', 'type', 'link', 'xpath', 'chemin', 'path')
+
+# Historique des saisies du menu interactif (URLs, filtres)
+INPUT_HISTORY_FILE = '~/.audit_maillage_history'
+
+# Encodages essayés, dans l'ordre, pour lire les exports Screaming Frog
+CSV_ENCODINGS = ('utf-8', 'latin-1', 'cp1252', 'iso-8859-1')
+
+# Section du graphique de réseau : seules les données JSON sont insérées entre ces deux blocs,
+# le code D3 est dans ext_graphique_reseau.js (copié à côté des rapports)
+NETWORK_SECTION_HTML = """
+            <div class="section">
+                <h2>Graphique du maillage interne</h2>
+                <p>Visualisation interactive des liens éditoriaux entre les pages. La taille des nœuds correspond au nombre de liens entrants.</p>
+                
+                <div class="network-controls">
+                    <button onclick="resetZoom()" class="active">Réinitialiser vue</button>
+                    <button onclick="toggleLabels()">Basculer libellés</button>
+                    <button onclick="highlightOrphans()">Surligner orphelines</button>
+                </div>
+                
+                <div id="network-graph"></div>
+                
+                <p style="margin-top: 15px; color: #6c757d; font-size: 0.9em;">
+                    <strong>Légende :</strong> 
+                    Taille = liens entrants | 
+                    Vert = bien connecté | 
+                    Jaune = moyennement connecté | 
+                    Rouge = peu connecté
+                </p>
+            </div>
+            
+            <script>
+            // Données du réseau
+            const networkData = """
+
+NETWORK_SECTION_SCRIPT = """;
+            </script>
+            <script src="ext_graphique_reseau.js"></script>
+            """
+
+NETWORK_SCRIPT_FILE = 'ext_graphique_reseau.js'
+
+# Feuille de style partagée par les rapports (copiée dans le dossier d'export)
+REPORT_STYLESHEET_FILE = 'ext_rapport_audit.css'
+
+# Blocs répétés de la section des pages de conversion : une carte par catégorie,
+# puis les recommandations (fixes)
+CONVERSION_CARD_HTML = """
+                    <div class="chart">
+                        <h4>{title}</h4>
+                        <p><strong>{page_count} pages</strong></p>
+                        <ul>
+                    """
+
+CONVERSION_RECOMMENDATIONS_HTML = """
+                    </div>
+                    
+                    <div class="recommendations">
+                        <h4>Recommandations pour les pages de conversion</h4>
+                        <ul>
+                            <li><strong>Maillage entrant renforcé</strong> : Ces pages doivent recevoir plus de liens éditoriaux</li>
+                            <li><strong>Ancres contextuelles</strong> : Utilisez des ancres qui expliquent la valeur ajoutée</li>
+                            <li><strong>Position stratégique</strong> : Placez les liens dans le contenu, pas seulement en navigation</li>
+                            <li><strong>Pages de contenu vers conversion</strong> : Liez depuis vos articles vers ces pages</li>
+                        </ul>
+                    </div>
+                </div>
+                """
+
+# Paliers de couleur (rouge, orange, vert), indexés par bisect sur les seuils
+SCORE_BAND_COLORS = ('#dc3545', '#ffc107', '#28a745')
+QUALITY_SCORE_THRESHOLDS = (60, 80)
+QUALITY_SCORE_LABELS = ('Qualité à améliorer', 'Qualité moyenne', 'Excellente qualité')
+SIMILARITY_THRESHOLDS = (0.6, 0.8)
+
+# Stop words français étendus
+_FRENCH_STOP_WORDS = {
+    'le', 'de', 'et', 'à', 'un', 'il', 'être', 'en', 'avoir', 'que', 'pour', 'dans',
+    'ce', 'son', 'une', 'sur', 'avec', 'ne', 'se', 'pas', 'tout', 'plus', 'par',
+    'grand', 'je', 'qui', 'du', 'elle', 'au', 'nous', 'vous', 'ils', 'elles', 'leur',
+    'leurs', 'cette', 'ces', 'ses', 'nos', 'vos', 'très', 'bien', 'encore', 'toujours',
+    'déjà', 'aussi', 'puis', 'donc', 'ainsi', 'alors', 'après', 'avant', 'depuis',
+    'pendant', 'comme', 'quand', 'comment', 'pourquoi', 'où', 'dont', 'laquelle',
+    'lequel', 'lesquels', 'desquels', 'auquel', 'auxquels', 'duquel', 'desquelles',
+    'auxquelles', 'celle', 'celui', 'ceux', 'celles', 'tous', 'toute', 'toutes',
+    'autre', 'autres', 'même', 'mêmes', 'tel', 'telle', 'tels', 'telles', 'quel',
+    'quelle', 'quels', 'quelles', 'voir', 'savoir', 'faire', 'dire', 'aller', 'venir',
+    'pouvoir', 'vouloir', 'devoir', 'falloir', 'prendre', 'donner', 'mettre', 'porter',
+    'tenir', 'partir', 'sortir', 'entrer', 'monter', 'descendre', 'passer', 'rester',
+    'devenir', 'sembler', 'paraître', 'apparaître', 'disparaître', 'arriver', 'naître',
+    'mourir', 'vivre', 'exister', 'ici', 'là', 'ailleurs', 'partout', 'nulle', 'part',
+    'quelque', 'jamais', 'souvent', 'parfois', 'quelquefois', 'rarement', 'peu',
+    'beaucoup', 'trop', 'assez', 'tant', 'autant', 'si', 'moins', 'davantage', 'plutôt',
+    'surtout', 'notamment', 'seulement', 'uniquement', 'vraiment', 'certainement',
+    'probablement', 'peut', 'sans', 'doute', 'évidemment', 'naturellement',
+    'heureusement', 'malheureusement', 'découvrir', 'découvrez', 'lire', 'consulter',
+    'cliquer', 'accéder', 'suivre', 'notre', 'votre'
+}
+
+# Mots génériques supplémentaires à filtrer (ceux déjà présents ci-dessus ne sont pas répétés)
+_GENERIC_ANCHOR_WORDS = {
+    'page', 'site', 'web', 'internet', 'online', 'cliquez', 'suivant', 'précédent',
+    'retour', 'accueil', 'home', 'menu', 'navigation', 'lien', 'liens', 'article',
+    'articles', 'actualité', 'actualités', 'news', 'blog', 'post'
+}
+
+# Mots ignorés par l'analyse thématique des ancres (ensemble figé, construit une seule fois)
+THEMATIC_STOP_WORDS = frozenset(_FRENCH_STOP_WORDS | _GENERIC_ANCHOR_WORDS)
+
+# Mots d'au moins 3 caractères d'une ancre (la ponctuation sépare les mots)
+_ANCHOR_WORD_RE = re.compile(r'\w{3,}')
+
+# Origines Screaming Frog (en minuscules) des liens de navigation
+NAVIGATION_ORIGINS = frozenset(('navigation', 'en-tête', 'pied de page', 'header', 'footer', 'nav', 'menu'))
+
+# Extraction rapide du chemin d'une URL http(s) : (domaine, chemin)
+_URL_PATH_RE = re.compile(r'https?://([^/?#]*)([^?#]*)')
+
+def url_path(url):
+    """Chemin d'une URL, équivalent rapide de urlparse(url).path
+    
+    Les cas que la regex ne couvre pas à l'identique (paramètres ';', IPv6,
+    caractères de contrôle, autres schémas) passent par urlparse.
+    """
+    match = _URL_PATH_RE.match(url)
+    if match:
+        netloc, path = match.groups()
+        # Tests d'appartenance déroulés : bien plus rapides qu'un any() sur un générateur
+        if ('[' not in netloc and ']' not in netloc
+                and ';' not in path and '\t' not in path and '\r' not in path and '\n' not in path):
+            return path
+    return urlparse(url).path
+
+def url_netloc(url):
+    """Domaine d'une URL, équivalent rapide de urlparse(url).netloc (mêmes cas de repli que url_path)"""
+    match = _URL_PATH_RE.match(url)
+    if match:
+        netloc = match.group(1)
+        if '[' not in netloc and ']' not in netloc and '\t' not in netloc and '\r' not in netloc and '\n' not in netloc:
+            return netloc
+    return urlparse(url).netloc
+
+def count_csv_lines(csv_path):
+    """Compte les lignes d'un fichier sans le décoder (mmap + recherche native des sauts de ligne)
+    
+    Les sauts de ligne à l'intérieur de champs entre guillemets sont comptés :
+    le résultat est une estimation haute du nombre d'enregistrements.
+    """
+    with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # mmap n'a pas de méthode count : comptage par tranches (mémoire bornée à une tranche)
+        chunk_size = 16 * 1024 * 1024
+        line_count = sum(mm[start:start + chunk_size].count(b'\n')
+                         for start in range(0, len(mm), chunk_size))
+        if len(mm) and mm[-1:] != b'\n':
+            line_count += 1  # Dernière ligne sans saut de ligne final
+        return line_count
+
+def remove_file_if_exists(path):
+    """Supprime path s'il existe (None ou fichier déjà absent : rien à faire)
+
+    Un seul appel système : pas de os.path.exists préalable.
+    """
+    if path:
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+@lru_cache(maxsize=32)
+def resolve_columns(fields_key, roles_key):
+    """Associe chaque rôle (url, titre...) à une colonne du CSV, avec cache par schéma
+    
+    fields_key : tuple des noms de colonnes
+    roles_key : tuple de (rôle, termes) ; le premier rôle dont un terme apparaît
+    dans le nom de colonne l'emporte, et la dernière colonne trouvée est retenue.
+    Le dictionnaire retourné est partagé par le cache : ne pas le modifier.
+    """
+    columns = {}
+    for col in fields_key:
+        col_lower = col.lower()
+        for role, terms in roles_key:
+            if any(term in col_lower for term in terms):
+                columns[role] = col
+                break
+    return columns
+
+@lru_cache(maxsize=16)
+def substring_matcher(needles):
+    """Construit le test « une des chaînes de needles apparaît dans le texte », avec cache
+
+    needles : frozenset des chaînes cherchées. Avec pyahocorasick, elles sont toutes
+    trouvées en un seul parcours du texte au lieu d'un parcours par chaîne.
+    """
+    if '' in needles:
+        return lambda text: True  # Une chaîne vide est contenue dans tout texte
+    if not AHOCORASICK_AVAILABLE:
+        return lambda text: any(needle in text for needle in needles)
+
+    automaton = ahocorasick.Automaton()
+    for needle in needles:
+        automaton.add_word(needle, needle)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+@lru_cache(maxsize=8)
+def selector_matcher(selectors):
+    """Construit le test « un sélecteur CSS apparaît dans le XPath », avec cache par configuration
+
+    selectors : tuple des sélecteurs ; chacun est cherché tel quel et sans ses points.
+    """
+    return substring_matcher(frozenset(
+        variant for selector in selectors for variant in (selector.replace('.', ''), selector)
+    ))
+
+def escape_html_data(value):
+    """Copie de value (dict, liste, tuple) dont toutes les chaînes sont échappées pour le HTML.
+
+    Les rapports n'insèrent ces données que dans du texte (jamais dans un attribut) :
+    les guillemets sont donc laissés tels quels.
+    """
+    if isinstance(value, str):
+        return escape(value, quote=False)
+    if isinstance(value, dict):
+        return {escape_html_data(k): escape_html_data(v) for k, v in value.items()}
+    if isinstance(value, (list, tuple)):
+        return type(value)(escape_html_data(v) for v in value)
+    return value
+
+def shorten_html(text, limit):
+    """text tronqué à limit caractères (suivi de « ... ») puis échappé : la coupe ne peut
+    pas tomber au milieu d'une entité HTML et la longueur est celle du texte affiché"""
+    return escape(text[:limit], quote=False) + ('...' if len(text) > limit else '')
+
+
 class CompleteLinkAuditor:
+    # Patterns de conversion (l'ordre des catégories définit leur priorité)
+    CONVERSION_PATTERNS = {
+        'contact': ['contact', 'nous-contacter', 'contactez', 'get-in-touch'],
+        'achat': ['achat', 'acheter', 'buy', 'purchase', 'commande', 'commander', 'order'],
+        'inscription': ['inscription', 'register', 'signup', 'sign-up', 's-inscrire'],
+        'devis': ['devis', 'quote', 'estimation', 'demande', 'request'],
+        'panier': ['panier', 'cart', 'basket', 'checkout'],
+        'pricing': ['prix', 'pricing', 'tarifs', 'rates', 'cost'],
+        'demo': ['demo', 'demonstration', 'essai', 'trial', 'test']
+    }
+    # Ensembles de patterns par catégorie, comparés aux mots (et suites de mots) du texte
+    CONVERSION_PATTERN_SETS = {category: frozenset(patterns) for category, patterns in CONVERSION_PATTERNS.items()}
+    # Nombre maximal de mots d'un pattern composé (ex. 'get-in-touch')
+    CONVERSION_MAX_WORDS = max(pattern.count('-') + 1 for patterns in CONVERSION_PATTERNS.values() for pattern in patterns)
+
     def __init__(self, config_file='ext_configuration_audit.json'):
         self.config = self.load_config(config_file)
+        self._csv_cache = None  # Liste des CSV, invalidée quand un des dossiers scannés change
+        self._csv_cache_key = None
+        self._config_banner = None  # Texte de show_config, construit au premier affichage
         
     def load_config(self, config_file):
         """Charge la configuration"""
@@ -58,7 +368,7 @@ class CompleteLinkAuditor:
                     with open('/proc/version', 'r') as f:
                         if 'microsoft' in f.read().lower():
                             is_wsl = True
-            except:
+            except Exception:
                 pass
 
             if is_wsl:
@@ -95,56 +405,62 @@ class CompleteLinkAuditor:
 
     def show_menu(self):
         """Affiche le menu principal"""
-        print("🔗 AUDIT DE MAILLAGE INTERNE")
-        print("="*50)
-        print("Choisissez une option :")
-        print()
-        print("1. 🕷️  Nouveau crawl Screaming Frog + Analyse")
-        print("2. 📊 Analyser un CSV existant")
-        print("3. 📁 Lister les CSV disponibles")
-        print("4. ⚙️  Configuration")
-        print("5. ❌ Quitter")
-        print()
+        print(MAIN_MENU_TEXT)
         
         while True:
-            choice = input("Votre choix (1-5): ").strip()
+            choice = self._ask("Votre choix (1-5): ")
             if choice in ['1', '2', '3', '4', '5']:
                 return choice
             print("❌ Choix invalide, veuillez choisir entre 1 et 5")
 
     def list_existing_csvs(self):
         """Liste les CSV disponibles"""
-        csv_files = []
-        
-        # Chercher dans le dossier exports
-        if os.path.exists(self.config['export_path']):
-            csv_files.extend(glob.glob(f"{self.config['export_path']}*.csv"))
-        
-        # Chercher dans le répertoire courant
-        csv_files.extend(glob.glob("*.csv"))
-        
-        # Supprimer les doublons et trier par date de modification
-        csv_files = list(set(csv_files))
-        csv_files.sort(key=os.path.getmtime, reverse=True)
+        csv_entries = self._scan_csv_files()
         
-        if not csv_files:
+        if not csv_entries:
             print("📭 Aucun fichier CSV trouvé")
             return []
         
-        print(f"\n📁 Fichiers CSV disponibles ({len(csv_files)}):")
+        print(f"\n📁 Fichiers CSV disponibles ({len(csv_entries)}):")
         print("-" * 60)
         
-        for i, file_path in enumerate(csv_files, 1):
-            file_size = os.path.getsize(file_path)
-            file_date = datetime.fromtimestamp(os.path.getmtime(file_path))
+        for i, (file_path, file_size, file_mtime) in enumerate(csv_entries, 1):
+            file_date = datetime.fromtimestamp(file_mtime)
             print(f"{i:2d}. {os.path.basename(file_path)}")
             print(f"    📍 {file_path}")
             print(f"    📊 {file_size:,} octets | 📅 {file_date.strftime('%d/%m/%Y %H:%M')}")
             print()
         
-        return csv_files
+        return [file_path for file_path, _, _ in csv_entries]
 
-    def create_screaming_frog_config(self, user_agent=None, attempt_number=1):
+    def _scan_csv_files(self):
+        """(chemin, taille, date) des CSV du dossier d'export et du répertoire courant, du plus récent au plus ancien"""
+        # (dossier, préfixe des chemins affichés)
+        sources = [(self.config['export_path'], self.config['export_path']), ('.', '')]
+        
+        # La date de modification d'un dossier change dès qu'un fichier y est ajouté ou supprimé
+        cache_key = tuple(os.stat(directory).st_mtime_ns if os.path.isdir(directory) else None
+                          for directory, _ in sources)
+        if self._csv_cache is not None and cache_key == self._csv_cache_key:
+            return self._csv_cache
+        
+        # os.scandir fournit taille et date sans appel stat supplémentaire par fichier
+        csv_files = {}
+        for directory, prefix in sources:
+            if not os.path.isdir(directory):
+                continue
+            with os.scandir(directory) as entries:
+                for entry in entries:
+                    if entry.name.endswith('.csv') and not entry.name.startswith('.') and entry.is_file():
+                        file_stat = entry.stat()
+                        csv_files[prefix + entry.name] = (file_stat.st_size, file_stat.st_mtime)
+        
+        self._csv_cache = sorted(((path, size, mtime) for path, (size, mtime) in csv_files.items()),
+                                 key=lambda entry: entry[2], reverse=True)
+        self._csv_cache_key = cache_key
+        return self._csv_cache
+
+    def create_screaming_frog_config(self, user_agent=None, attempt_number=1, url_filter=None):
         """Crée un fichier de configuration temporaire pour Screaming Frog"""
         import tempfile
         import json as json_module
@@ -187,6 +503,13 @@ class CompleteLinkAuditor:
             }
         }
 
+        # Crawl limité à la section filtrée, sur option uniquement : les pages hors section ne sont
+        # plus crawlées, donc les liens entrants qu'elles font vers la section disparaissent du rapport
+        if url_filter and self.config.get('crawl_settings', {}).get('crawl_only_filtered_section', False):
+            config_data["spider"]["include"] = ["^" + re.escape(url_filter) + ".*"]
+            print(f"🎯 Crawl limité aux URLs commençant par: {url_filter}")
+            print("⚠️  Les liens entrants depuis les pages hors de cette section ne seront pas audités")
+
         # Créer un fichier temporaire pour la configuration
         temp_config = tempfile.NamedTemporaryFile(mode='w', delete=False, suffix='.json', prefix='sf_config_')
         try:
@@ -283,7 +606,7 @@ class CompleteLinkAuditor:
             print(f"\n🔄 Tentative {attempt}/{max_attempts}")
 
             # Créer une configuration temporaire avec user-agent personnalisé
-            config_file = self.create_screaming_frog_config(attempt_number=attempt)
+            config_file = self.create_screaming_frog_config(attempt_number=attempt, url_filter=url_filter)
             if not config_file:
                 continue
 
@@ -394,15 +717,13 @@ class CompleteLinkAuditor:
                         latest_file = max([f"{self.config['export_path']}{f}" for f in csv_files], key=lambda x: os.path.getctime(x))
                         print(f"📄 Fichier CSV des liens: {latest_file}")
                         # Nettoyer le fichier de config temporaire
-                        if config_file and os.path.exists(config_file):
-                            os.unlink(config_file)
+                        remove_file_if_exists(config_file)
                         return latest_file
                     else:
                         print("⚠️  Fichier CSV des liens non trouvé")
                         print("💡 Le crawl a peut-être échoué ou aucun lien trouvé")
                         # Nettoyer le fichier de config temporaire
-                        if config_file and os.path.exists(config_file):
-                            os.unlink(config_file)
+                        remove_file_if_exists(config_file)
                         return None
                 else:
                     print(f"❌ Erreur lors du crawl (code: {result.returncode})")
@@ -419,8 +740,7 @@ class CompleteLinkAuditor:
                     if attempt < max_attempts:
                         print(f"🔄 Tentative avec un autre User-Agent ({attempt + 1}/{max_attempts})")
                         # Nettoyer le fichier de config temporaire
-                        if config_file and os.path.exists(config_file):
-                            os.unlink(config_file)
+                        remove_file_if_exists(config_file)
                         continue  # Passer à la tentative suivante
                     else:
                         print("❌ Toutes les tentatives ont échoué")
@@ -450,8 +770,7 @@ class CompleteLinkAuditor:
                     print("⏰ Problème de connexion/timeout")
                     if attempt < max_attempts:
                         print(f"🔄 Nouvelle tentative avec délai plus long ({attempt + 1}/{max_attempts})")
-                        if config_file and os.path.exists(config_file):
-                            os.unlink(config_file)
+                        remove_file_if_exists(config_file)
                         time.sleep(5)  # Attendre un peu avant la nouvelle tentative
                         continue
                     else:
@@ -469,8 +788,7 @@ class CompleteLinkAuditor:
                     if attempt < max_attempts:
                         wait_time = attempt * 10  # Attendre de plus en plus longtemps
                         print(f"🔄 Attente de {wait_time}s avant la tentative {attempt + 1}/{max_attempts}")
-                        if config_file and os.path.exists(config_file):
-                            os.unlink(config_file)
+                        remove_file_if_exists(config_file)
                         time.sleep(wait_time)
                         continue
                     else:
@@ -479,8 +797,7 @@ class CompleteLinkAuditor:
                     print("🚫 Site bloquant activement les requêtes")
                     if attempt < max_attempts:
                         print(f"🔄 Tentative avec un User-Agent différent ({attempt + 1}/{max_attempts})")
-                        if config_file and os.path.exists(config_file):
-                            os.unlink(config_file)
+                        remove_file_if_exists(config_file)
                         continue
                     else:
                         print("💡 Le site bloque systématiquement les tentatives d'accès")
@@ -504,15 +821,13 @@ class CompleteLinkAuditor:
                             return latest_file
                 
                 # Nettoyer le fichier de config temporaire
-                if config_file and os.path.exists(config_file):
-                    os.unlink(config_file)
+                remove_file_if_exists(config_file)
 
             except subprocess.TimeoutExpired:
                 print("⏰ Crawl interrompu (timeout après 1h)")
                 print("💡 Le site est peut-être trop volumineux, essayez avec une limite de pages")
                 # Nettoyer le fichier de config temporaire
-                if config_file and os.path.exists(config_file):
-                    os.unlink(config_file)
+                remove_file_if_exists(config_file)
                 if attempt < max_attempts:
                     print(f"🔄 Nouvelle tentative avec timeout ({attempt + 1}/{max_attempts})")
                     continue
@@ -522,23 +837,20 @@ class CompleteLinkAuditor:
                 print(f"❌ Exécutable non trouvé: {sf_path}")
                 print("💡 Vérifiez l'installation et le chemin de Screaming Frog")
                 # Nettoyer le fichier de config temporaire
-                if config_file and os.path.exists(config_file):
-                    os.unlink(config_file)
+                remove_file_if_exists(config_file)
                 return None
 
             except Exception as e:
                 print(f"❌ Erreur inattendue lors de la tentative {attempt}: {e}")
                 # Nettoyer le fichier de config temporaire
-                if config_file and os.path.exists(config_file):
-                    os.unlink(config_file)
+                remove_file_if_exists(config_file)
                 if attempt < max_attempts:
                     print(f"🔄 Nouvelle tentative ({attempt + 1}/{max_attempts})")
                     continue
                 return None
 
             # Si on arrive ici avec succès, nettoyer le fichier de config et retourner
-            if config_file and os.path.exists(config_file):
-                os.unlink(config_file)
+            remove_file_if_exists(config_file)
             break  # Sortir de la boucle de retry en cas de succès
 
         # Si toutes les tentatives ont échoué
@@ -561,14 +873,17 @@ class CompleteLinkAuditor:
                 return None, None
             elif file_size > 100 * 1024 * 1024:  # 100MB
                 print(f"⚠️  Fichier volumineux ({file_size // 1024 // 1024}MB), le traitement peut être lent")
+                estimated_rows = max(count_csv_lines(csv_path) - 1, 0)  # Sans l'en-tête
+                print(f"   📏 Environ {estimated_rows:,} lignes de données")
+                if estimated_rows > 500000:
+                    print(f"   ⚠️  Seules les 500,000 premières lignes seront chargées")
         except OSError as e:
             print(f"❌ Erreur lors de la lecture du fichier: {e}")
             return None, None
         
-        encodings = ['utf-8', 'latin-1', 'cp1252', 'iso-8859-1']
         last_error = None
         
-        for encoding in encodings:
+        for encoding in CSV_ENCODINGS:
             try:
                 with open(csv_path, 'r', encoding=encoding, newline='') as f:
                     # Détecter le délimiteur avec une analyse plus robuste
@@ -579,30 +894,13 @@ class CompleteLinkAuditor:
                         print("❌ Le fichier CSV est vide ou ne contient que des espaces")
                         return None, None
                     
-                    # Détection intelligente du délimiteur
-                    delimiter = ','
-                    tab_count = sample.count('\t')
-                    comma_count = sample.count(',')
-                    semicolon_count = sample.count(';')
-                    
-                    if tab_count > comma_count and tab_count > semicolon_count:
-                        delimiter = '\t'
-                    elif semicolon_count > comma_count:
-                        delimiter = ';'
-                    
-                    reader = csv.DictReader(f, delimiter=delimiter)
+                    reader = csv.DictReader(f, delimiter=self.detect_csv_delimiter(sample))
                     
                     # Vérifier que nous avons des colonnes
                     if not reader.fieldnames:
                         continue
                     
-                    # Nettoyer les noms de colonnes (BOM, espaces)
-                    clean_fieldnames = []
-                    for field in reader.fieldnames:
-                        if field:
-                            clean_field = field.strip().strip('\ufeff"\'')
-                            clean_fieldnames.append(clean_field)
-                    
+                    clean_fieldnames = self.clean_csv_fieldnames(reader.fieldnames)
                     if not clean_fieldnames:
                         continue
                     
@@ -640,13 +938,109 @@ class CompleteLinkAuditor:
         print(f"❌ Impossible de charger le fichier CSV. Dernière erreur: {last_error}")
         return None, None
 
+    def detect_csv_delimiter(self, sample):
+        """Détecte le délimiteur (virgule, tabulation ou point-virgule) sur un extrait du fichier"""
+        tab_count = sample.count('\t')
+        comma_count = sample.count(',')
+        semicolon_count = sample.count(';')
+        
+        if tab_count > comma_count and tab_count > semicolon_count:
+            return '\t'
+        if semicolon_count > comma_count:
+            return ';'
+        return ','
+
+    def clean_csv_fieldnames(self, fieldnames):
+        """Nettoie les noms de colonnes (BOM, espaces, guillemets) et ignore les colonnes sans nom"""
+        return [field.strip().strip('\ufeff"\'') for field in fieldnames if field]
+
+    def detect_csv_encoding(self, csv_path):
+        """Premier encodage capable de décoder tout le fichier (décodage par blocs, sans créer de lignes)"""
+        for encoding in CSV_ENCODINGS:
+            decoder = codecs.getincrementaldecoder(encoding)()
+            try:
+                with open(csv_path, 'rb') as f:
+                    for block in iter(lambda: f.read(1 << 20), b''):
+                        decoder.decode(block)
+                    decoder.decode(b'', final=True)
+                return encoding
+            except UnicodeDecodeError:
+                continue
+        return None
+
+    def open_csv_stream(self, csv_path, column_terms=None):
+        """Ouvre un CSV pour une lecture ligne à ligne
+        
+        Renvoie (lignes, colonnes) où lignes est un générateur de dictionnaires aux noms de
+        colonnes nettoyés, ou (None, None) si le fichier est illisible. Contrairement à
+        load_csv_file, aucune ligne n'est gardée en mémoire par la lecture elle-même.
+        Avec column_terms, chaque ligne ne contient que les colonnes dont le nom (en
+        minuscules) contient l'un de ces termes ; colonnes renvoie toujours tout l'en-tête.
+        """
+        if not os.path.exists(csv_path):
+            print(f"❌ Fichier non trouvé: {csv_path}")
+            return None, None
+        
+        print(f"📁 Lecture de: {os.path.basename(csv_path)}")
+        
+        try:
+            file_size = os.path.getsize(csv_path)
+            if file_size == 0:
+                print("❌ Le fichier CSV est vide")
+                return None, None
+            elif file_size > 100 * 1024 * 1024:  # 100MB
+                print(f"⚠️  Fichier volumineux ({file_size // 1024 // 1024}MB), lu en flux")
+        except OSError as e:
+            print(f"❌ Erreur lors de la lecture du fichier: {e}")
+            return None, None
+        
+        # L'encodage est validé avant la lecture : une erreur de décodage ne peut pas
+        # survenir au milieu de l'analyse
+        encoding = self.detect_csv_encoding(csv_path)
+        if not encoding:
+            print("❌ Impossible de charger le fichier CSV: encodage non reconnu")
+            return None, None
+        
+        f = open(csv_path, 'r', encoding=encoding, newline='')
+        sample = f.read(2048)
+        f.seek(0)
+        
+        if not sample.strip():
+            f.close()
+            print("❌ Le fichier CSV est vide ou ne contient que des espaces")
+            return None, None
+        
+        reader = csv.DictReader(f, delimiter=self.detect_csv_delimiter(sample))
+        clean_fieldnames = self.clean_csv_fieldnames(reader.fieldnames or [])
+        if not clean_fieldnames:
+            f.close()
+            print("❌ Aucune colonne trouvée dans le fichier CSV")
+            return None, None
+        
+        print(f"✅ Fichier ouvert avec l'encodage {encoding}")
+        print(f"📋 Colonnes: {', '.join(clean_fieldnames[:5])}{'...' if len(clean_fieldnames) > 5 else ''}")
+        # (nom d'origine, nom nettoyé) des colonnes à garder dans chaque ligne
+        columns = list(zip(reader.fieldnames, clean_fieldnames))
+        if column_terms:
+            columns = [(old_key, new_key) for old_key, new_key in columns
+                       if any(term in new_key.lower() for term in column_terms)]
+        return self._stream_csv_rows(f, reader, columns), clean_fieldnames
+
+    def _stream_csv_rows(self, f, reader, columns):
+        """Générateur des lignes du CSV (colonnes retenues, noms nettoyés), ferme le fichier à la fin"""
+        try:
+            for row in reader:
+                yield {new_key: row.get(old_key, '') for old_key, new_key in columns}
+        finally:
+            f.close()
+
     def is_internal_link(self, source_url, dest_url):
         """Vérifie si le lien est interne"""
         try:
-            source_domain = urlparse(source_url).netloc
-            dest_domain = urlparse(dest_url).netloc
+            source_domain = url_netloc(source_url)
+            dest_domain = url_netloc(dest_url)
             return source_domain == dest_domain
-        except:
+        except Exception:
             return False
 
     def is_mechanical_link(self, row):
@@ -678,8 +1072,7 @@ class CompleteLinkAuditor:
         mechanical_selectors = self.config.get('mechanical_selectors', [])
         
         # 1. Liens de navigation détectés par Screaming Frog
-        navigation_origins = ['navigation', 'en-tête', 'pied de page', 'header', 'footer', 'nav', 'menu']
-        if any(x in origin for x in navigation_origins):
+        if substring_matcher(NAVIGATION_ORIGINS)(origin):
             return True
         
         # 2. Type de lien explicite (si disponible)
@@ -726,9 +1119,8 @@ class CompleteLinkAuditor:
         default_selectors = ['.menu', '.nav', '.header', '.footer', '.breadcrumb', '.pagination', '.sidebar']
         selectors_to_use = mechanical_selectors if mechanical_selectors else default_selectors
         
-        for selector in selectors_to_use:
-            if selector.replace('.', '') in xpath or selector in xpath:
-                return True
+        if selector_matcher(tuple(selectors_to_use))(xpath):
+            return True
         
         # 6. Ancres très courtes ou non descriptives
         if len(anchor.strip()) <= 2 and anchor.strip() not in ['tv', 'pc', 'seo', 'api', 'faq']:
@@ -742,20 +1134,39 @@ class CompleteLinkAuditor:
 
     def matches_url_filter(self, row, url_filter, column_mapping):
         """Vérifie si un lien correspond au filtre d'URL spécifié"""
+        return self.url_filter_predicate(url_filter, column_mapping)(row)
+
+    def url_filter_predicate(self, url_filter, column_mapping):
+        """Construit le test du filtre d'URL pour une boucle sur les liens
+        
+        Colonnes et préfixes sont résolus une seule fois ; url_filter accepte aussi un tuple
+        de préfixes, testés en un seul appel à str.startswith.
+        """
         source_col = column_mapping.get('source')
         dest_col = column_mapping.get('dest')
         
         if not source_col or not dest_col:
-            return True  # Si pas de colonnes, garder tout
+            return lambda row: True  # Si pas de colonnes, garder tout
         
-        source = row.get(source_col, '').strip()
-        dest = row.get(dest_col, '').strip()
+        prefixes = url_filter if isinstance(url_filter, tuple) else (url_filter,)
         
-        # Garder le lien si la source OU la destination correspondent au filtre
-        source_matches = source.startswith(url_filter) if source else False
-        dest_matches = dest.startswith(url_filter) if dest else False
+        def matches(row):
+            # Garder le lien si la source OU la destination correspondent au filtre
+            return ((row.get(source_col) or '').strip().startswith(prefixes)
+                    or (row.get(dest_col) or '').strip().startswith(prefixes))
         
-        return source_matches or dest_matches
+        return matches
+
+    def filter_rows_by_url_prefix(self, rows, fieldnames, url_filter, column_terms):
+        """Garde les lignes dont au moins une colonne d'URL commence par le filtre
+        
+        Les colonnes candidates sont résolues une seule fois (et non à chaque ligne).
+        url_filter accepte aussi un tuple de préfixes, comme str.startswith.
+        """
+        prefix_cols = [col for col in fieldnames if any(term in col.lower() for term in column_terms)]
+        return [row for row in rows if any(
+            (row.get(col) or '').startswith(url_filter) for col in prefix_cols
+        )]
 
     def analyze_csv(self, csv_path, website_url=None, url_filter=None):
         """Analyse un fichier CSV avec gestion d'erreur complète"""
@@ -763,16 +1174,22 @@ class CompleteLinkAuditor:
         print("="*50)
         
         try:
-            # Charger le CSV
-            rows, fieldnames = self.load_csv_file(csv_path)
-            if not rows:
+            # Lire le CSV en flux : seuls les liens internes retenus sont gardés en mémoire
+            rows, fieldnames = self.open_csv_stream(csv_path, LINK_COLUMN_TERMS)
+            if rows is None:
+                print("❌ Impossible de continuer sans données")
+                return None
+            
+            first_row = next(rows, None)
+            if first_row is None:
+                print("❌ Aucune donnée trouvée dans le fichier CSV")
                 print("❌ Impossible de continuer sans données")
                 return None
             
             # Détecter l'URL du site si pas fournie
-            if not website_url and rows:
+            if not website_url:
                 try:
-                    first_source = rows[0].get('Source', '') or rows[0].get('source', '') or rows[0].get('URL', '')
+                    first_source = first_row.get('Source', '') or first_row.get('source', '') or first_row.get('URL', '')
                     if first_source:
                         parsed = urlparse(first_source)
                         if parsed.scheme and parsed.netloc:
@@ -790,35 +1207,41 @@ class CompleteLinkAuditor:
             # Identifier les colonnes importantes AVANT le filtrage
             column_mapping = self.identify_columns(fieldnames)
             if not column_mapping['source'] or not column_mapping['dest']:
+                rows.close()
                 print("❌ Colonnes Source/Destination non trouvées")
                 print(f"📋 Colonnes disponibles: {', '.join(fieldnames)}")
                 return None
             
             if url_filter:
                 print(f"🎯 Filtrage activé: {url_filter}")
-                # Filtrer les lignes selon le préfixe d'URL
-                original_count = len(rows)
-                rows = [row for row in rows if self.matches_url_filter(row, url_filter, column_mapping)]
-                filtered_count = len(rows)
-                print(f"📊 Filtrage: {original_count:,} → {filtered_count:,} liens ({original_count-filtered_count:,} supprimés)")
-                
-                if filtered_count == 0:
-                    print("❌ Aucun lien ne correspond au filtre spécifié")
-                    return None
             
             print(f"📋 Colonnes utilisées:")
             print(f"  - Source: {column_mapping['source']}")
             print(f"  - Destination: {column_mapping['dest']}")
             print(f"  - Ancre: {column_mapping['anchor'] or 'Non trouvée'}")
             
-            # Analyser les liens
+            # Analyser les liens au fil de la lecture : les lignes hors filtre et les liens
+            # externes ne sont que comptés
             internal_links = []
-            external_links = []
+            read_count = 0
+            link_count = 0
+            external_count = 0
             mechanical_count = 0
             editorial_count = 0
             error_count = 0
             
-            for i, row in enumerate(rows):
+            row_matches_filter = self.url_filter_predicate(url_filter, column_mapping) if url_filter else None
+            for i, row in enumerate(chain((first_row,), rows)):
+                read_count += 1
+                if row_matches_filter and not row_matches_filter(row):
+                    continue
+                
+                if len(internal_links) >= 500000:  # Limite de sécurité
+                    print(f"⚠️  Limitation à 500,000 liens internes pour éviter les problèmes de mémoire")
+                    rows.close()
+                    break
+                
+                link_count += 1
                 try:
                     source = row.get(column_mapping['source'], '').strip()
                     destination = row.get(column_mapping['dest'], '').strip()
@@ -840,7 +1263,7 @@ class CompleteLinkAuditor:
                             editorial_count += 1
                             row['is_mechanical'] = False
                     else:
-                        external_links.append(row)
+                        external_count += 1
                         
                 except Exception as e:
                     error_count += 1
@@ -850,10 +1273,18 @@ class CompleteLinkAuditor:
             if error_count > 5:
                 print(f"⚠️  ... et {error_count - 5} autres erreurs ignorées")
             
+            print(f"✅ {read_count:,} lignes lues")
+            if url_filter:
+                print(f"📊 Filtrage: {read_count:,} → {link_count:,} liens ({read_count-link_count:,} supprimés)")
+                
+                if link_count == 0:
+                    print("❌ Aucun lien ne correspond au filtre spécifié")
+                    return None
+            
             print(f"\n📊 Résultats:")
-            print(f"  📈 Liens totaux: {len(rows):,}")
+            print(f"  📈 Liens totaux: {link_count:,}")
             print(f"  🏠 Liens internes: {len(internal_links):,}")
-            print(f"  🌍 Liens externes: {len(external_links):,}")
+            print(f"  🌍 Liens externes: {external_count:,}")
             print(f"  🔧 Liens mécaniques: {mechanical_count:,}")
             print(f"  ✍️  Liens éditoriaux: {editorial_count:,}")
             
@@ -921,7 +1352,11 @@ class CompleteLinkAuditor:
             
             print(f"🚫 Pages orphelines: {len(analysis['orphan_pages'])}")
             
-            # Option pour ouvrir automatiquement
+            # Option pour ouvrir automatiquement (un rapport compressé doit d'abord être décompressé)
+            if report_file.endswith('.gz'):
+                print(f"💡 Rapport compressé : décompressez-le (gunzip) avant de l'ouvrir")
+                return report_file
+            
             try:
                 import webbrowser
                 print(f"\n💡 Ouverture automatique du rapport...")
@@ -1104,44 +1539,6 @@ class CompleteLinkAuditor:
     def analyze_thematic_distribution(self, editorial_links, anchor_col, dest_col):
         """Analyse la distribution thématique des liens avec NLP avancé"""
         
-        # Stop words français étendus
-        french_stop_words = {
-            'le', 'de', 'et', 'à', 'un', 'il', 'être', 'et', 'en', 'avoir', 'que', 'pour',
-            'dans', 'ce', 'son', 'une', 'sur', 'avec', 'ne', 'se', 'pas', 'tout', 'plus',
-            'par', 'grand', 'en', 'une', 'être', 'et', 'à', 'il', 'avoir', 'ne', 'je', 'son',
-            'que', 'se', 'qui', 'ce', 'dans', 'en', 'du', 'elle', 'au', 'de', 'le', 'un',
-            'nous', 'vous', 'ils', 'elles', 'leur', 'leurs', 'cette', 'ces', 'ses', 'nos',
-            'vos', 'très', 'bien', 'encore', 'toujours', 'déjà', 'aussi', 'puis', 'donc',
-            'ainsi', 'alors', 'après', 'avant', 'depuis', 'pendant', 'comme', 'quand',
-            'comment', 'pourquoi', 'où', 'dont', 'laquelle', 'lequel', 'lesquels', 'desquels',
-            'auquel', 'auxquels', 'duquel', 'desquelles', 'auxquelles', 'celle', 'celui',
-            'ceux', 'celles', 'tout', 'tous', 'toute', 'toutes', 'autre', 'autres', 'même',
-            'mêmes', 'tel', 'telle', 'tels', 'telles', 'quel', 'quelle', 'quels', 'quelles',
-            'voir', 'savoir', 'faire', 'dire', 'aller', 'venir', 'pouvoir', 'vouloir',
-            'devoir', 'falloir', 'prendre', 'donner', 'mettre', 'porter', 'tenir', 'venir',
-            'partir', 'sortir', 'entrer', 'monter', 'descendre', 'passer', 'rester', 'devenir',
-            'sembler', 'paraître', 'apparaître', 'disparaître', 'arriver', 'partir', 'naître',
-            'mourir', 'vivre', 'exister', 'ici', 'là', 'ailleurs', 'partout', 'nulle', 'part',
-            'quelque', 'part', 'jamais', 'toujours', 'souvent', 'parfois', 'quelquefois',
-            'rarement', 'peu', 'beaucoup', 'trop', 'assez', 'tant', 'autant', 'si', 'aussi',
-            'moins', 'davantage', 'plutôt', 'surtout', 'notamment', 'seulement', 'uniquement',
-            'vraiment', 'certainement', 'probablement', 'peut', 'être', 'sans', 'doute',
-            'évidemment', 'naturellement', 'heureusement', 'malheureusement', 'découvrir',
-            'découvrez', 'voir', 'lire', 'consulter', 'cliquer', 'accéder', 'suivre', 'plus',
-            'notre', 'votre', 'leur', 'cette', 'cette', 'ces', 'tous', 'toutes'
-        }
-        
-        # Mots génériques supplémentaires à filtrer
-        generic_words = {
-            'page', 'site', 'web', 'internet', 'online', 'cliquez', 'ici', 'là', 'suivant',
-            'précédent', 'retour', 'accueil', 'home', 'menu', 'navigation', 'lien', 'liens',
-            'article', 'articles', 'actualité', 'actualités', 'news', 'blog', 'post',
-            'plus', 'moins', 'tout', 'tous', 'toute', 'toutes', 'autre', 'autres'
-        }
-        
-        # Combine stop words
-        all_stop_words = french_stop_words.union(generic_words)
-        
         # Extraire et analyser les ancres
         anchor_texts = []
         dest_categories = Counter()
@@ -1155,21 +1552,22 @@ class CompleteLinkAuditor:
             
             # Catégoriser les destinations par type de page
             if dest:
-                if any(term in dest.lower() for term in ['blog', 'article', 'actualit', 'news']):
+                dest_lower = dest.lower()
+                if any(term in dest_lower for term in ['blog', 'article', 'actualit', 'news']):
                     dest_categories['Blog/Articles'] += 1
-                elif any(term in dest.lower() for term in ['produit', 'product', 'service', 'solution']):
+                elif any(term in dest_lower for term in ['produit', 'product', 'service', 'solution']):
                     dest_categories['Produits/Services'] += 1
-                elif any(term in dest.lower() for term in ['contact', 'about', 'propos', 'equipe', 'team']):
+                elif any(term in dest_lower for term in ['contact', 'about', 'propos', 'equipe', 'team']):
                     dest_categories['Pages institutionnelles'] += 1
-                elif any(term in dest.lower() for term in ['expertise', 'competence', 'metier', 'domaine']):
+                elif any(term in dest_lower for term in ['expertise', 'competence', 'metier', 'domaine']):
                     dest_categories['Expertises'] += 1
-                elif any(term in dest.lower() for term in ['carriere', 'emploi', 'job', 'recrutement']):
+                elif any(term in dest_lower for term in ['carriere', 'emploi', 'job', 'recrutement']):
                     dest_categories['Carrières/Emploi'] += 1
                 else:
                     dest_categories['Autres'] += 1
         
         # Analyse NLP avancée des ancres
-        semantic_keywords = self.extract_semantic_keywords(anchor_texts, all_stop_words)
+        semantic_keywords = self.extract_semantic_keywords(anchor_texts, THEMATIC_STOP_WORDS)
         
         return {
             'top_anchor_keywords': semantic_keywords,
@@ -1186,11 +1584,10 @@ class CompleteLinkAuditor:
         
         for anchor in anchor_texts:
             # Nettoyer le texte
-            clean_anchor = re.sub(r'[^\w\s]', ' ', anchor.lower())
-            words = [w.strip() for w in clean_anchor.split() if len(w.strip()) >= 3]
+            words = _ANCHOR_WORD_RE.findall(anchor.lower())
             
             # Filtrer les stop words et mots génériques
-            meaningful_words = [w for w in words if w not in stop_words and len(w) >= 3]
+            meaningful_words = [w for w in words if w not in stop_words]
             
             # Compter les mots simples
             for word in meaningful_words:
@@ -1247,11 +1644,11 @@ class CompleteLinkAuditor:
                 }
         
         # 3. Trier par score et retourner le top 15
-        sorted_keywords = sorted(scored_keywords.items(), key=lambda x: x[1]['score'], reverse=True)
+        sorted_keywords = heapq.nlargest(15, scored_keywords.items(), key=lambda x: x[1]['score'])
         
         # Formater pour compatibilité avec l'ancien format
         result = {}
-        for keyword, data in sorted_keywords[:15]:
+        for keyword, data in sorted_keywords:
             result[keyword] = data['count']
         
         return result
@@ -1266,6 +1663,7 @@ class CompleteLinkAuditor:
         print("=" * 50)
         
         # Obtenir l'analyseur sémantique
+        from ext_analyseur_semantique import get_semantic_analyzer
         analyzer = get_semantic_analyzer()
         
         # Afficher les stats du cache
@@ -1345,7 +1743,7 @@ class CompleteLinkAuditor:
             
             # Préparer les contenus enrichis des pages
             page_contents_for_gaps = {}
-            for url, data in list(page_data.items())[:100]:  # Limiter pour les performances
+            for url, data in islice(page_data.items(), 100):  # Limiter pour les performances
                 content_parts = []
                 
                 # Utiliser toutes les données disponibles pour une meilleure similarité
@@ -1473,10 +1871,11 @@ class CompleteLinkAuditor:
     def generate_semantic_analysis_section(self, semantic_data):
         """Générer la section d'analyse sémantique avec graphiques"""
         
-        html_content = """
+        html_parts = []
+        html_parts.append("""
         <div class="section">
             <h2>Analyse sémantique avancée (CamemBERT)</h2>
-        """
+        """)
         
         # 1. Clustering sémantique avec graphiques
         if 'semantic_clusters' in semantic_data and semantic_data['semantic_clusters']:
@@ -1491,7 +1890,7 @@ class CompleteLinkAuditor:
                 diversity_ratio = len(unique_anchors) / len(cluster_anchors)
                 
                 if diversity_ratio < 0.3:  # Faible diversité
-                    html_content += f"""
+                    html_parts.append(f"""
                     <div class="warning">
                         <h3>⚠️ Analyse sémantique non pertinente</h3>
                         <p><strong>Problème détecté :</strong> Faible diversité des ancres de liens</p>
@@ -1514,12 +1913,12 @@ class CompleteLinkAuditor:
                             <p><strong>✅ Objectif :</strong> Atteindre au moins 30% de diversité pour une analyse sémantique utile</p>
                         </div>
                     </div>
-                    """
-                    html_content += "</div>"  # Fermer la section
-                    return html_content
+                    """)
+                    html_parts.append("</div>")  # Fermer la section
+                    return "".join(html_parts)
             
             # Si on arrive ici, l'analyse est pertinente (diversité suffisante ou plusieurs clusters)
-            html_content += f"""
+            html_parts.append(f"""
             <div class="semantic-analysis">
                 <h3>Thèmes sémantiques identifiés ({len(clusters)} clusters, {total_anchors} ancres)</h3>
                 
@@ -1527,36 +1926,35 @@ class CompleteLinkAuditor:
                     <div class="chart">
                         <h4>Répartition des thèmes</h4>
                         <div class="pie-chart-semantic">
-            """
+            """)
             
             # Graphique en secteurs des thèmes
             colors = ['#FF6B6B', '#4ECDC4', '#45B7D1', '#96CEB4', '#FF8A80', '#FFD93D', '#6C5CE7', '#FD79A8']
-            for i, (theme, anchors) in enumerate(clusters.items()):
-                percentage = (len(anchors) / total_anchors) * 100
-                color = colors[i % len(colors)]
-                html_content += f"""
+            share_scale = 100 / total_anchors
+            for (theme, anchors), color in zip(clusters.items(), cycle(colors)):
+                percentage = len(anchors) * share_scale
+                html_parts.append(f"""
                             <div class="pie-item-semantic">
                                 <span class="pie-color" style="background-color: {color}"></span>
                                 <span class="pie-label-semantic">{theme}: {len(anchors)} ancres ({percentage:.1f}%)</span>
                             </div>
-                """
+                """)
             
-            html_content += """
+            html_parts.append("""
                         </div>
                     </div>
                     
                     <div class="chart">
                         <h4>Détail par thème</h4>
                         <div class="themes-detail">
-            """
+            """)
             
             # Graphique en barres horizontales avec détails
             max_anchors = max(len(anchors) for anchors in clusters.values())
-            for i, (theme, anchors) in enumerate(clusters.items()):
+            for (theme, anchors), color in zip(clusters.items(), cycle(colors)):
                 percentage = (len(anchors) / max_anchors) * 100
-                color = colors[i % len(colors)]
                 
-                html_content += f"""
+                html_parts.append(f"""
                             <div class="theme-item">
                                 <div class="theme-header">
                                     <span class="theme-name">{theme}</span>
@@ -1566,35 +1964,34 @@ class CompleteLinkAuditor:
                                     <div class="theme-bar" style="width: {percentage}%; background-color: {color}"></div>
                                 </div>
                                 <div class="theme-examples">
-                """
+                """)
                 
                 # Afficher quelques exemples d'ancres
-                example_anchors = anchors[:5]  # Top 5 exemples
-                for anchor in example_anchors:
-                    html_content += f'<span class="anchor-example">"{anchor}"</span>'
+                for anchor in islice(anchors, 5):  # Top 5 exemples
+                    html_parts.append(f'<span class="anchor-example">"{anchor}"</span>')
                 
-                if len(anchors) > 5:
-                    html_content += f'<span class="anchor-more">... et {len(anchors) - 5} autres</span>'
+                remaining = len(anchors) - 5
+                if remaining > 0:
+                    html_parts.append(f'<span class="anchor-more">... et {remaining} autres</span>')
                 
-                html_content += """
+                html_parts.append("""
                                 </div>
                             </div>
-                """
+                """)
             
-            html_content += """
+            html_parts.append("""
                         </div>
                     </div>
                 </div>
-            """
+            """)
             
             # 3. Nuage de mots par thème
-            html_content += """
+            html_parts.append("""
                 <h4>Nuages de mots par thème</h4>
                 <div class="word-clouds-container">
-            """
+            """)
             
-            for i, (theme, anchors) in enumerate(clusters.items()):
-                color = colors[i % len(colors)]
+            for (theme, anchors), color in zip(clusters.items(), cycle(colors)):
                 
                 # Extraire les mots les plus fréquents du thème
                 all_words = []
@@ -1606,28 +2003,28 @@ class CompleteLinkAuditor:
                 word_freq = Counter(all_words)
                 top_words = word_freq.most_common(10)
                 
-                html_content += f"""
+                html_parts.append(f"""
                     <div class="word-cloud-theme" style="border-left: 4px solid {color}">
                         <h5>{theme}</h5>
                         <div class="word-cloud-mini">
-                """
+                """)
                 
                 for word, freq in top_words:
                     # Taille basée sur la fréquence (min 0.8em, max 1.6em)
                     size = 0.8 + (freq / max(1, max(f for _, f in top_words))) * 0.8
-                    html_content += f'<span class="word-mini" style="font-size: {size}em; color: {color}">{word}</span>'
+                    html_parts.append(f'<span class="word-mini" style="font-size: {size}em; color: {color}">{word}</span>')
                 
-                html_content += """
+                html_parts.append("""
                         </div>
                     </div>
-                """
+                """)
             
-            html_content += "</div>"
+            html_parts.append("</div>")
         
         # 2. Analyse de cohérence si disponible
         if 'coherence_analysis' in semantic_data:
             coherence = semantic_data['coherence_analysis']
-            html_content += f"""
+            html_parts.append(f"""
             <div class="coherence-analysis">
                 <h3>Cohérence sémantique ancres ↔ contenus</h3>
                 <div class="stats-grid">
@@ -1649,35 +2046,35 @@ class CompleteLinkAuditor:
                     </div>
                 </div>
             </div>
-            """
+            """)
         
         # 3. Opportunités de maillage si disponibles
         if 'link_opportunities' in semantic_data and semantic_data['link_opportunities']:
             opportunities = semantic_data['link_opportunities'][:10]  # Top 10
-            html_content += f"""
+            html_parts.append(f"""
             <div class="opportunities-analysis">
                 <h3>Opportunités de maillage détectées</h3>
                 <p>Pages sémantiquement similaires qui pourraient être liées :</p>
                 <table>
                     <tr><th>Similarité</th><th>Page 1</th><th>Page 2</th></tr>
-            """
+            """)
             
             for url1, url2, similarity in opportunities:
                 similarity_percent = similarity * 100
-                color = '#28a745' if similarity > 0.8 else '#ffc107' if similarity > 0.6 else '#dc3545'
-                html_content += f"""
+                color = SCORE_BAND_COLORS[bisect.bisect_left(SIMILARITY_THRESHOLDS, similarity)]
+                html_parts.append(f"""
                     <tr>
                         <td><span style="color: {color}; font-weight: bold">{similarity_percent:.1f}%</span></td>
                         <td class="url">{url1}</td>
                         <td class="url">{url2}</td>
                     </tr>
-                """
+                """)
             
-            html_content += "</table></div>"
+            html_parts.append("</table></div>")
         
         # Si aucun clustering n'est disponible
         else:
-            html_content += """
+            html_parts.append("""
             <div class="warning">
                 <h3>ℹ️ Analyse sémantique non disponible</h3>
                 <p><strong>Raisons possibles :</strong></p>
@@ -1702,11 +2099,11 @@ class CompleteLinkAuditor:
                     <li><strong>Utiliser des termes métiers spécifiques</strong> à votre domaine</li>
                 </ol>
             </div>
-            """
+            """)
         
-        html_content += "</div>"  # Fermer la section
+        html_parts.append("</div>")  # Fermer la section
         
-        return html_content
+        return "".join(html_parts)
     
     def calculate_editorial_score(self, anchor_quality, total_editorial, editorial_ratio, total_internal_links):
         """Calcule un score de qualité éditorial (0-100)"""
@@ -1823,21 +2220,14 @@ class CompleteLinkAuditor:
             # Filtrer si nécessaire
             if url_filter:
                 original_count = len(rows)
-                rows = [row for row in rows if any(
-                    str(row.get(col, '')).startswith(url_filter) 
-                    for col in row.keys() if 'url' in col.lower() or 'address' in col.lower()
-                )]
+                rows = self.filter_rows_by_url_prefix(rows, fieldnames, url_filter, ('url', 'address'))
                 print(f"🎯 Après filtrage: {len(rows):,} pages ({original_count - len(rows):,} supprimées)")
             
             # Identifier la colonne de mots
-            word_col = None
-            url_col = None
-            for col in fieldnames:
-                col_lower = col.lower()
-                if any(term in col_lower for term in ['word', 'mots', 'count']):
-                    word_col = col
-                elif any(term in col_lower for term in ['address', 'url', 'source']):
-                    url_col = col
+            columns = resolve_columns(tuple(fieldnames), (('word', ('word', 'mots', 'count')),
+                                                          ('url', ('address', 'url', 'source'))))
+            word_col = columns.get('word')
+            url_col = columns.get('url')
             
             if not word_col or not url_col:
                 print("❌ Colonnes 'word count' ou 'URL' non trouvées")
@@ -1871,11 +2261,13 @@ class CompleteLinkAuditor:
                 'quality_content': [item for item in word_counts if 300 <= item['word_count'] <= 1500]
             }
             
-            print(f"📈 Statistiques:")
-            print(f"  - Moyenne: {analysis['avg_words']:.0f} mots")
-            print(f"  - Contenu thin (< 300): {len(analysis['thin_content'])} pages")
-            print(f"  - Contenu riche (> 1500): {len(analysis['rich_content'])} pages")
-            print(f"  - Contenu qualité (300-1500): {len(analysis['quality_content'])} pages")
+            print("\n".join([
+                "📈 Statistiques:",
+                f"  - Moyenne: {analysis['avg_words']:.0f} mots",
+                f"  - Contenu thin (< 300): {len(analysis['thin_content'])} pages",
+                f"  - Contenu riche (> 1500): {len(analysis['rich_content'])} pages",
+                f"  - Contenu qualité (300-1500): {len(analysis['quality_content'])} pages",
+            ]))
             
             return analysis
             
@@ -1939,6 +2331,13 @@ class CompleteLinkAuditor:
             
             all_urls = set(titles_dict.keys()) | set(h1_dict.keys())
             
+            # Normaliser chaque texte une seule fois (forme comparable + ensemble des mots)
+            titles_norm = {url: self._coherence_key(title) for url, title in titles_dict.items()}
+            h1_norm = {url: self._coherence_key(h1) for url, h1 in h1_dict.items()}
+            
+            # Résultat de la comparaison par couple (title, h1) normalisé : les gabarits se répètent
+            similar_cache = {}
+            
             for url in all_urls:
                 title = titles_dict.get(url, '')
                 h1 = h1_dict.get(url, '')
@@ -1949,11 +2348,24 @@ class CompleteLinkAuditor:
                     coherence_analysis['missing_h1'].append(url)
                 else:
                     coherence_analysis['total_pages_with_both'] += 1
+                    title_key, title_words = titles_norm[url]
+                    h1_key, h1_words = h1_norm[url]
                     
                     # Comparaison
-                    if title.strip().lower() == h1.strip().lower():
+                    if title_key == h1_key:
                         coherence_analysis['identical'].append({'url': url, 'text': title})
-                    elif self.similarity_score(title, h1) > 0.7:
+                        continue
+                    
+                    pair_key = (title_key, h1_key)
+                    is_similar = similar_cache.get(pair_key)
+                    if is_similar is None:
+                        # Jaccard <= min/max des tailles : inutile de calculer si ce ratio ne dépasse pas 0.7
+                        is_similar = similar_cache[pair_key] = (
+                            10 * min(len(title_words), len(h1_words)) > 7 * max(len(title_words), len(h1_words))
+                            and self.word_similarity(title_words, h1_words) > 0.7
+                        )
+                    
+                    if is_similar:
                         coherence_analysis['similar'].append({
                             'url': url, 'title': title, 'h1': h1
                         })
@@ -1962,11 +2374,13 @@ class CompleteLinkAuditor:
                             'url': url, 'title': title, 'h1': h1
                         })
             
-            print(f"📊 Résultats cohérence:")
-            print(f"  - Pages avec Title et H1: {coherence_analysis['total_pages_with_both']}")
-            print(f"  - Identiques: {len(coherence_analysis['identical'])}")
-            print(f"  - Similaires: {len(coherence_analysis['similar'])}")
-            print(f"  - Différents: {len(coherence_analysis['different'])}")
+            print("\n".join([
+                "📊 Résultats cohérence:",
+                f"  - Pages avec Title et H1: {coherence_analysis['total_pages_with_both']}",
+                f"  - Identiques: {len(coherence_analysis['identical'])}",
+                f"  - Similaires: {len(coherence_analysis['similar'])}",
+                f"  - Différents: {len(coherence_analysis['different'])}",
+            ]))
             
             return coherence_analysis
             
@@ -1983,34 +2397,20 @@ class CompleteLinkAuditor:
             
             print(f"💰 Identification des pages de conversion")
             
-            # Patterns de conversion
-            conversion_patterns = {
-                'contact': ['contact', 'nous-contacter', 'contactez', 'get-in-touch'],
-                'achat': ['achat', 'acheter', 'buy', 'purchase', 'commande', 'commander', 'order'],
-                'inscription': ['inscription', 'register', 'signup', 'sign-up', 's-inscrire'],
-                'devis': ['devis', 'quote', 'estimation', 'demande', 'request'],
-                'panier': ['panier', 'cart', 'basket', 'checkout'],
-                'pricing': ['prix', 'pricing', 'tarifs', 'rates', 'cost'],
-                'demo': ['demo', 'demonstration', 'essai', 'trial', 'test']
-            }
-            
-            conversion_pages = {category: [] for category in conversion_patterns.keys()}
+            # Indices des lignes par catégorie (les dictionnaires sont construits à la fin)
+            conversion_rows = {category: array('I') for category in self.CONVERSION_PATTERNS.keys()}
             
             # Identifier la colonne URL
-            url_col = None
-            title_col = None
-            for col in fieldnames:
-                col_lower = col.lower()
-                if any(term in col_lower for term in ['address', 'url', 'source']):
-                    url_col = col
-                elif any(term in col_lower for term in ['title', 'titre']):
-                    title_col = col
+            columns = resolve_columns(tuple(fieldnames), (('url', ('address', 'url', 'source')),
+                                                          ('title', ('title', 'titre'))))
+            url_col = columns.get('url')
+            title_col = columns.get('title')
             
             if not url_col:
                 print("❌ Colonne URL non trouvée")
                 return None
             
-            for row in rows:
+            for row_idx, row in enumerate(rows):
                 url = row.get(url_col, '').lower()
                 title = row.get(title_col, '').lower() if title_col else ''
                 
@@ -2020,14 +2420,18 @@ class CompleteLinkAuditor:
                 
                 # Vérifier les patterns
                 full_text = f"{url} {title}"
-                for category, patterns in conversion_patterns.items():
-                    if any(pattern in full_text for pattern in patterns):
-                        conversion_pages[category].append({
-                            'url': row.get(url_col, ''),
-                            'title': row.get(title_col, '') if title_col else '',
-                            'category': category
-                        })
-                        break  # Une page ne peut être que dans une catégorie
+                category = self.match_conversion_category(full_text)
+                if category:  # Une page ne peut être que dans une catégorie
+                    conversion_rows[category].append(row_idx)
+            
+            conversion_pages = {
+                category: [{
+                    'url': rows[i].get(url_col, ''),
+                    'title': rows[i].get(title_col, '') if title_col else '',
+                    'category': category
+                } for i in indices]
+                for category, indices in conversion_rows.items()
+            }
             
             # Statistiques
             total_conversion_pages = sum(len(pages) for pages in conversion_pages.values())
@@ -2047,20 +2451,39 @@ class CompleteLinkAuditor:
             print(f"❌ Erreur lors de l'identification des pages de conversion: {e}")
             return None
 
+    def match_conversion_category(self, full_text):
+        """Retourne la catégorie de conversion d'un texte (URL + titre) ou None
+        
+        La comparaison se fait mot à mot (et non par sous-chaîne) : 'cart' ne
+        correspond plus à 'carte'. Les patterns composés ('nous-contacter')
+        sont comparés aux suites de mots consécutifs reliées par des tirets.
+        """
+        words = [word for word in _CONVERSION_WORD_SPLIT_RE.split(full_text) if word]
+        terms = set(words)
+        for size in range(2, self.CONVERSION_MAX_WORDS + 1):
+            terms.update('-'.join(words[i:i + size]) for i in range(len(words) - size + 1))
+        
+        for category, patterns in self.CONVERSION_PATTERN_SETS.items():
+            if not patterns.isdisjoint(terms):
+                return category
+        return None
+
+    def _coherence_key(self, text):
+        """Forme comparable d'un texte et l'ensemble de ses mots"""
+        text = text.strip().lower()
+        return text, frozenset(text.split())
+
     def similarity_score(self, text1, text2):
         """Calcule un score de similarité simple entre deux textes"""
         if not text1 or not text2:
             return 0
         
-        # Normaliser
-        t1 = set(text1.lower().split())
-        t2 = set(text2.lower().split())
-        
-        # Jaccard similarity
-        intersection = len(t1 & t2)
-        union = len(t1 | t2)
-        
-        return intersection / union if union > 0 else 0
+        return self.word_similarity(set(text1.lower().split()), set(text2.lower().split()))
+
+    def word_similarity(self, words1, words2):
+        """Jaccard similarity entre deux ensembles de mots"""
+        union = len(words1 | words2)
+        return len(words1 & words2) / union if union > 0 else 0
 
     def analyze_semantic_clusters(self, csv_path, website_url, url_filter=None):
         """Analyse les clusters sémantiques générés par Screaming Frog v22+"""
@@ -2125,10 +2548,7 @@ class CompleteLinkAuditor:
             # Filtrer si nécessaire
             if url_filter:
                 original_count = len(rows)
-                rows = [row for row in rows if any(
-                    str(row.get(col, '')).startswith(url_filter) 
-                    for col in row.keys() if 'url' in col.lower() or 'source' in col.lower()
-                )]
+                rows = self.filter_rows_by_url_prefix(rows, fieldnames, url_filter, ('url', 'source'))
                 print(f"🎯 Après filtrage: {len(rows):,} relations ({original_count - len(rows):,} supprimées)")
             
             # Identifier les colonnes
@@ -2151,22 +2571,30 @@ class CompleteLinkAuditor:
             high_similarity_pairs = []
             similarity_scores = []
             
-            for row in rows:
-                try:
-                    source = row.get(source_col, '')
-                    target = row.get(target_col, '')
-                    score = float(row.get(similarity_col, 0)) if similarity_col else 1.0
-                    
-                    if source and target and score >= similarity_threshold:
-                        high_similarity_pairs.append({
-                            'source': source,
-                            'target': target,
-                            'similarity': score
-                        })
-                        similarity_scores.append(score)
+            selected = None
+            if NUMPY_AVAILABLE and similarity_col:
+                selected = self._select_similar_pairs_numpy(rows, source_col, target_col,
+                                                            similarity_col, similarity_threshold)
+            
+            if selected is not None:
+                high_similarity_pairs, similarity_scores = selected
+            else:
+                for row in rows:
+                    try:
+                        source = row.get(source_col, '')
+                        target = row.get(target_col, '')
+                        score = float(row.get(similarity_col, 0)) if similarity_col else 1.0
                         
-                except (ValueError, TypeError):
-                    continue
+                        if source and target and score >= similarity_threshold:
+                            high_similarity_pairs.append({
+                                'source': source,
+                                'target': target,
+                                'similarity': score
+                            })
+                            similarity_scores.append(score)
+                            
+                    except (ValueError, TypeError):
+                        continue
             
             if not high_similarity_pairs:
                 return None
@@ -2176,12 +2604,14 @@ class CompleteLinkAuditor:
                 'avg_similarity': sum(similarity_scores) / len(similarity_scores),
                 'high_similarity_threshold': similarity_threshold,
                 'similar_page_pairs': high_similarity_pairs[:50],  # Limiter pour la performance
-                'top_similarity_scores': sorted(similarity_scores, reverse=True)[:10]
+                'top_similarity_scores': heapq.nlargest(10, similarity_scores)
             }
             
-            print(f"📊 Résultats similarité:")
-            print(f"  - Paires très similaires (>{similarity_threshold}): {len(high_similarity_pairs)}")
-            print(f"  - Score moyen: {analysis['avg_similarity']:.3f}")
+            print("\n".join([
+                "📊 Résultats similarité:",
+                f"  - Paires très similaires (>{similarity_threshold}): {len(high_similarity_pairs)}",
+                f"  - Score moyen: {analysis['avg_similarity']:.3f}",
+            ]))
             
             return analysis
             
@@ -2189,6 +2619,30 @@ class CompleteLinkAuditor:
             print(f"❌ Erreur lors de l'analyse de similarité: {e}")
             return None
 
+    def _select_similar_pairs_numpy(self, rows, source_col, target_col, similarity_col, threshold):
+        """Sélectionne les paires au-dessus du seuil avec un masque NumPy vectorisé
+        
+        Retourne None si un score n'est pas numérique : le traitement ligne à ligne,
+        qui ignore ces lignes, prend alors le relais.
+        """
+        try:
+            scores = np.array([row.get(similarity_col) for row in rows], dtype=float)
+        except (ValueError, TypeError):
+            return None
+        
+        pairs = []
+        selected_scores = []
+        for i in np.flatnonzero(scores >= threshold):
+            row = rows[i]
+            source = row.get(source_col, '')
+            target = row.get(target_col, '')
+            if source and target:
+                score = float(scores[i])
+                pairs.append({'source': source, 'target': target, 'similarity': score})
+                selected_scores.append(score)
+        
+        return pairs, selected_scores
+
     def analyze_content_clusters(self, csv_path, url_filter=None):
         """Analyse les clusters de contenu"""
         try:
@@ -2199,49 +2653,49 @@ class CompleteLinkAuditor:
             print(f"🗂️  Analyse des clusters de contenu ({len(rows):,} pages)")
             
             # Identifier les colonnes
-            url_col = cluster_col = None
-            for col in fieldnames:
-                col_lower = col.lower()
-                if any(term in col_lower for term in ['url', 'address', 'page']):
-                    url_col = col
-                elif any(term in col_lower for term in ['cluster', 'group', 'category']):
-                    cluster_col = col
+            columns = resolve_columns(tuple(fieldnames), (('url', ('url', 'address', 'page')),
+                                                          ('cluster', ('cluster', 'group', 'category'))))
+            url_col = columns.get('url')
+            cluster_col = columns.get('cluster')
             
             if not url_col:
                 print("❌ Colonne URL non trouvée")
                 return None
             
-            # Grouper par clusters
-            clusters = {}
-            for row in rows:
-                url = row.get(url_col, '')
-                cluster_id = row.get(cluster_col, 'unclustered') if cluster_col else 'all_pages'
-                
+            # Grouper par clusters (un seul passage sur des couples url/cluster)
+            if cluster_col:
+                pairs = ((row.get(url_col, ''), row.get(cluster_col, 'unclustered')) for row in rows)
+            else:
+                pairs = ((row.get(url_col, ''), 'all_pages') for row in rows)
+            
+            clusters = defaultdict(list)
+            for url, cluster_id in pairs:
                 # Appliquer le filtre
                 if url_filter and not url.startswith(url_filter):
                     continue
-                
-                if cluster_id not in clusters:
-                    clusters[cluster_id] = []
                 clusters[cluster_id].append(url)
             
             # Analyser la distribution des clusters
             min_cluster_size = self.config.get('semantic_analysis', {}).get('min_cluster_size', 3)
-            meaningful_clusters = {k: v for k, v in clusters.items() if len(v) >= min_cluster_size}
+            cluster_sizes = {k: len(v) for k, v in clusters.items()}
+            meaningful_sizes = {k: size for k, size in cluster_sizes.items() if size >= min_cluster_size}
+            total_clustered_pages = sum(cluster_sizes.values())
             
             analysis = {
                 'total_clusters': len(clusters),
-                'meaningful_clusters': len(meaningful_clusters),
-                'total_clustered_pages': sum(len(pages) for pages in clusters.values()),
-                'avg_cluster_size': sum(len(pages) for pages in clusters.values()) / len(clusters) if clusters else 0,
-                'cluster_distribution': {k: len(v) for k, v in meaningful_clusters.items()},
-                'largest_clusters': dict(sorted(meaningful_clusters.items(), key=lambda x: len(x[1]), reverse=True)[:10])
+                'meaningful_clusters': len(meaningful_sizes),
+                'total_clustered_pages': total_clustered_pages,
+                'avg_cluster_size': total_clustered_pages / len(clusters) if clusters else 0,
+                'cluster_distribution': meaningful_sizes,
+                'largest_clusters': {k: clusters[k] for k in heapq.nlargest(10, meaningful_sizes, key=meaningful_sizes.get)}
             }
             
-            print(f"📊 Résultats clustering:")
-            print(f"  - Clusters totaux: {analysis['total_clusters']}")
-            print(f"  - Clusters significatifs (≥{min_cluster_size}): {analysis['meaningful_clusters']}")
-            print(f"  - Taille moyenne: {analysis['avg_cluster_size']:.1f} pages/cluster")
+            print("\n".join([
+                "📊 Résultats clustering:",
+                f"  - Clusters totaux: {analysis['total_clusters']}",
+                f"  - Clusters significatifs (≥{min_cluster_size}): {analysis['meaningful_clusters']}",
+                f"  - Taille moyenne: {analysis['avg_cluster_size']:.1f} pages/cluster",
+            ]))
             
             return analysis
             
@@ -2284,9 +2738,11 @@ class CompleteLinkAuditor:
                         'priority': 'high' if size > 10 else 'medium'
                     })
         
-        print(f"💡 Recommandations sémantiques générées:")
-        print(f"  - Liens manquants: {len(recommendations['missing_internal_links'])}")
-        print(f"  - Opportunités inter-clusters: {len(recommendations['cross_cluster_opportunities'])}")
+        print("\n".join([
+            "💡 Recommandations sémantiques générées:",
+            f"  - Liens manquants: {len(recommendations['missing_internal_links'])}",
+            f"  - Opportunités inter-clusters: {len(recommendations['cross_cluster_opportunities'])}",
+        ]))
         
         return recommendations
 
@@ -2305,197 +2761,267 @@ class CompleteLinkAuditor:
         if not source_col or not dest_col:
             return {'nodes': [], 'edges': []}
         
-        # Compter les liens entrants pour chaque page
-        inbound_count = {}
-        outbound_count = {}
-        
-        for link in editorial_links:
-            source = link.get(source_col, '').strip()
-            dest = link.get(dest_col, '').strip()
-            
-            if source and dest and source != dest:  # Éviter les auto-liens
-                # Compter les liens entrants
-                inbound_count[dest] = inbound_count.get(dest, 0) + 1
-                outbound_count[source] = outbound_count.get(source, 0) + 1
-                
-                # Ajouter les nœuds
-                nodes[source] = nodes.get(source, {'id': source, 'inbound': 0, 'outbound': 0})
-                nodes[dest] = nodes.get(dest, {'id': dest, 'inbound': 0, 'outbound': 0})
-        
-        # Mettre à jour les compteurs des nœuds
-        for url, count in inbound_count.items():
-            if url in nodes:
-                nodes[url]['inbound'] = count
+        # Taille du graphique : au-delà de 1500 nœuds, le rapport bascule sur un rendu canvas
+        network_config = self.config.get('network_graph', {})
+        max_nodes = network_config.get('max_nodes', 100)
+        max_edges = network_config.get('max_edges', 500)
+        static_layout_max_nodes = network_config.get('static_layout_max_nodes', 100)
         
-        for url, count in outbound_count.items():
-            if url in nodes:
-                nodes[url]['outbound'] = count
+        # Un seul passage sur les liens éditoriaux
+        edge_tuples = self._extract_network_edges(editorial_links, source_col, dest_col, anchor_col)
         
-        # Créer les arêtes avec ancres
-        for link in editorial_links:
-            source = link.get(source_col, '').strip()
-            dest = link.get(dest_col, '').strip()
-            anchor = link.get(anchor_col, '').strip() if anchor_col else ''
+        if NUMPY_AVAILABLE:
+            nodes, edges = self._build_network_numpy(edge_tuples, max_nodes)
+        else:
+            inbound_count = defaultdict(int)
+            outbound_count = defaultdict(int)
+            first_seen = {}  # Ordre de première apparition des pages
             
-            if source and dest and source != dest:
-                edges.append({
-                    'source': source,
-                    'target': dest,
-                    'anchor': anchor[:50] + '...' if len(anchor) > 50 else anchor  # Limiter la longueur
-                })
-        
-        # Limiter le nombre de nœuds pour la performance (garder les plus connectés)
-        if len(nodes) > 100:
-            # Trier par nombre total de connexions (entrants + sortants)
-            sorted_nodes = sorted(nodes.values(), 
-                                key=lambda x: x['inbound'] + x['outbound'], 
-                                reverse=True)[:100]
+            for source, dest, _ in edge_tuples:
+                inbound_count[dest] += 1
+                outbound_count[source] += 1
+                first_seen[source] = None
+                first_seen[dest] = None
+            
+            nodes = {url: {'id': url, 'inbound': inbound_count[url], 'outbound': outbound_count[url]}
+                     for url in first_seen}
             
-            # Filtrer les nœuds et edges
-            kept_urls = {node['id'] for node in sorted_nodes}
-            nodes = {url: data for url, data in nodes.items() if url in kept_urls}
-            edges = [edge for edge in edges if edge['source'] in kept_urls and edge['target'] in kept_urls]
+            # Limiter le nombre de nœuds pour la performance (garder les plus connectés)
+            if len(nodes) > max_nodes:
+                # Trier par nombre total de connexions (entrants + sortants)
+                sorted_nodes = sorted(nodes.values(), 
+                                    key=lambda x: x['inbound'] + x['outbound'], 
+                                    reverse=True)[:max_nodes]
+                
+                # Filtrer les nœuds et edges
+                kept_urls = {node['id'] for node in sorted_nodes}
+                nodes = {url: data for url, data in nodes.items() if url in kept_urls}
+                edge_tuples = [edge for edge in edge_tuples if edge[0] in kept_urls and edge[1] in kept_urls]
+            
+            edges = [self._network_edge(source, dest, anchor) for source, dest, anchor in edge_tuples]
         
         # Simplifier les URLs pour l'affichage
         for node in nodes.values():
             try:
-                parsed = urlparse(node['id'])
                 # Garder seulement le chemin, sans le domaine
-                display_path = parsed.path.rstrip('/')
+                display_path = url_path(node['id']).rstrip('/')
                 if not display_path:
                     display_path = '/'
                 elif len(display_path) > 30:
                     display_path = display_path[:27] + '...'
                 node['label'] = display_path
-            except:
+            except Exception:
                 node['label'] = node['id'][:30] + '...' if len(node['id']) > 30 else node['id']
         
+        nodes = list(nodes.values())
+        edges = edges[:max_edges]  # Limiter les arêtes pour la performance
+        
+        # Petits graphes : disposition calculée ici, le rapport n'a plus de simulation à lancer
+        if NUMPY_AVAILABLE and 0 < len(nodes) <= static_layout_max_nodes:
+            self._layout_network_numpy(nodes, edges)
+        
         return {
-            'nodes': list(nodes.values()),
-            'edges': edges[:500]  # Limiter les arêtes pour la performance
+            'nodes': nodes,
+            'edges': edges
         }
 
+    def _extract_network_edges(self, editorial_links, source_col, dest_col, anchor_col):
+        """Extrait les arêtes (source, destination, ancre) du graphe, sans auto-liens"""
+        edge_tuples = []
+        for link in editorial_links:
+            source = link.get(source_col, '').strip()
+            dest = link.get(dest_col, '').strip()
+            
+            if source and dest and source != dest:  # Éviter les auto-liens
+                edge_tuples.append((source, dest, link.get(anchor_col, '').strip() if anchor_col else ''))
+        return edge_tuples
+
+    def _network_edge(self, source, dest, anchor):
+        """Formate une arête pour le graphique D3"""
+        return {
+            'source': source,
+            'target': dest,
+            'anchor': anchor[:50] + '...' if len(anchor) > 50 else anchor  # Limiter la longueur
+        }
+
+    def _build_network_numpy(self, edge_tuples, max_nodes=100):
+        """Construit les nœuds et arêtes du graphe en factorisant les URLs en entiers (NumPy)"""
+        if not edge_tuples:
+            return {}, []
+        
+        sources, dests, anchors = (list(column) for column in zip(*edge_tuples))
+        edge_count = len(sources)
+        
+        # Factorisation : chaque URL devient un identifiant entier
+        urls, inverse = np.unique(np.array(sources + dests, dtype=object), return_inverse=True)
+        inverse = inverse.reshape(-1)
+        src_ids = inverse[:edge_count]
+        dst_ids = inverse[edge_count:]
+        outbound = np.bincount(src_ids, minlength=len(urls))
+        inbound = np.bincount(dst_ids, minlength=len(urls))
+        
+        # Ordre de première apparition (source puis destination de chaque lien)
+        positions = np.concatenate([2 * np.arange(edge_count), 2 * np.arange(edge_count) + 1])
+        first_seen = np.full(len(urls), len(positions))
+        np.minimum.at(first_seen, inverse, positions)
+        
+        # Limiter le nombre de nœuds pour la performance (garder les plus connectés)
+        kept = np.arange(len(urls))
+        if len(urls) > max_nodes:
+            # Tri stable : à connexions égales, la page rencontrée en premier est gardée
+            kept = np.lexsort((first_seen, -(inbound + outbound)))[:max_nodes]
+        kept = kept[np.argsort(first_seen[kept])]
+        keep_mask = np.zeros(len(urls), dtype=bool)
+        keep_mask[kept] = True
+        
+        nodes = {}
+        for i in kept:
+            nodes[urls[i]] = {'id': urls[i], 'inbound': int(inbound[i]), 'outbound': int(outbound[i])}
+        
+        edges = [self._network_edge(sources[i], dests[i], anchors[i])
+                 for i in np.flatnonzero(keep_mask[src_ids] & keep_mask[dst_ids])]
+        
+        return nodes, edges
+
+    def _layout_network_numpy(self, nodes, edges, iterations=50):
+        """Disposition Fruchterman-Reingold des nœuds (champs x et y normalisés entre 0 et 1)"""
+        index = {node['id']: i for i, node in enumerate(nodes)}
+        links = np.array([(index[edge['source']], index[edge['target']]) for edge in edges],
+                         dtype=np.intp).reshape(-1, 2)
+        
+        # Graine fixe : le même crawl donne toujours le même graphique
+        positions = np.random.default_rng(42).random((len(nodes), 2))
+        k = 1 / np.sqrt(len(nodes))  # Distance idéale entre deux nœuds
+        temperature = 0.1
+        cooling = temperature / (iterations + 1)
+        
+        for _ in range(iterations):
+            delta = positions[:, np.newaxis, :] - positions[np.newaxis, :, :]
+            distance = np.maximum(np.linalg.norm(delta, axis=-1), 0.01)
+            
+            # Répulsion entre toutes les paires de nœuds (k² / d)
+            displacement = np.einsum('ijk,ij->ik', delta, k * k / distance ** 2)
+            
+            # Attraction le long des liens (d² / k)
+            if len(links):
+                pull = delta[links[:, 0], links[:, 1]] * (distance[links[:, 0], links[:, 1]] / k)[:, np.newaxis]
+                np.subtract.at(displacement, links[:, 0], pull)
+                np.add.at(displacement, links[:, 1], pull)
+            
+            # Déplacement limité par la température, qui décroît à chaque itération
+            length = np.maximum(np.linalg.norm(displacement, axis=1), 0.01)
+            positions += displacement * (np.minimum(length, temperature) / length)[:, np.newaxis]
+            temperature -= cooling
+        
+        # Normalisation dans [0, 1] (un axe sans étendue, ex. un seul nœud, est centré)
+        positions -= positions.min(axis=0)
+        span = positions.max(axis=0)
+        positions = np.where(span > 0, positions / np.where(span > 0, span, 1), 0.5)
+        
+        for node, (x, y) in zip(nodes, positions.round(4).tolist()):
+            node['x'] = x
+            node['y'] = y
+
     def generate_html_report(self, analysis, website_url, source_file, url_filter=None):
         """Génère le rapport HTML"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Une seule date pour le rapport et l'export CSV : leurs noms de fichiers concordent
+        generated_at = datetime.now()
+        timestamp = generated_at.strftime("%Y%m%d_%H%M%S")
         report_file = f"{self.config['export_path']}audit_report_{timestamp}.html"
         
+        if self.config.get('compress_reports', False):
+            report_file += '.gz'
+        
         os.makedirs(self.config['export_path'], exist_ok=True)
         
+        # Écrire le rapport au fil de l'eau (tampon de 1 Mo) plutôt que de le construire en mémoire
+        with self._open_export(report_file) as f:
+            self._write_html_report(f, analysis, website_url, source_file, url_filter, generated_at)
+        
+        # Générer aussi un export CSV des recommandations
+        csv_export_file = self.generate_csv_export(analysis, website_url, source_file, url_filter, timestamp)
+        
+        return report_file
+
+    def _open_export(self, path, newline=None):
+        """Ouvre un fichier d'export en écriture, compressé en gzip si son nom se termine par .gz"""
+        if path.endswith('.gz'):
+            return gzip.open(path, 'wt', encoding='utf-8', newline=newline, compresslevel=6)
+        return open(path, 'w', encoding='utf-8', newline=newline, buffering=1 << 20)
+
+    def _write_html_report(self, f, analysis, website_url, source_file, url_filter=None, generated_at=None):
+        """Écrit les sections du rapport HTML dans le fichier ouvert f (daté de generated_at, par défaut maintenant)"""
+        generated_at = generated_at or datetime.now()
+        # Échapper une seule fois URLs, ancres et titres issus du crawl. Les données du
+        # graphique sont exclues : insérées en JSON (« < » échappé en \u003c pour ne pas fermer
+        # la balise <script>), elles sont affichées par ext_graphique_reseau.js via .text()
+        network_data = analysis.get('network_data')
+        raw_analysis = analysis  # Textes tronqués avant d'être échappés (shorten_html)
+        analysis = escape_html_data({k: v for k, v in analysis.items() if k != 'network_data'})
+        if network_data is not None:
+            analysis['network_data'] = network_data
+        website_url = escape(website_url, quote=False) if website_url else website_url
+        url_filter = escape(url_filter, quote=False) if url_filter else url_filter
+        source_name = escape(os.path.basename(source_file), quote=False)
+        
+        write = f.write
         stats = analysis['stats']
         
+        # Statistiques formatées une seule fois (certaines reviennent dans les recommandations)
+        stats_fmt = {
+            'total_pages': f"{stats['total_pages']:,}",
+            'editorial_links': f"{stats['editorial_links']:,}",
+            'editorial_ratio': f"{stats['editorial_ratio']:.1f}",
+            'avg_editorial_per_page': f"{stats['avg_editorial_per_page']:.1f}",
+        }
+        
         # Score de qualité
         quality_score = analysis.get('editorial_quality_score', 0)
-        score_color = '#28a745' if quality_score >= 80 else '#ffc107' if quality_score >= 60 else '#dc3545'
+        quality_band = bisect.bisect_right(QUALITY_SCORE_THRESHOLDS, quality_score)
+        score_color = SCORE_BAND_COLORS[quality_band]
         
-        html_content = f"""
+        self.install_report_asset(REPORT_STYLESHEET_FILE)
+        write(f"""
         <!DOCTYPE html>
         <html>
         <head>
             <meta charset="UTF-8">
             <title>Audit de Maillage Interne - {website_url}</title>
-            <style>
-                body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', sans-serif; margin: 40px; line-height: 1.6; color: #333; background: #f8f9fa; }}
-                .container {{ max-width: 1200px; margin: 0 auto; }}
-                .header {{ background: linear-gradient(135deg, #667eea 0%, #764ba2 100%); color: white; padding: 30px; border-radius: 10px; margin-bottom: 30px; text-align: center; }}
-                .meta {{ background: white; padding: 15px; border-radius: 8px; margin-bottom: 20px; border-left: 4px solid #6c757d; }}
-                .stats-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(200px, 1fr)); gap: 20px; margin: 20px 0; }}
-                .stat-card {{ background: white; padding: 20px; border-radius: 8px; border-left: 4px solid #007bff; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                .stat-card.quality {{ border-left-color: {score_color}; }}
-                .stat-number {{ font-size: 2.5em; font-weight: bold; color: #007bff; }}
-                .stat-number.quality {{ color: {score_color}; }}
-                .stat-label {{ color: #6c757d; font-size: 0.9em; }}
-                .warning {{ background: #fff3cd; border-left: 4px solid #ffc107; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                .success {{ background: #d4edda; border-left: 4px solid #28a745; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                .danger {{ background: #f8d7da; border-left: 4px solid #dc3545; padding: 15px; margin: 15px 0; border-radius: 5px; }}
-                .section {{ background: white; padding: 20px; margin: 20px 0; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-                table {{ border-collapse: collapse; width: 100%; margin: 20px 0; }}
-                th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #e1e5e9; }}
-                th {{ background-color: #f8f9fa; font-weight: 600; }}
-                tr:hover {{ background-color: #f8f9fa; }}
-                .url {{ word-break: break-all; max-width: 500px; font-family: monospace; font-size: 0.85em; }}
-                .recommendations {{ background: #e3f2fd; padding: 20px; border-radius: 8px; border-left: 4px solid #2196f3; }}
-                ul.orphan-list {{ max-height: 300px; overflow-y: auto; background: #f8f9fa; padding: 15px; border-radius: 5px; }}
-                .progress-bar {{ width: 100%; height: 20px; background: #e9ecef; border-radius: 10px; overflow: hidden; margin: 10px 0; }}
-                .progress-fill {{ height: 100%; background: linear-gradient(90deg, #dc3545 0%, #ffc107 50%, #28a745 100%); transition: width 0.3s; }}
-                .keyword-cloud {{ display: flex; flex-wrap: wrap; gap: 10px; margin: 15px 0; }}
-                .keyword-tag {{ background: #e9ecef; padding: 5px 10px; border-radius: 15px; font-size: 0.85em; }}
-                .chart-container {{ display: grid; grid-template-columns: 1fr 1fr; gap: 20px; margin: 20px 0; }}
-                .chart {{ background: white; padding: 15px; border-radius: 8px; text-align: center; }}
-                .bar-chart {{ margin: 15px 0; }}
-                .bar-item {{ margin: 8px 0; display: flex; align-items: center; }}
-                .bar-label {{ min-width: 120px; font-size: 0.9em; margin-right: 10px; }}
-                .bar-container {{ flex: 1; display: flex; align-items: center; }}
-                .bar-fill {{ height: 20px; background: linear-gradient(90deg, #36A2EB, #4BC0C0); border-radius: 10px; margin-right: 8px; min-width: 2px; }}
-                .bar-value {{ font-weight: bold; color: #333; min-width: 30px; }}
-                .pie-chart {{ margin: 15px 0; }}
-                .pie-item {{ margin: 8px 0; display: flex; align-items: center; }}
-                .pie-color {{ width: 16px; height: 16px; border-radius: 50%; margin-right: 8px; }}
-                .pie-label {{ font-size: 0.9em; }}
-                
-                /* Styles pour l'analyse sémantique */
-                .semantic-analysis {{ margin: 20px 0; }}
-                .pie-chart-semantic {{ margin: 15px 0; }}
-                .pie-item-semantic {{ margin: 8px 0; display: flex; align-items: center; }}
-                .pie-label-semantic {{ font-size: 0.9em; font-weight: 500; }}
-                .themes-detail {{ margin: 15px 0; }}
-                .theme-item {{ margin: 15px 0; padding: 10px; border-radius: 8px; background: #f8f9fa; }}
-                .theme-header {{ display: flex; justify-content: space-between; align-items: center; margin-bottom: 8px; }}
-                .theme-name {{ font-weight: bold; color: #333; }}
-                .theme-count {{ font-size: 0.9em; color: #666; }}
-                .theme-bar-container {{ width: 100%; height: 20px; background: #e9ecef; border-radius: 10px; margin-bottom: 8px; }}
-                .theme-bar {{ height: 100%; border-radius: 10px; }}
-                .theme-examples {{ display: flex; flex-wrap: wrap; gap: 5px; }}
-                .anchor-example {{ background: #e3f2fd; padding: 2px 6px; border-radius: 12px; font-size: 0.8em; color: #1976d2; }}
-                .anchor-more {{ font-style: italic; color: #666; font-size: 0.8em; }}
-                
-                /* Nuages de mots par thème */
-                .word-clouds-container {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(300px, 1fr)); gap: 20px; margin: 20px 0; }}
-                .word-cloud-theme {{ background: white; padding: 15px; border-radius: 8px; }}
-                .word-cloud-mini {{ display: flex; flex-wrap: wrap; gap: 8px; margin-top: 10px; }}
-                .word-mini {{ padding: 3px 8px; background: rgba(0,0,0,0.05); border-radius: 12px; font-weight: 500; }}
-                
-                /* Analyses de cohérence et opportunités */
-                .coherence-analysis, .opportunities-analysis {{ margin: 25px 0; padding: 20px; background: #f8f9fa; border-radius: 8px; }}
-                #network-graph {{ width: 100%; height: 600px; border: 1px solid #e1e5e9; border-radius: 8px; background: white; }}
-                .network-controls {{ margin: 15px 0; text-align: center; }}
-                .network-controls button {{ margin: 0 5px; padding: 8px 16px; border: 1px solid #007bff; background: white; color: #007bff; border-radius: 4px; cursor: pointer; }}
-                .network-controls button:hover {{ background: #007bff; color: white; }}
-                .network-controls button.active {{ background: #007bff; color: white; }}
-                .tooltip {{ position: absolute; background: rgba(0,0,0,0.8); color: white; padding: 8px; border-radius: 4px; font-size: 12px; pointer-events: none; z-index: 1000; }}
-            </style>
+            <link rel="stylesheet" href="{REPORT_STYLESHEET_FILE}">
+            <style>:root {{ --score-color: {score_color}; }}</style>
             <script src="https://d3js.org/d3.v7.min.js"></script>
+            <script src="https://unpkg.com/d3-force-reuse@1"></script>
         </head>
         <body>
             <div class="container">
                 <div class="header">
                     <h1>Audit de maillage interne</h1>
                     <p><strong>Site:</strong> {website_url}</p>
-                    <p><strong>Date:</strong> {datetime.now().strftime("%d/%m/%Y à %H:%M")}</p>
+                    <p><strong>Date:</strong> {generated_at.strftime("%d/%m/%Y à %H:%M")}</p>
                 </div>
                 
                 <div class="meta">
-                    <strong>Fichier source :</strong> {os.path.basename(source_file)}<br>
-                    <strong>Script :</strong> Audit automatisé de maillage interne v2.0"""
+                    <strong>Fichier source :</strong> {source_name}<br>
+                    <strong>Script :</strong> Audit automatisé de maillage interne v2.0""")
         
         if url_filter:
-            html_content += f"""<br>
-                    <strong>🎯 Filtre appliqué:</strong> URLs commençant par {url_filter}"""
+            write(f"""<br>
+                    <strong>🎯 Filtre appliqué:</strong> URLs commençant par {url_filter}""")
         
-        html_content += f"""
+        write(f"""
                 </div>
                 
                 <div class="stats-grid">
                     <div class="stat-card">
-                        <div class="stat-number">{stats['total_pages']:,}</div>
+                        <div class="stat-number">{stats_fmt['total_pages']}</div>
                         <div class="stat-label">Pages analysées</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number">{stats['editorial_links']:,}</div>
+                        <div class="stat-number">{stats_fmt['editorial_links']}</div>
                         <div class="stat-label">Liens éditoriaux</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number">{stats['editorial_ratio']:.1f}%</div>
+                        <div class="stat-number">{stats_fmt['editorial_ratio']}%</div>
                         <div class="stat-label">Ratio éditorial</div>
                     </div>
                     <div class="stat-card quality">
@@ -2503,7 +3029,7 @@ class CompleteLinkAuditor:
                         <div class="stat-label">Score qualité</div>
                     </div>
                     <div class="stat-card">
-                        <div class="stat-number">{stats['avg_editorial_per_page']:.1f}</div>
+                        <div class="stat-number">{stats_fmt['avg_editorial_per_page']}</div>
                         <div class="stat-label">Liens éditoriaux/page</div>
                     </div>
                 </div>
@@ -2513,219 +3039,24 @@ class CompleteLinkAuditor:
                     <div class="progress-bar">
                         <div class="progress-fill" style="width: {quality_score}%"></div>
                     </div>
-                    <p><strong>{quality_score}/100</strong> - """
+                    <p><strong>{quality_score}/100</strong> - """)
         
-        if quality_score >= 80:
-            html_content += """<span style="color: #28a745;">Excellente qualité</span></p>"""
-        elif quality_score >= 60:
-            html_content += """<span style="color: #ffc107;">Qualité moyenne</span></p>"""
-        else:
-            html_content += """<span style="color: #dc3545;">Qualité à améliorer</span></p>"""
+        write(f"""<span style="color: {score_color};">{QUALITY_SCORE_LABELS[quality_band]}</span></p>""")
         
-        html_content += "</div>"
+        write("</div>")
         
         # Graphique de réseau du maillage interne
         if 'network_data' in analysis and analysis['network_data']['nodes']:
             network_data = analysis['network_data']
-            html_content += f"""
-            <div class="section">
-                <h2>Graphique du maillage interne</h2>
-                <p>Visualisation interactive des liens éditoriaux entre les pages. La taille des nœuds correspond au nombre de liens entrants.</p>
-                
-                <div class="network-controls">
-                    <button onclick="resetZoom()" class="active">Réinitialiser vue</button>
-                    <button onclick="toggleLabels()">Basculer libellés</button>
-                    <button onclick="highlightOrphans()">Surligner orphelines</button>
-                </div>
-                
-                <div id="network-graph"></div>
-                
-                <p style="margin-top: 15px; color: #6c757d; font-size: 0.9em;">
-                    <strong>Légende :</strong> 
-                    Taille = liens entrants | 
-                    Vert = bien connecté | 
-                    Jaune = moyennement connecté | 
-                    Rouge = peu connecté
-                </p>
-            </div>
-            
-            <script>
-            // Données du réseau
-            const networkData = {json.dumps(network_data, ensure_ascii=False)};
-            
-            // Configuration du graphique
-            const width = 1160;
-            const height = 600;
-            const margin = {{top: 20, right: 20, bottom: 20, left: 20}};
-            
-            // Créer le SVG
-            const svg = d3.select("#network-graph")
-                .append("svg")
-                .attr("width", width)
-                .attr("height", height);
-            
-            const g = svg.append("g");
-            
-            // Zoom
-            const zoom = d3.zoom()
-                .scaleExtent([0.1, 3])
-                .on("zoom", function(event) {{
-                    g.attr("transform", event.transform);
-                }});
-            
-            svg.call(zoom);
-            
-            // Échelles pour la taille et couleur des nœuds
-            const maxInbound = d3.max(networkData.nodes, d => d.inbound) || 1;
-            const radiusScale = d3.scaleSqrt()
-                .domain([0, maxInbound])
-                .range([4, 25]);
-            
-            const colorScale = d3.scaleLinear()
-                .domain([0, maxInbound * 0.3, maxInbound * 0.7, maxInbound])
-                .range(['#dc3545', '#ffc107', '#28a745', '#007bff']);
-            
-            // Simulation de forces
-            const simulation = d3.forceSimulation(networkData.nodes)
-                .force("link", d3.forceLink(networkData.edges).id(d => d.id).distance(80))
-                .force("charge", d3.forceManyBody().strength(-300))
-                .force("center", d3.forceCenter(width / 2, height / 2))
-                .force("collision", d3.forceCollide().radius(d => radiusScale(d.inbound) + 2));
-            
-            // Créer les liens
-            const links = g.append("g")
-                .selectAll("line")
-                .data(networkData.edges)
-                .enter().append("line")
-                .attr("stroke", "#999")
-                .attr("stroke-opacity", 0.6)
-                .attr("stroke-width", 1);
-            
-            // Créer les nœuds
-            const nodes = g.append("g")
-                .selectAll("circle")
-                .data(networkData.nodes)
-                .enter().append("circle")
-                .attr("r", d => radiusScale(d.inbound))
-                .attr("fill", d => colorScale(d.inbound))
-                .attr("stroke", "#fff")
-                .attr("stroke-width", 1.5)
-                .call(d3.drag()
-                    .on("start", dragstarted)
-                    .on("drag", dragged)
-                    .on("end", dragended));
-            
-            // Labels des nœuds
-            const labels = g.append("g")
-                .selectAll("text")
-                .data(networkData.nodes)
-                .enter().append("text")
-                .text(d => d.label)
-                .attr("font-size", "10px")
-                .attr("text-anchor", "middle")
-                .attr("dy", ".35em")
-                .attr("fill", "#333")
-                .style("pointer-events", "none")
-                .style("opacity", 0.8);
-            
-            // Tooltip
-            const tooltip = d3.select("body").append("div")
-                .attr("class", "tooltip")
-                .style("opacity", 0);
-            
-            // Events pour les nœuds
-            nodes.on("mouseover", function(event, d) {{
-                    tooltip.transition().duration(200).style("opacity", .9);
-                    tooltip.html(`
-                        <strong>${{d.label}}</strong><br/>
-                        Liens entrants: ${{d.inbound}}<br/>
-                        Liens sortants: ${{d.outbound}}<br/>
-                        <small>${{d.id}}</small>
-                    `)
-                    .style("left", (event.pageX + 10) + "px")
-                    .style("top", (event.pageY - 28) + "px");
-                }})
-                .on("mouseout", function(d) {{
-                    tooltip.transition().duration(500).style("opacity", 0);
-                }});
-            
-            // Animation de la simulation
-            simulation.on("tick", () => {{
-                links
-                    .attr("x1", d => d.source.x)
-                    .attr("y1", d => d.source.y)
-                    .attr("x2", d => d.target.x)
-                    .attr("y2", d => d.target.y);
-                
-                nodes
-                    .attr("cx", d => d.x)
-                    .attr("cy", d => d.y);
-                
-                labels
-                    .attr("x", d => d.x)
-                    .attr("y", d => d.y);
-            }});
-            
-            // Fonctions de contrôle
-            let labelsVisible = true;
-            let orphansHighlighted = false;
-            
-            function resetZoom() {{
-                svg.transition().duration(750).call(
-                    zoom.transform,
-                    d3.zoomIdentity
-                );
-            }}
-            
-            function toggleLabels() {{
-                labelsVisible = !labelsVisible;
-                labels.style("opacity", labelsVisible ? 0.8 : 0);
-                
-                // Mettre à jour le bouton
-                d3.select('button:nth-child(2)')
-                    .classed('active', labelsVisible);
-            }}
-            
-            function highlightOrphans() {{
-                orphansHighlighted = !orphansHighlighted;
-                
-                nodes.attr("stroke", d => {{
-                    if (orphansHighlighted && d.inbound === 0) {{
-                        return "#ff0000";
-                    }}
-                    return "#fff";
-                }})
-                .attr("stroke-width", d => {{
-                    if (orphansHighlighted && d.inbound === 0) {{
-                        return 3;
-                    }}
-                    return 1.5;
-                }});
-                
-                // Mettre à jour le bouton
-                d3.select('button:nth-child(3)')
-                    .classed('active', orphansHighlighted);
-            }}
-            
-            // Fonctions de drag
-            function dragstarted(event, d) {{
-                if (!event.active) simulation.alphaTarget(0.3).restart();
-                d.fx = d.x;
-                d.fy = d.y;
-            }}
-            
-            function dragged(event, d) {{
-                d.fx = event.x;
-                d.fy = event.y;
-            }}
-            
-            function dragended(event, d) {{
-                if (!event.active) simulation.alphaTarget(0);
-                d.fx = null;
-                d.fy = null;
-            }}
-            </script>
-            """
+            self.install_report_asset(NETWORK_SCRIPT_FILE)
+            write(NETWORK_SECTION_HTML)
+            # « < » n'apparaît que dans les chaînes JSON : l'échapper empêche une URL ou un
+            # libellé contenant </script> de sortir du bloc de données
+            if ORJSON_AVAILABLE:
+                write(orjson.dumps(network_data).replace(b'<', b'\\u003c').decode('utf-8'))
+            else:
+                write(json.dumps(network_data, ensure_ascii=False).replace('<', '\\u003c'))
+            write(NETWORK_SECTION_SCRIPT)
         
         # Analyses de qualité du contenu
         if 'content_quality' in analysis:
@@ -2734,7 +3065,9 @@ class CompleteLinkAuditor:
             # Analyse du nombre de mots
             if 'word_analysis' in content_analysis:
                 word_data = content_analysis['word_analysis']
-                html_content += f"""
+                thin_pages = word_data['thin_content']
+                thin_count = len(thin_pages)
+                write(f"""
                 <div class="section">
                     <h2>Qualité du contenu</h2>
                     <h3>Analyse du nombre de mots</h3>
@@ -2748,33 +3081,34 @@ class CompleteLinkAuditor:
                         </div>
                         <div class="chart">
                             <h4>Classification</h4>
-                            <p>Contenu thin (&lt;300) : <strong>{len(word_data['thin_content'])}</strong></p>
+                            <p>Contenu thin (&lt;300) : <strong>{thin_count}</strong></p>
                             <p>Contenu qualité (300-1500) : <strong>{len(word_data['quality_content'])}</strong></p>
                             <p>Contenu riche (&gt;1500) : <strong>{len(word_data['rich_content'])}</strong></p>
                         </div>
                     </div>
-                """
+                """)
                 
                 # Afficher les pages thin content comme recommandations
-                if word_data['thin_content']:
-                    html_content += """
+                if thin_pages:
+                    write("""
                     <div class="warning">
                         <h4>Pages avec contenu thin (&lt; 300 mots)</h4>
                         <p>Ces pages ont peu de contenu et devraient être évitées pour le maillage entrant ou enrichies :</p>
                         <ul>
-                    """
-                    for page in word_data['thin_content'][:10]:  # Limiter à 10
-                        html_content += f"<li><strong>{page['word_count']} mots</strong> - {page['url']}</li>"
-                    if len(word_data['thin_content']) > 10:
-                        html_content += f"<li><em>... et {len(word_data['thin_content']) - 10} autres pages</em></li>"
-                    html_content += "</ul></div>"
+                    """)
+                    for page in islice(thin_pages, 10):  # Limiter à 10
+                        write(f"<li><strong>{page['word_count']} mots</strong> - {page['url']}</li>")
+                    if thin_count > 10:
+                        write(f"<li><em>... et {thin_count - 10} autres pages</em></li>")
+                    write("</ul></div>")
                 
-                html_content += "</div>"
+                write("</div>")
             
             # Analyse de cohérence Title/H1
             if 'title_h1_coherence' in content_analysis:
                 coherence_data = content_analysis['title_h1_coherence']
-                html_content += f"""
+                different_pages = coherence_data['different']
+                write(f"""
                 <div class="section">
                     <h2>Cohérence title / H1</h2>
                     
@@ -2784,7 +3118,7 @@ class CompleteLinkAuditor:
                             <p>Pages analysées : <strong>{coherence_data['total_pages_with_both']:,}</strong></p>
                             <p>✅ Identiques: <strong>{len(coherence_data['identical'])}</strong></p>
                             <p>🟡 Similaires: <strong>{len(coherence_data['similar'])}</strong></p>
-                            <p>🔴 Différents: <strong>{len(coherence_data['different'])}</strong></p>
+                            <p>🔴 Différents: <strong>{len(different_pages)}</strong></p>
                         </div>
                         <div class="chart">
                             <h4>Problèmes détectés</h4>
@@ -2792,31 +3126,32 @@ class CompleteLinkAuditor:
                             <p>❌ Title manquant: <strong>{len(coherence_data['missing_title'])}</strong></p>
                         </div>
                     </div>
-                """
+                """)
                 
                 # Afficher les incohérences
-                if coherence_data['different']:
-                    html_content += """
+                if different_pages:
+                    write("""
                     <div class="warning">
                         <h4>Pages avec title et H1 très différents</h4>
                         <p>Ces pages ont une incohérence qui peut nuire au SEO :</p>
                         <table>
                             <tr><th>URL</th><th>Title</th><th>H1</th></tr>
-                    """
-                    for page in coherence_data['different'][:5]:  # Limiter à 5
-                        html_content += f"""<tr>
+                    """)
+                    raw_different_pages = raw_analysis['content_quality']['title_h1_coherence']['different']
+                    for page, raw_page in islice(zip(different_pages, raw_different_pages), 5):  # Limiter à 5
+                        write(f"""<tr>
                             <td class='url'>{page['url']}</td>
-                            <td>{page['title'][:60]}{'...' if len(page['title']) > 60 else ''}</td>
-                            <td>{page['h1'][:60]}{'...' if len(page['h1']) > 60 else ''}</td>
-                        </tr>"""
-                    html_content += "</table></div>"
+                            <td>{shorten_html(raw_page['title'], 60)}</td>
+                            <td>{shorten_html(raw_page['h1'], 60)}</td>
+                        </tr>""")
+                    write("</table></div>")
                 
-                html_content += "</div>"
+                write("</div>")
             
             # Analyse des pages de conversion
             if 'conversion_pages' in content_analysis:
                 conversion_data = content_analysis['conversion_pages']
-                html_content += f"""
+                write(f"""
                 <div class="section">
                     <h2>Pages de conversion identifiées</h2>
                     <p>Ces pages sont cruciales pour votre business et doivent être bien maillées !</p>
@@ -2827,100 +3162,86 @@ class CompleteLinkAuditor:
                     </div>
                     
                     <div class="chart-container">
-                """
+                """)
                 
                 # Afficher par catégorie
                 categories_with_pages = {k: v for k, v in conversion_data['by_category'].items() if v}
                 for category, pages in categories_with_pages.items():
-                    html_content += f"""
-                    <div class="chart">
-                        <h4>{category.title().lower().capitalize()}</h4>
-                        <p><strong>{len(pages)} pages</strong></p>
-                        <ul>
-                    """
-                    for page in pages[:3]:  # Afficher les 3 premières
-                        html_content += f"<li>{page['url']}</li>"
-                    if len(pages) > 3:
-                        html_content += f"<li><em>... et {len(pages) - 3} autres</em></li>"
-                    html_content += "</ul></div>"
+                    page_count = len(pages)
+                    write(CONVERSION_CARD_HTML.format(
+                        title=category.title().lower().capitalize(), page_count=page_count))
+                    for page in islice(pages, 3):  # Afficher les 3 premières
+                        write(f"<li>{page['url']}</li>")
+                    if page_count > 3:
+                        write(f"<li><em>... et {page_count - 3} autres</em></li>")
+                    write("</ul></div>")
                 
-                html_content += """
-                    </div>
-                    
-                    <div class="recommendations">
-                        <h4>Recommandations pour les pages de conversion</h4>
-                        <ul>
-                            <li><strong>Maillage entrant renforcé</strong> : Ces pages doivent recevoir plus de liens éditoriaux</li>
-                            <li><strong>Ancres contextuelles</strong> : Utilisez des ancres qui expliquent la valeur ajoutée</li>
-                            <li><strong>Position stratégique</strong> : Placez les liens dans le contenu, pas seulement en navigation</li>
-                            <li><strong>Pages de contenu vers conversion</strong> : Liez depuis vos articles vers ces pages</li>
-                        </ul>
-                    </div>
-                </div>
-                """
+                write(CONVERSION_RECOMMENDATIONS_HTML)
         
         # Qualité des ancres
         if 'anchor_quality' in analysis:
             anchor_quality = analysis['anchor_quality']
-            html_content += f"""
+            too_short = anchor_quality.get('too_short', [])
+            keyword_stuffed = anchor_quality.get('keyword_stuffed', [])
+            write(f"""
             <div class="section">
                 <h2>Qualité des ancres éditoriales</h2>
                 <div class="chart-container">
                     <div class="chart">
                         <h4>Répartition</h4>
                         <p>Bonne qualité : <strong>{len(anchor_quality.get('good_quality', []))}</strong></p>
-                        <p>Trop courtes : <strong>{len(anchor_quality.get('too_short', []))}</strong></p>
+                        <p>Trop courtes : <strong>{len(too_short)}</strong></p>
                         <p>Trop longues : <strong>{len(anchor_quality.get('too_long', []))}</strong></p>
-                        <p>Sur-optimisées : <strong>{len(anchor_quality.get('keyword_stuffed', []))}</strong></p>
+                        <p>Sur-optimisées : <strong>{len(keyword_stuffed)}</strong></p>
                     </div>
                 </div>
-            """
+            """)
             
-            if anchor_quality.get('too_short'):
-                html_content += """
+            if too_short:
+                write("""
                 <div class="warning">
                     <h4>Ancres trop courtes (exemples)</h4>
                     <ul>
-                """
-                for item in anchor_quality['too_short'][:5]:
-                    html_content += f"<li><strong>'{item['anchor']}'</strong> → {item['dest']}</li>"
-                html_content += "</ul></div>"
+                """)
+                for item in islice(too_short, 5):
+                    write(f"<li><strong>'{item['anchor']}'</strong> → {item['dest']}</li>")
+                write("</ul></div>")
             
-            if anchor_quality.get('keyword_stuffed'):
-                html_content += """
+            if keyword_stuffed:
+                write("""
                 <div class="danger">
                     <h4>Ancres potentiellement sur-optimisées</h4>
                     <ul>
-                """
-                for item in anchor_quality['keyword_stuffed'][:5]:
-                    html_content += f"<li><strong>'{item['anchor']}'</strong> → {item['dest']}</li>"
-                html_content += "</ul></div>"
+                """)
+                for item in islice(keyword_stuffed, 5):
+                    write(f"<li><strong>'{item['anchor']}'</strong> → {item['dest']}</li>")
+                write("</ul></div>")
             
-            html_content += "</div>"
+            write("</div>")
         
         # Distribution thématique
         if 'thematic_distribution' in analysis:
             thematic = analysis['thematic_distribution']
-            html_content += """
+            write("""
             <div class="section">
                 <h2>Distribution thématique</h2>
-            """
+            """)
             
             if thematic.get('top_anchor_keywords'):
                 # Créer des graphiques simples en barres avec CSS
-                keywords_data = list(thematic['top_anchor_keywords'].items())[:10]  # Top 10
+                keywords_data = list(islice(thematic['top_anchor_keywords'].items(), 10))  # Top 10
                 max_count = max([count for _, count in keywords_data]) if keywords_data else 1
                 
-                html_content += """
+                write("""
                 <div class="chart-container">
                     <div class="chart">
                         <h4>Mots-clés principaux dans les ancres</h4>
                         <div class="bar-chart">
-                """
+                """)
                 
                 for keyword, count in keywords_data:
                     percentage = (count / max_count) * 100
-                    html_content += f"""
+                    write(f"""
                             <div class="bar-item">
                                 <span class="bar-label">{keyword}</span>
                                 <div class="bar-container">
@@ -2928,121 +3249,123 @@ class CompleteLinkAuditor:
                                     <span class="bar-value">{count}</span>
                                 </div>
                             </div>
-                    """
+                    """)
                 
-                html_content += """
+                write("""
                         </div>
                     </div>
-                """
+                """)
             
             if thematic.get('destination_categories'):
                 categories_data = list(thematic['destination_categories'].items())
                 total_categories = sum([count for _, count in categories_data]) if categories_data else 1
                 
-                html_content += """
+                write("""
                     <div class="chart">
                         <h4>Types de pages liées</h4>
                         <div class="pie-chart">
-                """
+                """)
                 
                 colors = ['#FF6384', '#36A2EB', '#FFCE56', '#4BC0C0', '#9966FF']
-                for i, (category, count) in enumerate(categories_data):
-                    percentage = (count / total_categories) * 100
-                    color = colors[i % len(colors)]
-                    html_content += f"""
+                share_scale = 100 / total_categories
+                for (category, count), color in zip(categories_data, cycle(colors)):
+                    percentage = count * share_scale
+                    write(f"""
                             <div class="pie-item">
                                 <span class="pie-color" style="background-color: {color}"></span>
                                 <span class="pie-label">{category}: {count} ({percentage:.1f}%)</span>
                             </div>
-                    """
+                    """)
                 
-                html_content += """
+                write("""
                         </div>
                     </div>
                 </div>
-                """
+                """)
             else:
-                html_content += """
+                write("""
                 </div>
-                """
+                """)
             
             # Afficher aussi le nuage de mots-clés en complément
             if thematic.get('top_anchor_keywords'):
-                html_content += """
+                write("""
                 <h4>Nuage de mots-clés</h4>
                 <div class="keyword-cloud">
-                """
-                for keyword, count in list(thematic['top_anchor_keywords'].items())[:15]:
-                    html_content += f"""<span class="keyword-tag">{keyword} ({count})</span>"""
-                html_content += "</div>"
+                """)
+                for keyword, count in islice(thematic['top_anchor_keywords'].items(), 15):
+                    write(f"""<span class="keyword-tag">{keyword} ({count})</span>""")
+                write("</div>")
             
-            html_content += "</div>"
+            write("</div>")
         
         # Analyse sémantique avancée CamemBERT
         if 'advanced_semantic' in analysis and analysis['advanced_semantic']:
-            html_content += self.generate_semantic_analysis_section(analysis['advanced_semantic'])
+            write(self.generate_semantic_analysis_section(analysis['advanced_semantic']))
         
         # Pages les plus liées
         if analysis['most_linked_pages']:
-            html_content += """
+            write("""
             <div class="section">
                 <h2>Pages les plus liées (liens entrants éditoriaux)</h2>
                 <table>
                     <tr><th>URL</th><th>Liens entrants</th></tr>
-            """
-            for url, count in list(analysis['most_linked_pages'].items())[:15]:
-                html_content += f"<tr><td class='url'>{url}</td><td><strong>{count}</strong></td></tr>"
-            html_content += "</table></div>"
+            """)
+            for url, count in islice(analysis['most_linked_pages'].items(), 15):
+                write(f"<tr><td class='url'>{url}</td><td><strong>{count}</strong></td></tr>")
+            write("</table></div>")
         
         # Pages orphelines
-        if analysis['orphan_pages']:
-            html_content += f"""
+        orphan_pages = analysis['orphan_pages']
+        orphan_count = len(orphan_pages)
+        if orphan_pages:
+            write(f"""
             <div class="section">
                 <h2>Pages orphelines</h2>
                 <div class="warning">
-                    <p><strong>{len(analysis['orphan_pages'])} pages sans liens entrants éditoriaux:</strong></p>
+                    <p><strong>{orphan_count} pages sans liens entrants éditoriaux:</strong></p>
                     <ul class="orphan-list">
-            """
-            for orphan in analysis['orphan_pages'][:30]:
-                html_content += f"<li class='url'>{orphan}</li>"
-            if len(analysis['orphan_pages']) > 30:
-                html_content += f"<li><em>... et {len(analysis['orphan_pages']) - 30} autres</em></li>"
-            html_content += "</ul></div></div>"
+            """)
+            for orphan in islice(orphan_pages, 30):
+                write(f"<li class='url'>{orphan}</li>")
+            if orphan_count > 30:
+                write(f"<li><em>... et {orphan_count - 30} autres</em></li>")
+            write("</ul></div></div>")
         
         # Ancres sur-optimisées
         if analysis['over_optimized_anchors']:
-            html_content += """
+            write("""
             <div class="section">
                 <h2>Ancres potentiellement sur-optimisées</h2>
                 <div class="warning">
                     <table>
                         <tr><th>Ancre</th><th>Occurrences</th></tr>
-            """
-            for anchor, count in list(analysis['over_optimized_anchors'].items())[:10]:
-                html_content += f"<tr><td>{anchor}</td><td><strong>{count}</strong></td></tr>"
-            html_content += "</table></div></div>"
+            """)
+            for anchor, count in islice(analysis['over_optimized_anchors'].items(), 10):
+                write(f"<tr><td>{anchor}</td><td><strong>{count}</strong></td></tr>")
+            write("</table></div></div>")
         
         # Recommandations personnalisées
-        html_content += f"""
+        write(f"""
             <div class="recommendations">
                 <h2>Recommandations prioritaires</h2>
                 <ul>
-        """
+        """)
         
         # Recommandations dynamiques basées sur l'analyse
-        if len(analysis['orphan_pages']) > 0:
-            html_content += f"<li><strong>Pages orphelines ({len(analysis['orphan_pages'])}):</strong> Créer des liens éditoriaux contextuels depuis vos contenus les plus populaires</li>"
+        if orphan_count > 0:
+            write(f"<li><strong>Pages orphelines ({orphan_count}):</strong> Créer des liens éditoriaux contextuels depuis vos contenus les plus populaires</li>")
         
         if stats['editorial_ratio'] < 50:
-            html_content += f"<li><strong>Ratio éditorial faible ({stats['editorial_ratio']:.1f}%):</strong> Augmenter les liens éditoriaux dans vos contenus</li>"
+            write(f"<li><strong>Ratio éditorial faible ({stats_fmt['editorial_ratio']}%):</strong> Augmenter les liens éditoriaux dans vos contenus</li>")
         
         if analysis.get('anchor_quality', {}).get('too_short'):
-            html_content += f"<li><strong>Ancres trop courtes:</strong> Améliorer {len(analysis['anchor_quality']['too_short'])} ancres avec des descriptions plus précises</li>"
+            write(f"<li><strong>Ancres trop courtes:</strong> Améliorer {len(analysis['anchor_quality']['too_short'])} ancres avec des descriptions plus précises</li>")
         
         if stats['avg_editorial_per_page'] < 2:
-            html_content += f"<li><strong>Maillage insuffisant:</strong> Viser 2-3 liens éditoriaux minimum par page (actuellement {stats['avg_editorial_per_page']:.1f})</li>"
+            write(f"<li><strong>Maillage insuffisant:</strong> Viser 2-3 liens éditoriaux minimum par page (actuellement {stats_fmt['avg_editorial_per_page']})</li>")
         
-        html_content += """
+        write("""
                     <li><strong>Ancres naturelles:</strong> Utiliser des ancres descriptives qui décrivent le contenu de destination</li>
                     <li><strong>Contexte éditorial:</strong> Intégrer les liens dans le corps du texte plutôt qu'en navigation</li>
                     <li><strong>Diversité thématique:</strong> Varier les ancres pour éviter la sur-optimisation</li>
@@ -3051,23 +3374,25 @@ class CompleteLinkAuditor:
         </div>
         </body>
         </html>
-        """
-        
-        with open(report_file, 'w', encoding='utf-8') as f:
-            f.write(html_content)
-        
-        # Générer aussi un export CSV des recommandations
-        csv_export_file = self.generate_csv_export(analysis, website_url, source_file, url_filter)
-        
-        return report_file
-
-    def generate_csv_export(self, analysis, website_url, source_file, url_filter=None):
-        """Génère un export CSV des recommandations"""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        """)
+
+    def install_report_asset(self, filename):
+        """Copie un fichier partagé par les rapports (script, feuille de style) dans le dossier d'export, si absent ou périmé"""
+        source = os.path.join(os.path.dirname(os.path.abspath(__file__)), filename)
+        target = os.path.join(self.config['export_path'], filename)
+        if not os.path.exists(target) or os.path.getmtime(target) < os.path.getmtime(source):
+            shutil.copyfile(source, target)
+
+    def generate_csv_export(self, analysis, website_url, source_file, url_filter=None, timestamp=None):
+        """Génère un export CSV des recommandations (timestamp : celui du rapport HTML associé)"""
+        timestamp = timestamp or datetime.now().strftime("%Y%m%d_%H%M%S")
         csv_file = f"{self.config['export_path']}recommendations_{timestamp}.csv"
+        if self.config.get('compress_reports', False):
+            csv_file += '.gz'
         
         try:
-            with open(csv_file, 'w', encoding='utf-8', newline='') as f:
+            # Tampon de 1 Mo : les gros exports (milliers d'ancres) sont écrits en peu d'appels système
+            with self._open_export(csv_file, newline='') as f:
                 writer = csv.writer(f)
                 
                 # En-têtes
@@ -3075,87 +3400,8 @@ class CompleteLinkAuditor:
                     'Type', 'Priorité', 'URL', 'Problème', 'Recommandation', 'Détails'
                 ])
                 
-                # Pages orphelines
-                for orphan in analysis.get('orphan_pages', []):
-                    writer.writerow([
-                        'Page orpheline',
-                        'Haute',
-                        orphan,
-                        'Aucun lien entrant éditorial',
-                        'Créer des liens éditoriaux contextuels',
-                        'Page sans maillage interne éditorial'
-                    ])
-                
-                # Ancres problématiques
-                if 'anchor_quality' in analysis:
-                    anchor_quality = analysis['anchor_quality']
-                    
-                    # Ancres trop courtes
-                    for item in anchor_quality.get('too_short', []):
-                        writer.writerow([
-                            'Ancre défaillante',
-                            'Moyenne',
-                            item['dest'],
-                            f"Ancre trop courte: '{item['anchor']}'",
-                            'Utiliser une ancre plus descriptive',
-                            f"Ancre actuelle: '{item['anchor']}'"
-                        ])
-                    
-                    # Ancres sur-optimisées
-                    for item in anchor_quality.get('keyword_stuffed', []):
-                        writer.writerow([
-                            'Ancre sur-optimisée',
-                            'Haute',
-                            item['dest'],
-                            f"Ancre potentiellement sur-optimisée: '{item['anchor']}'",
-                            'Diversifier avec des expressions naturelles',
-                            'Risque de pénalité SEO'
-                        ])
-                    
-                    # Ancres URL
-                    for item in anchor_quality.get('url_anchors', []):
-                        writer.writerow([
-                            'Ancre non-optimisée',
-                            'Moyenne',
-                            item['dest'],
-                            f"URL utilisée comme ancre: '{item['anchor']}'",
-                            'Remplacer par une ancre descriptive',
-                            'Les URLs ne sont pas des ancres optimales'
-                        ])
-                
-                # Ancres répétitives
-                for anchor, count in analysis.get('over_optimized_anchors', {}).items():
-                    writer.writerow([
-                        'Ancre répétitive',
-                        'Moyenne',
-                        'Multiple',
-                        f"Ancre utilisée {count} fois: '{anchor}'",
-                        'Diversifier les variantes sémantiques',
-                        f'Répétition excessive ({count} occurrences)'
-                    ])
-                
-                # Recommandations générales basées sur les stats
-                stats = analysis.get('stats', {})
-                
-                if stats.get('editorial_ratio', 0) < 50:
-                    writer.writerow([
-                        'Stratégie globale',
-                        'Haute',
-                        website_url or 'Site entier',
-                        f"Ratio éditorial faible ({stats['editorial_ratio']:.1f}%)",
-                        'Augmenter les liens éditoriaux dans les contenus',
-                        'Moins de 50% de liens éditoriaux'
-                    ])
-                
-                if stats.get('avg_editorial_per_page', 0) < 2:
-                    writer.writerow([
-                        'Densité de maillage',
-                        'Moyenne',
-                        website_url or 'Site entier',
-                        f"Maillage insuffisant ({stats['avg_editorial_per_page']:.1f} liens/page)",
-                        'Viser 2-3 liens éditoriaux minimum par page',
-                        'Maillage interne sous-optimal'
-                    ])
+                # Toutes les recommandations en un seul appel, sans liste intermédiaire
+                writer.writerows(self._recommendation_rows(analysis, website_url))
             
             print(f"📊 Export CSV généré: {csv_file}")
             return csv_file
@@ -3164,100 +3410,272 @@ class CompleteLinkAuditor:
             print(f"⚠️  Erreur lors de la génération du CSV: {e}")
             return None
 
+    def _recommendation_rows(self, analysis, website_url):
+        """Génère les lignes de l'export CSV des recommandations"""
+        # Pages orphelines
+        for orphan in analysis.get('orphan_pages', []):
+            yield (
+                'Page orpheline',
+                'Haute',
+                orphan,
+                'Aucun lien entrant éditorial',
+                'Créer des liens éditoriaux contextuels',
+                'Page sans maillage interne éditorial'
+            )
+        
+        # Ancres problématiques
+        if 'anchor_quality' in analysis:
+            anchor_quality = analysis['anchor_quality']
+            
+            # Ancres trop courtes
+            for item in anchor_quality.get('too_short', []):
+                yield (
+                    'Ancre défaillante',
+                    'Moyenne',
+                    item['dest'],
+                    f"Ancre trop courte: '{item['anchor']}'",
+                    'Utiliser une ancre plus descriptive',
+                    f"Ancre actuelle: '{item['anchor']}'"
+                )
+            
+            # Ancres sur-optimisées
+            for item in anchor_quality.get('keyword_stuffed', []):
+                yield (
+                    'Ancre sur-optimisée',
+                    'Haute',
+                    item['dest'],
+                    f"Ancre potentiellement sur-optimisée: '{item['anchor']}'",
+                    'Diversifier avec des expressions naturelles',
+                    'Risque de pénalité SEO'
+                )
+            
+            # Ancres URL
+            for item in anchor_quality.get('url_anchors', []):
+                yield (
+                    'Ancre non-optimisée',
+                    'Moyenne',
+                    item['dest'],
+                    f"URL utilisée comme ancre: '{item['anchor']}'",
+                    'Remplacer par une ancre descriptive',
+                    'Les URLs ne sont pas des ancres optimales'
+                )
+        
+        # Ancres répétitives
+        for anchor, count in analysis.get('over_optimized_anchors', {}).items():
+            yield (
+                'Ancre répétitive',
+                'Moyenne',
+                'Multiple',
+                f"Ancre utilisée {count} fois: '{anchor}'",
+                'Diversifier les variantes sémantiques',
+                f'Répétition excessive ({count} occurrences)'
+            )
+        
+        # Recommandations générales basées sur les stats
+        stats = analysis.get('stats', {})
+        
+        if stats.get('editorial_ratio', 0) < 50:
+            yield (
+                'Stratégie globale',
+                'Haute',
+                website_url or 'Site entier',
+                f"Ratio éditorial faible ({stats['editorial_ratio']:.1f}%)",
+                'Augmenter les liens éditoriaux dans les contenus',
+                'Moins de 50% de liens éditoriaux'
+            )
+        
+        if stats.get('avg_editorial_per_page', 0) < 2:
+            yield (
+                'Densité de maillage',
+                'Moyenne',
+                website_url or 'Site entier',
+                f"Maillage insuffisant ({stats['avg_editorial_per_page']:.1f} liens/page)",
+                'Viser 2-3 liens éditoriaux minimum par page',
+                'Maillage interne sous-optimal'
+            )
+
     def show_config(self):
         """Affiche et permet de modifier la configuration"""
-        print(f"\n⚙️  CONFIGURATION ACTUELLE")
-        print("="*50)
-        print(f"📍 Screaming Frog: {self.config['screaming_frog_path']}")
-        print(f"📁 Dossier export: {self.config['export_path']}")
-        print(f"📏 Longueur min ancre: {self.config['min_anchor_length']}")
-        print(f"🚫 Extensions ignorées: {', '.join(self.config['ignore_extensions'])}")
-        
-        modify = input("\nModifier la configuration ? (o/N): ").lower()
-        if modify == 'o':
+        # Construit au premier affichage : la configuration ne change pas en cours d'exécution
+        if self._config_banner is None:
+            self._config_banner = "\n".join([
+                "\n⚙️  CONFIGURATION ACTUELLE",
+                "="*50,
+                f"📍 Screaming Frog: {self.config['screaming_frog_path']}",
+                f"📁 Dossier export: {self.config['export_path']}",
+                f"📏 Longueur min ancre: {self.config['min_anchor_length']}",
+                f"🚫 Extensions ignorées: {', '.join(self.config['ignore_extensions'])}",
+            ])
+        print(self._config_banner)
+        
+        if self._ask_yn("\nModifier la configuration ? (o/N): "):
             # Ici on pourrait ajouter la modification de config
             print("Modification de config pas encore implémentée")
 
     def run(self):
         """Lance l'application principale"""
+        self._enable_input_history()
+        actions = {
+            '1': self._menu_new_crawl,
+            '2': self._menu_analyze_existing,
+            '3': self._menu_list_csvs,
+            '4': self.show_config,
+        }
         while True:
             choice = self.show_menu()
             
-            if choice == '1':
-                # Nouveau crawl
-                website_url = input("\n🌐 URL du site à crawler: ").strip()
-                if not website_url:
-                    print("❌ URL requise")
-                    continue
-                
-                # Option de filtrage par préfixe d'URL
-                print("\n🎯 FILTRAGE D'URLs (optionnel)")
-                print("Vous pouvez limiter l'analyse à une section spécifique du site.")
-                print("Exemple: https://monsite.com/blog/ pour ne garder que les pages du blog")
-                
-                url_filter = input("🔍 Préfixe d'URL à conserver (vide = tout le site): ").strip()
-                if url_filter and not url_filter.startswith('http'):
-                    print("⚠️  Le filtre doit commencer par http:// ou https://")
-                    url_filter = None
-                
-                if url_filter:
-                    print(f"✅ Filtrage activé: seules les URLs commençant par '{url_filter}' seront analysées")
-                
-                csv_file = self.run_new_crawl(website_url, url_filter)
-                if csv_file:
-                    input("\n⏸️  Appuyez sur Entrée pour lancer l'analyse...")
-                    self.analyze_csv(csv_file, website_url, url_filter)
-                
-            elif choice == '2':
-                # Analyser CSV existant
-                csv_files = self.list_existing_csvs()
-                if not csv_files:
-                    input("\n⏸️  Appuyez sur Entrée pour continuer...")
-                    continue
-                
-                while True:
-                    try:
-                        file_choice = input(f"\nChoisir un fichier (1-{len(csv_files)}) ou 'r' pour retour: ").strip()
-                        if file_choice.lower() == 'r':
-                            break
-                        
-                        file_index = int(file_choice) - 1
-                        if 0 <= file_index < len(csv_files):
-                            selected_file = csv_files[file_index]
-                            website_url = input("🌐 URL du site (optionnel): ").strip() or None
-                            
-                            # Option de filtrage pour CSV existant aussi
-                            url_filter = None
-                            if website_url:
-                                print("\n🎯 FILTRAGE D'URLs (optionnel)")
-                                url_filter = input("🔍 Préfixe d'URL à conserver (vide = tout): ").strip() or None
-                                if url_filter and not url_filter.startswith('http'):
-                                    print("⚠️  Le filtre doit commencer par http:// ou https://")
-                                    url_filter = None
-                            
-                            self.analyze_csv(selected_file, website_url, url_filter)
-                            break
-                        else:
-                            print("❌ Numéro invalide")
-                    except ValueError:
-                        print("❌ Veuillez entrer un numéro")
-                
-            elif choice == '3':
-                # Lister CSV
-                self.list_existing_csvs()
-                input("\n⏸️  Appuyez sur Entrée pour continuer...")
-                
-            elif choice == '4':
-                # Configuration
-                self.show_config()
-                
-            elif choice == '5':
+            if choice == '5':
                 # Quitter
                 print("\n👋 Au revoir !")
                 break
             
+            actions[choice]()
             print("\n" + "="*50)
 
+    def run_batch(self, csv_file=None, crawl_url=None, website_url=None, url_filter=None):
+        """Lance un crawl et/ou une analyse sans aucune saisie (usage en ligne de commande)"""
+        if url_filter and not url_filter.startswith('http'):
+            print("⚠️  Le filtre doit commencer par http:// ou https://")
+            url_filter = None
+        
+        if crawl_url:
+            csv_file = self.run_new_crawl(crawl_url, url_filter)
+            website_url = website_url or crawl_url
+        
+        if not csv_file:
+            print("❌ Aucun fichier CSV à analyser")
+            return None
+        
+        return self.analyze_csv(csv_file, website_url, url_filter)
+
+    def _enable_input_history(self):
+        """Active l'historique des saisies (flèches, Tab pour compléter une URL déjà saisie)"""
+        if not READLINE_AVAILABLE:
+            return
+        
+        history_file = os.path.expanduser(INPUT_HISTORY_FILE)
+        try:
+            readline.read_history_file(history_file)
+        except (FileNotFoundError, OSError):
+            pass
+        readline.set_history_length(1000)
+        
+        def save_history():
+            try:
+                readline.write_history_file(history_file)
+            except OSError:
+                pass
+        atexit.register(save_history)
+        
+        def complete(text, state):
+            history = (readline.get_history_item(i) for i in range(readline.get_current_history_length(), 0, -1))
+            matches = list(dict.fromkeys(item for item in history if item and item.startswith(text)))
+            return matches[state] if state < len(matches) else None
+        
+        # Les URL contiennent ':' et '/', qui ne doivent pas couper le mot à compléter
+        readline.set_completer_delims(' \t\n')
+        readline.set_completer(complete)
+        readline.parse_and_bind('tab: complete')
+
+    def _ask(self, prompt, default=None):
+        """Pose une question et renvoie la réponse sans espaces (default si vide)"""
+        return input(prompt).strip() or default
+
+    def _ask_yn(self, prompt):
+        """Question oui/non : vrai seulement si la réponse commence par 'o'"""
+        return input(prompt)[:1].lower() == 'o'
+
+    def _pause(self, message="continuer"):
+        """Attend que l'utilisateur appuie sur Entrée"""
+        input(f"\n⏸️  Appuyez sur Entrée pour {message}...")
+
+    def _ask_url_filter(self, prompt):
+        """Demande un préfixe d'URL facultatif (None si vide ou invalide)"""
+        url_filter = self._ask(prompt)
+        if url_filter and not url_filter.startswith('http'):
+            print("⚠️  Le filtre doit commencer par http:// ou https://")
+            url_filter = None
+        return url_filter
+
+    def _menu_new_crawl(self):
+        """Option 1 : nouveau crawl puis analyse"""
+        website_url = self._ask("\n🌐 URL du site à crawler: ")
+        if not website_url:
+            print("❌ URL requise")
+            return
+        
+        # Option de filtrage par préfixe d'URL
+        print("\n🎯 FILTRAGE D'URLs (optionnel)")
+        print("Vous pouvez limiter l'analyse à une section spécifique du site.")
+        print("Exemple: https://monsite.com/blog/ pour ne garder que les pages du blog")
+        
+        url_filter = self._ask_url_filter("🔍 Préfixe d'URL à conserver (vide = tout le site): ")
+        if url_filter:
+            print(f"✅ Filtrage activé: seules les URLs commençant par '{url_filter}' seront analysées")
+        
+        csv_file = self.run_new_crawl(website_url, url_filter)
+        self._csv_cache = None  # Le crawl a pu écrire de nouveaux CSV
+        if csv_file:
+            self._pause("lancer l'analyse")
+            self.analyze_csv(csv_file, website_url, url_filter)
+
+    def _menu_analyze_existing(self):
+        """Option 2 : analyser un CSV existant"""
+        csv_files = self.list_existing_csvs()
+        if not csv_files:
+            self._pause()
+            return
+        
+        while True:
+            file_choice = self._ask(f"\nChoisir un fichier (1-{len(csv_files)}) ou 'r' pour retour: ", '')
+            if file_choice.lower() == 'r':
+                return
+            
+            try:
+                file_index = int(file_choice) - 1
+            except ValueError:
+                print("❌ Veuillez entrer un numéro")
+                continue
+            
+            if not 0 <= file_index < len(csv_files):
+                print("❌ Numéro invalide")
+                continue
+            
+            selected_file = csv_files[file_index]
+            website_url = self._ask("🌐 URL du site (optionnel): ")
+            
+            # Option de filtrage pour CSV existant aussi
+            url_filter = None
+            if website_url:
+                print("\n🎯 FILTRAGE D'URLs (optionnel)")
+                url_filter = self._ask_url_filter("🔍 Préfixe d'URL à conserver (vide = tout): ")
+            
+            self.analyze_csv(selected_file, website_url, url_filter)
+            return
+
+    def _menu_list_csvs(self):
+        """Option 3 : lister les CSV"""
+        self.list_existing_csvs()
+        self._pause()
+
+@lru_cache(maxsize=1)
+def get_link_auditor() -> CompleteLinkAuditor:
+    """Obtenir l'instance partagée de l'auditeur (configuration chargée une seule fois)"""
+    return CompleteLinkAuditor()
+
 if __name__ == "__main__":
-    auditor = CompleteLinkAuditor()
-    auditor.run()
\ No newline at end of file
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Audit de maillage interne (menu interactif sans argument)")
+    parser.add_argument('--csv-file', help="CSV Screaming Frog à analyser directement")
+    parser.add_argument('--crawl', metavar='URL', help="Site à crawler puis analyser")
+    parser.add_argument('--site-url', help="URL du site (détectée depuis le CSV si absente)")
+    parser.add_argument('--filter', dest='url_filter', help="Préfixe d'URL à conserver")
+    parser.add_argument('--config', default='ext_configuration_audit.json', help="Fichier de configuration")
+    args = parser.parse_args()
+    
+    auditor = CompleteLinkAuditor(args.config)
+    if args.csv_file or args.crawl:
+        auditor.run_batch(args.csv_file, args.crawl, args.site_url, args.url_filter)
+    else:
+        auditor.run()
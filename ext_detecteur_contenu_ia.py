@@ -10,8 +10,16 @@ from urllib.parse import urljoin, urlparse
 from typing import Dict, List, Tuple, Optional
 import json
 import time
+import hashlib
+import threading
 from bs4 import BeautifulSoup
 import re
+import xml.etree.ElementTree as ET
+from xml.sax.saxutils import quoteattr
+from concurrent.futures import ThreadPoolExecutor
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from functools import lru_cache
 from dotenv import load_dotenv
 
 # Charger les variables d'environnement
@@ -31,12 +39,179 @@ except ImportError:
     BS4_AVAILABLE = False
     print("⚠️  Module beautifulsoup4 non installé. Installez avec: pip install beautifulsoup4")
 
+# Import optionnel de lxml : parseur HTML en C, bien plus rapide que html.parser (pur Python)
+try:
+    import lxml.html
+    from lxml import etree
+    LXML_AVAILABLE = True
+except ImportError:
+    LXML_AVAILABLE = False
+
+HTML_PARSER = 'lxml' if LXML_AVAILABLE else 'html.parser'
+
+# Import optionnel d'orjson pour lire/écrire les analyses IA (réponses et cache)
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Import optionnel de brotli : sans lui, urllib3 ne sait pas décompresser les réponses 'br'
+try:
+    import brotli
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+# Requêtes HTTP lancées en parallèle (sondes HEAD, récupération des pages)
+HTTP_MAX_WORKERS = 8
+# Pages analysées par l'IA : peu nombreuses, récupérées en parallèle sans surcharger le site
+HTML_FETCH_WORKERS = 3
+# Débit maximal de ces récupérations de pages (requêtes par seconde)
+HTML_FETCH_RATE = 1.0
+# User-Agent envoyé par toutes les requêtes du détecteur
+HTTP_USER_AGENT = 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
+# Délais (connexion, lecture) : un serveur injoignable est abandonné vite, une page lente a le temps d'arriver
+HTTP_TIMEOUT = (3, 10)
+# Pages analysées par l'IA : lues par blocs de 64 Ko et au plus 256 Ko, seuls les premiers
+# milliers de caractères du <body> sont envoyés (l'en-tête des pages lourdes dépasse souvent 64 Ko)
+HTML_CHUNK_BYTES = 64 * 1024
+HTML_MAX_BYTES = 256 * 1024
+
+@lru_cache(maxsize=32)
+def _site_root(website_url: str) -> Tuple[str, str]:
+    """Domaine et URL de base (sans '/' final) d'un site, calculés une fois par site"""
+    return urlparse(website_url).netloc, website_url.rstrip('/')
+
+# Lien déjà absolu (http/https) ou relatif à la racine, sans caractère que urljoin réécrirait
+# (espaces, '\\', '?', '#', ';', segments '.'/'..') : il se résout par simple concaténation
+SIMPLE_HREF_RE = re.compile(r"(https?://[A-Za-z0-9.\-:@%]+)?(/[A-Za-z0-9\-._~%!$&'()*+,=:@/]*)?")
+
+def _join_url(base_url: str, origin: str, href: str) -> str:
+    """urljoin(base_url, href), sans analyser les deux URLs dans le cas courant (origin = schéma://domaine de base_url)"""
+    match = SIMPLE_HREF_RE.fullmatch(href)
+    if match and '/.' not in href:
+        if match.group(1):
+            return href
+        if match.group(2) and not href.startswith('//'):
+            return origin + href
+    return urljoin(base_url, href)
+
+def _skip_pattern(*terms: str) -> re.Pattern:
+    """Regex qui trouve, sans tenir compte de la casse, l'un des fragments d'URL à exclure"""
+    return re.compile('|'.join(map(re.escape, terms)), re.IGNORECASE)
+
+# Fragments d'URL écartés, une seule recherche compilée par URL au lieu d'un any() sur une copie en minuscules
+SKIP_DISCOVERY_RE = _skip_pattern('#', 'javascript:', 'mailto:')
+SKIP_DEEP_SAMPLING_RE = _skip_pattern('#', 'javascript:', 'mailto:', 'tel:', 'wp-content',
+                                      'wp-admin', 'feed', 'tag', 'author', '?')
+SKIP_SITEMAP_RE = _skip_pattern('wp-content', 'wp-admin', 'feed', 'sitemap', 'category', 'tag')
+SKIP_MANUAL_SAMPLING_RE = _skip_pattern('#', 'javascript:', 'mailto:', 'tel:', 'contact', 'mentions')
+
+# Contenu d'un bloc de code Markdown (```json ou ```) dans une réponse de l'IA, même non refermé
+JSON_FENCE_RE = re.compile(r'```(?:json)?\s*(.*?)\s*(?:```|$)', re.DOTALL)
+
+# Blocs <script> et <style> retirés du HTML sans BeautifulSoup, en une seule passe
+SCRIPT_STYLE_RE = re.compile(r'<(script|style)[^>]*>.*?</\1>', re.DOTALL | re.IGNORECASE)
+
+# Type de page d'après l'URL, par ordre de priorité : chaque alternative vérifie (lookahead)
+# qu'un des mots apparaît n'importe où dans l'URL, la première satisfaite donne son groupe
+PAGE_TYPE_RE = re.compile(
+    r'^(?:(?=.*?(?:contact|about|propos))(?P<contact>)'
+    r'|(?=.*?(?:blog|article|actualit|news))(?P<content>)'
+    r'|(?=.*?(?:produit|service|expertise|solution))(?P<product>))',
+    re.IGNORECASE | re.DOTALL
+)
+PAGE_TYPE_LABELS = {'contact': "Page contact", 'content': "Article/Blog", 'product': "Produit/Service"}
+# Catégorie d'échantillonnage de chaque type de page
+PAGE_TYPE_BUCKETS = {
+    "Article/Blog": 'content',
+    "Contenu spécifique": 'content',
+    "Produit/Service": 'product',
+    "Page section": 'category',
+    "Page contact": 'contact',
+}
+
+# Identifiants uniques dans un XPath (post-1234, article-567, etc.) et doubles crochets laissés par leur retrait
+UNIQUE_CLASS_XPATH_RE = re.compile(r'\[contains\(@class,\s*[\'"]\w+-\d+[\'"]\)\]')
+UNIQUE_ID_XPATH_RE = re.compile(r'\[contains\(@id,\s*[\'"]\w+-\d+[\'"]\)\]')
+EMPTY_OPEN_BRACKETS_RE = re.compile(r'\[\]\[')
+EMPTY_CLOSE_BRACKETS_RE = re.compile(r'\]\[\]')
+
+# XPath de repli quand la généralisation ne laisse plus rien d'utile
+XPATH_FALLBACKS = {
+    'main_content_xpath': '//main | //article | //[contains(@class, "content")] | //[contains(@class, "post")]',
+    'editorial_links_xpath': '//main//a | //article//a',
+    'content_text_xpath': '//main//text() | //article//text()',
+}
+
+def generalize_xpath_patterns(content_zones: Dict) -> Dict:
+    """Généraliser les XPath trop spécifiques pour une meilleure universalité"""
+    generalized = content_zones.copy()
+
+    for key, fallback in XPATH_FALLBACKS.items():
+        if key in generalized and generalized[key]:
+            xpath = generalized[key]
+
+            # Supprimer les identifiants uniques (post-1234, article-567, etc.)
+            xpath = UNIQUE_CLASS_XPATH_RE.sub('', xpath)
+            xpath = UNIQUE_ID_XPATH_RE.sub('', xpath)
+
+            # Nettoyer les doubles crochets
+            xpath = EMPTY_OPEN_BRACKETS_RE.sub('[', xpath)
+            xpath = EMPTY_CLOSE_BRACKETS_RE.sub(']', xpath)
+
+            # Si le XPath devient trop vide, utiliser des fallbacks
+            if not xpath or xpath in ['//', '//*']:
+                xpath = fallback
+
+            generalized[key] = xpath
+
+    return generalized
+
+class RateLimiter:
+    """Limiteur de débit partagé entre threads : les requêtes partent au plus `rate` fois par seconde"""
+    
+    def __init__(self, rate: float):
+        self.interval = 1.0 / rate
+        self._lock = threading.Lock()
+        self._next_slot = 0.0
+    
+    def wait(self):
+        """Attendre le prochain créneau libre (aucune attente si le débit n'est pas atteint)"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
 class IntelligentContentDetector:
     """Détecteur intelligent de contenu avec IA"""
     
-    def __init__(self):
+    def __init__(self, cache_dir: Optional[str] = "./ai_analysis_cache"):
         self.anthropic_key = os.getenv('ANTHROPIC_API_KEY')
         self.client = None
+        # Analyses IA déjà obtenues, indexées par le hash du prompt (None = pas de cache)
+        self.cache_dir = cache_dir
+        # Liens de la page d'accueil par site (partagés par les différentes méthodes d'échantillonnage)
+        self._homepage_links_cache = {}
+        # Politesse envers le site analysé, même quand les pages sont récupérées en parallèle
+        self.html_rate_limiter = RateLimiter(HTML_FETCH_RATE)
+        # Pools de threads par nombre de workers, créés au premier besoin puis réutilisés
+        self._executors = {}
+        
+        # Session HTTP partagée : connexions keep-alive réutilisées d'une requête à l'autre
+        # (une seule poignée de main TLS par hôte), pool assez grand pour les requêtes parallèles,
+        # et deux nouvelles tentatives rapides sur une connexion coupée
+        self.session = requests.Session()
+        self.session.headers['User-Agent'] = HTTP_USER_AGENT
+        # Réponses compressées (sitemaps et pages HTML volumineux) : brotli s'il est installé, sinon gzip
+        self.session.headers['Accept-Encoding'] = 'gzip, deflate, br' if BROTLI_AVAILABLE else 'gzip, deflate'
+        adapter = HTTPAdapter(pool_connections=10, pool_maxsize=2 * HTTP_MAX_WORKERS,
+                              max_retries=Retry(total=2, backoff_factor=0.2))
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
         
         if ANTHROPIC_AVAILABLE and self.anthropic_key:
             try:
@@ -55,9 +230,10 @@ class IntelligentContentDetector:
             print(f"   📂 Focus sur la section: {section_filter}")
         
         sample_urls = []
+        homepage = _site_root(website_url)[1] + '/'
         
         # 1. Toujours inclure l'accueil (structure de base)
-        sample_urls.append(website_url.rstrip('/') + '/')
+        sample_urls.append(homepage)
         
         # 2. Essayer de récupérer le sitemap pour diversité
         all_urls = self._get_all_urls_from_sitemap(website_url)
@@ -81,11 +257,11 @@ class IntelligentContentDetector:
                 remaining_slots = max_samples - len(sample_urls)
                 if remaining_slots > 0:
                     # Ne prendre que la homepage si elle n'est pas déjà dans la section
-                    homepage = website_url.rstrip('/') + '/'
                     if homepage not in sample_urls and remaining_slots >= 1:
                         sample_urls.insert(0, homepage)  # Homepage en premier pour contexte
 
-                print(f"   📊 Répartition: {len([u for u in sample_urls if section_filter in u])} pages section / {len([u for u in sample_urls if section_filter not in u])} pages générales")
+                section_count = sum(section_filter in u for u in sample_urls)
+                print(f"   📊 Répartition: {section_count} pages section / {len(sample_urls) - section_count} pages générales")
             else:
                 print(f"   ⚠️  Aucune page trouvée dans {section_filter} via sitemap, tentative de découverte approfondie...")
                 # Essayer de découvrir les pages de section par d'autres moyens
@@ -97,7 +273,6 @@ class IntelligentContentDetector:
                     sample_urls.extend(strategic_samples)
 
                     # Ajouter homepage pour contexte
-                    homepage = website_url.rstrip('/') + '/'
                     if homepage not in sample_urls:
                         sample_urls.insert(0, homepage)
                 else:
@@ -127,21 +302,36 @@ class IntelligentContentDetector:
             urljoin(website_url, 'robots.txt')
         ]
         
-        for sitemap_url in sitemap_urls:
-            try:
-                response = requests.get(sitemap_url, timeout=10)
-                if response.status_code == 200:
-                    if 'sitemap.xml' in sitemap_url:
-                        return self._extract_urls_from_sitemap(response.text, website_url)
-                    elif 'robots.txt' in sitemap_url:
-                        sitemap_line = [line for line in response.text.split('\n') 
-                                      if 'sitemap' in line.lower()]
-                        if sitemap_line:
-                            sitemap_from_robots = sitemap_line[0].split(': ')[1].strip()
-                            response = requests.get(sitemap_from_robots, timeout=10)
-                            return self._extract_urls_from_sitemap(response.text, website_url)
-            except Exception:
-                continue
+        # Les trois candidats sont demandés en même temps : un sitemap.xml absent ou lent
+        # ne retarde plus les suivants. Les réponses restent lues dans l'ordre de priorité.
+        # stream=True : le corps d'un sitemap n'est lu qu'au fil de son analyse
+        executor = self._get_executor(HTTP_MAX_WORKERS)
+        futures = [executor.submit(self.session.get, sitemap_url, timeout=HTTP_TIMEOUT, stream=True)
+                   for sitemap_url in sitemap_urls]
+        try:
+            for sitemap_url, future in zip(sitemap_urls, futures):
+                try:
+                    response = future.result()
+                    if response.status_code == 200:
+                        if 'sitemap.xml' in sitemap_url:
+                            return self._extract_urls_from_sitemap(response, website_url)
+                        elif 'robots.txt' in sitemap_url:
+                            sitemap_line = [line for line in response.text.split('\n') 
+                                          if 'sitemap' in line.lower()]
+                            if sitemap_line:
+                                sitemap_from_robots = sitemap_line[0].split(': ')[1].strip()
+                                with self.session.get(sitemap_from_robots, timeout=HTTP_TIMEOUT, stream=True) as response:
+                                    return self._extract_urls_from_sitemap(response, website_url)
+                except Exception:
+                    continue
+        finally:
+            # Ne pas attendre les candidats moins prioritaires une fois un sitemap trouvé,
+            # et rendre au pool les connexions des réponses déjà reçues
+            for future in futures:
+                future.cancel()
+            for future in futures:
+                if future.done() and not future.cancelled() and future.exception() is None:
+                    future.result().close()
         
         return []
     
@@ -160,18 +350,7 @@ class IntelligentContentDetector:
         }
         
         for url in all_urls:
-            page_type = self._classify_page_type(url)
-            
-            if page_type in ['Article/Blog', 'Contenu spécifique']:
-                classified['content'].append(url)
-            elif page_type in ['Produit/Service']:
-                classified['product'].append(url)
-            elif page_type in ['Page section']:
-                classified['category'].append(url)
-            elif page_type in ['Page contact']:
-                classified['contact'].append(url)
-            else:
-                classified['other'].append(url)
+            classified[PAGE_TYPE_BUCKETS.get(self._classify_page_type(url), 'other')].append(url)
         
         # Sélectionner représentativement
         selected = []
@@ -179,44 +358,53 @@ class IntelligentContentDetector:
         
         # Distribuer équitablement
         remaining = max_samples
-        for priority in priorities:
+        for position, priority in enumerate(priorities):
+            if remaining <= 0:
+                break
             urls = classified[priority]
-            if urls and remaining > 0:
+            if urls:
                 # Prendre 1-2 URLs par catégorie selon disponibilité
-                take = min(len(urls), max(1, remaining // (len(priorities) - priorities.index(priority))))
+                take = min(len(urls), max(1, remaining // (len(priorities) - position)))
                 selected.extend(urls[:take])
                 remaining -= take
         
         return selected[:max_samples]
     
-    def _classify_page_type(self, url: str) -> str:
-        """Classifier le type d'une page par son URL"""
-        url_lower = url.lower()
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _classify_page_type(url: str) -> str:
+        """Classifier le type d'une page par son URL (mis en cache : appelé plusieurs fois par URL)"""
+        match = PAGE_TYPE_RE.match(url)
         
-        if any(term in url_lower for term in ['contact', 'about', 'propos']):
-            return "Page contact"
-        elif any(term in url_lower for term in ['blog', 'article', 'actualit', 'news']):
-            return "Article/Blog"
-        elif any(term in url_lower for term in ['produit', 'service', 'expertise', 'solution']):
-            return "Produit/Service"
+        if match:
+            return PAGE_TYPE_LABELS[match.lastgroup]
         elif url.count('/') <= 3 and not url.endswith('.html'):
             return "Page section"
         else:
             return "Contenu spécifique"
     
+    def _get_executor(self, max_workers: int) -> ThreadPoolExecutor:
+        """Pool de threads partagé pour ce nombre de workers (threads créés à la demande, gardés entre deux appels)"""
+        executor = self._executors.get(max_workers)
+        if executor is None:
+            executor = self._executors[max_workers] = ThreadPoolExecutor(max_workers=max_workers)
+        return executor
+
+    def _map_concurrently(self, func, items, max_workers: int = HTTP_MAX_WORKERS) -> list:
+        """Appliquer func à chaque élément en parallèle (threads), résultats dans l'ordre des éléments"""
+        items = list(items)
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        return list(self._get_executor(max_workers).map(func, items))
+
     def _discover_section_pages(self, website_url: str, section_filter: str) -> List[str]:
         """Découvrir les pages d'une section spécifique par exploration approfondie"""
         discovered_urls = []
 
         try:
-            # 1. Essayer directement l'URL de section
+            # 1. L'URL de section directe, puis 2. des patterns communs pour cette section
             section_url = urljoin(website_url, section_filter.lstrip('/'))
-            if self._test_url_exists(section_url):
-                discovered_urls.append(section_url)
-                print(f"   📍 Section trouvée: {section_url}")
-
-            # 2. Essayer des patterns communs pour cette section
-            base_url = website_url.rstrip('/')
+            base_url = _site_root(website_url)[1]
             common_patterns = [
                 f"{section_filter}/",  # /section/
                 f"{section_filter}",   # /section
@@ -224,31 +412,29 @@ class IntelligentContentDetector:
                 f"{section_filter}/page/1/",
                 f"{section_filter}/1/",  # pagination
             ]
+            candidates = list(dict.fromkeys(
+                [section_url] + [urljoin(base_url, pattern.lstrip('/')) for pattern in common_patterns]
+            ))
 
-            for pattern in common_patterns:
-                test_url = urljoin(base_url, pattern.lstrip('/'))
-                if test_url not in discovered_urls and self._test_url_exists(test_url):
+            # Toutes les sondes HEAD et la page d'accueil (étape 3) sont demandées en même temps :
+            # la durée totale est celle de la requête la plus lente, pas la somme des allers-retours
+            executor = self._get_executor(HTTP_MAX_WORKERS)
+            # La page d'accueil est aussi analysée (BeautifulSoup) dans le pool, pendant les sondes
+            homepage_future = executor.submit(self._homepage_links, website_url)
+            exists = list(executor.map(self._test_url_exists, candidates))
+
+            for test_url, found in zip(candidates, exists):
+                if found:
                     discovered_urls.append(test_url)
-                    print(f"   📍 Pattern trouvé: {test_url}")
+                    label = "Section trouvée" if test_url == section_url else "Pattern trouvé"
+                    print(f"   📍 {label}: {test_url}")
+
+            homepage_links = homepage_future.result()
 
             # 3. Explorer depuis la homepage pour trouver des liens vers la section
-            response = requests.get(website_url, timeout=10)
-            if response.status_code == 200 and BS4_AVAILABLE:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                links = soup.find_all('a', href=True)
-
-                base_domain = urlparse(website_url).netloc
-                for link in links:
-                    href = link['href']
-                    full_url = urljoin(website_url, href)
-
-                    if (base_domain in full_url and
-                        section_filter in full_url and
-                        full_url not in discovered_urls and
-                        not any(skip in full_url.lower() for skip in ['#', 'javascript:', 'mailto:'])):
-                        discovered_urls.append(full_url)
-                        if len(discovered_urls) >= 5:  # Limite pour éviter trop de requêtes
-                            break
+            # (limite de 5 pour éviter trop de requêtes)
+            self._collect_internal_links(homepage_links, website_url, discovered_urls, SKIP_DISCOVERY_RE,
+                                         limit=5, must_contain=section_filter)
 
             # 4. Si toujours rien, essayer des recherches par mots-clés dans l'URL
             if not discovered_urls:
@@ -256,9 +442,9 @@ class IntelligentContentDetector:
                 keywords = section_filter.strip('/').split('-')
                 if keywords:
                     # Essayer des combinaisons simples
-                    for keyword in keywords[:2]:  # Prendre max 2 mots-clés
-                        test_url = f"{base_url}/{keyword}/"
-                        if self._test_url_exists(test_url):
+                    test_urls = [f"{base_url}/{keyword}/" for keyword in keywords[:2]]  # Prendre max 2 mots-clés
+                    for test_url, found in zip(test_urls, self._map_concurrently(self._test_url_exists, test_urls)):
+                        if found:
                             discovered_urls.append(test_url)
                             print(f"   📍 Mot-clé trouvé: {test_url}")
 
@@ -267,13 +453,51 @@ class IntelligentContentDetector:
 
         return discovered_urls
 
+    def _homepage_links(self, website_url: str) -> List[str]:
+        """URLs absolues des liens de la page d'accueil, récupérée et analysée une seule fois par site"""
+        links = self._homepage_links_cache.get(website_url)
+        if links is None:
+            soup = self._fetch_soup(website_url)
+            if soup is None:
+                links = []
+            else:
+                parsed = urlparse(website_url)
+                origin = f"{parsed.scheme}://{parsed.netloc}"
+                links = [_join_url(website_url, origin, link['href']) for link in soup.find_all('a', href=True)]
+            self._homepage_links_cache[website_url] = links
+        return links
+
+    def _collect_internal_links(self, links: List[str], website_url: str, collected: List[str],
+                                skip_re: re.Pattern, limit: int, must_contain: str = "") -> List[str]:
+        """Ajouter à collected (sans doublon) les liens internes retenus, jusqu'à en avoir limit"""
+        base_domain = _site_root(website_url)[0]
+        seen = set(collected)  # Tests d'appartenance en O(1) au lieu de parcourir la liste
+        
+        for full_url in links:
+            if (base_domain in full_url and
+                must_contain in full_url and
+                full_url not in seen and
+                not skip_re.search(full_url)):
+                seen.add(full_url)
+                collected.append(full_url)
+                if len(collected) >= limit:
+                    break
+        
+        return collected
+
+    def _fetch_soup(self, url: str):
+        """Récupérer et analyser une page HTML (None si la page ou BeautifulSoup est indisponible)"""
+        response = self.session.get(url, timeout=HTTP_TIMEOUT)
+        if response.status_code == 200 and BS4_AVAILABLE:
+            return BeautifulSoup(response.text, HTML_PARSER)
+        return None
+
     def _test_url_exists(self, url: str) -> bool:
-        """Tester si une URL existe (HEAD request)"""
+        """Tester si une URL existe (une seule requête HEAD : une redirection 3xx compte comme existante)"""
         try:
-            headers = {'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'}
-            response = requests.head(url, headers=headers, timeout=5, allow_redirects=True)
-            return response.status_code < 400
-        except:
+            response = self.session.head(url, timeout=3, allow_redirects=False)
+            return 200 <= response.status_code < 400
+        except Exception:
             return False
 
     def _manual_deep_sampling(self, website_url: str) -> List[str]:
@@ -281,60 +505,50 @@ class IntelligentContentDetector:
         urls = []
         
         try:
-            response = requests.get(website_url, timeout=10)
-            if response.status_code == 200 and BS4_AVAILABLE:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Chercher tous les liens internes
-                links = soup.find_all('a', href=True)
-                base_domain = urlparse(website_url).netloc
-                
-                for link in links:
-                    href = link['href']
-                    full_url = urljoin(website_url, href)
-                    
-                    if (base_domain in full_url and 
-                        full_url not in urls and
-                        not any(skip in full_url.lower() for skip in [
-                            '#', 'javascript:', 'mailto:', 'tel:', 'wp-content', 
-                            'wp-admin', 'feed', 'tag', 'author', '?'
-                        ])):
-                        urls.append(full_url)
-                        
-                        if len(urls) >= 50:  # Limite pour éviter trop de requêtes
-                            break
+            # Chercher tous les liens internes (limite de 50 pour éviter trop de requêtes)
+            self._collect_internal_links(self._homepage_links(website_url), website_url, urls,
+                                         SKIP_DEEP_SAMPLING_RE, limit=50)
         
         except Exception:
             pass
         
         return urls
     
-    def _extract_urls_from_sitemap(self, sitemap_content: str, base_url: str) -> List[str]:
-        """Extraire URLs du sitemap XML"""
-        urls = []
-        
-        if not BS4_AVAILABLE:
-            # Fallback regex
-            url_pattern = r'<loc>(.*?)</loc>'
-            urls = re.findall(url_pattern, sitemap_content)
-        else:
-            # BeautifulSoup parsing
-            try:
-                soup = BeautifulSoup(sitemap_content, 'xml')
-                urls = [loc.text for loc in soup.find_all('loc')]
-            except:
-                # Fallback regex si XML parsing échoue
-                url_pattern = r'<loc>(.*?)</loc>'
-                urls = re.findall(url_pattern, sitemap_content)
+    def _iter_sitemap_locs(self, response):
+        """Parcourir les <loc> d'un sitemap au fil du téléchargement (mémoire bornée à un élément)"""
+        response.raw.decode_content = True  # Sitemaps servis compressés (gzip)
+        if LXML_AVAILABLE:
+            # recover=True : un sitemap mal formé (« & » non échappé dans un <loc>, fréquent)
+            # n'altère que l'entrée fautive au lieu d'arrêter la lecture, comme BeautifulSoup(..., 'xml')
+            for _, elem in etree.iterparse(response.raw, recover=True):
+                # Balise avec ou sans espace de noms ({http://www.sitemaps.org/...}loc)
+                if isinstance(elem.tag, str) and (elem.tag == 'loc' or elem.tag.endswith('}loc')):
+                    if elem.text:
+                        yield elem.text.strip()
+                elem.clear()
+                # Libérer aussi les éléments frères déjà traités
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            return
         
+        try:
+            for _, elem in ET.iterparse(response.raw):
+                if elem.tag == 'loc' or elem.tag.endswith('}loc'):
+                    if elem.text:
+                        yield elem.text.strip()
+                elem.clear()
+        except ET.ParseError as e:
+            # Parseur strict sans lxml : les URLs suivant l'erreur sont perdues
+            print(f"⚠️  Sitemap mal formé ({e}), URLs suivantes ignorées (installez lxml pour les récupérer)")
+    
+    def _extract_urls_from_sitemap(self, response, base_url: str) -> List[str]:
+        """Extraire URLs du sitemap XML (réponse HTTP ouverte avec stream=True)"""
         # Filtrer pour garder seulement les URLs du domaine
-        base_domain = urlparse(base_url).netloc
+        base_domain = _site_root(base_url)[0]
         filtered_urls = []
         
-        for url in urls:
-            if base_domain in url and not any(skip in url.lower() for skip in [
-                'wp-content', 'wp-admin', 'feed', 'sitemap', 'category', 'tag'
-            ]):
+        for url in self._iter_sitemap_locs(response):
+            if base_domain in url and not SKIP_SITEMAP_RE.search(url):
                 filtered_urls.append(url)
         
         return filtered_urls
@@ -344,27 +558,9 @@ class IntelligentContentDetector:
         sample_urls = [website_url]  # Toujours inclure l'accueil
         
         try:
-            response = requests.get(website_url, timeout=10)
-            if response.status_code == 200 and BS4_AVAILABLE:
-                soup = BeautifulSoup(response.text, 'html.parser')
-                
-                # Trouver des liens internes
-                links = soup.find_all('a', href=True)
-                base_domain = urlparse(website_url).netloc
-                
-                for link in links:
-                    href = link['href']
-                    full_url = urljoin(website_url, href)
-                    
-                    if (base_domain in full_url and 
-                        full_url not in sample_urls and
-                        not any(skip in full_url.lower() for skip in [
-                            '#', 'javascript:', 'mailto:', 'tel:', 'contact', 'mentions'
-                        ])):
-                        sample_urls.append(full_url)
-                        
-                        if len(sample_urls) >= max_samples:
-                            break
+            # Trouver des liens internes
+            self._collect_internal_links(self._homepage_links(website_url), website_url, sample_urls,
+                                         SKIP_MANUAL_SAMPLING_RE, limit=max_samples)
         
         except Exception as e:
             print(f"   ❌ Erreur échantillonnage manuel: {e}")
@@ -382,8 +578,10 @@ class IntelligentContentDetector:
         analysis_urls = sample_urls[:3]  # Par défaut les 3 premières
 
         if section_filter:
-            section_pages = [url for url in sample_urls if section_filter in url]
-            general_pages = [url for url in sample_urls if section_filter not in url]
+            # Répartition en une seule passe
+            section_pages, general_pages = [], []
+            for url in sample_urls:
+                (section_pages if section_filter in url else general_pages).append(url)
 
             if section_pages:
                 # Prendre jusqu'à 2 pages de section + 1 page générale pour contexte
@@ -394,11 +592,13 @@ class IntelligentContentDetector:
             else:
                 print(f"   📝 Aucune page de section dans l'échantillon, analyse générale")
 
-        # Récupérer le HTML des pages sélectionnées
-        html_samples = []
+        # Récupérer le HTML des pages sélectionnées (en parallèle, au plus HTML_FETCH_WORKERS à la fois)
         for url in analysis_urls:
             print(f"   📥 Récupération: {url}")
-            html_content = self._fetch_html(url)
+        html_contents = self._map_concurrently(self._fetch_html, analysis_urls, max_workers=HTML_FETCH_WORKERS)
+
+        html_samples = []
+        for url, html_content in zip(analysis_urls, html_contents):
             if html_content:
                 # Nettoyer le HTML pour l'analyse
                 cleaned_html = self._clean_html_for_ai(html_content)
@@ -406,8 +606,6 @@ class IntelligentContentDetector:
                     'url': url,
                     'html': cleaned_html[:6000]  # Limiter la taille
                 })
-
-            time.sleep(1)  # Rate limiting
         
         if not html_samples:
             return {"error": "Aucune page HTML récupérée"}
@@ -415,6 +613,12 @@ class IntelligentContentDetector:
         # Créer le prompt pour Claude
         prompt = self._create_structure_analysis_prompt(html_samples)
         
+        # Même prompt (mêmes pages, même HTML) : réutiliser l'analyse sans rappeler l'API
+        cached = self._get_cached_analysis(prompt)
+        if cached is not None:
+            print(f"   ✅ Structure analysée (cache)")
+            return cached
+        
         try:
             response = self.client.messages.create(
                 model="claude-3-haiku-20240307",
@@ -425,14 +629,14 @@ class IntelligentContentDetector:
             # Parser la réponse JSON
             content = response.content[0].text.strip()
             
-            # Nettoyer le JSON
-            if '```json' in content:
-                content = content.split('```json')[1].split('```')[0].strip()
-            elif '```' in content:
-                content = content.split('```')[1].strip()
+            # Nettoyer le JSON (bloc ```json ... ``` éventuel, extrait en une recherche)
+            match = JSON_FENCE_RE.search(content)
+            if match:
+                content = match.group(1)
             
-            result = json.loads(content)
+            result = orjson.loads(content) if ORJSON_AVAILABLE else json.loads(content)
             print(f"   ✅ Structure analysée avec succès")
+            self._cache_analysis(prompt, result)
             
             return result
             
@@ -445,6 +649,44 @@ class IntelligentContentDetector:
             print(f"   ❌ Erreur API: {e}")
             return {"error": str(e)}
     
+    def _get_analysis_cache_file(self, prompt: str) -> str:
+        """Fichier de cache d'une analyse, nommé d'après le hash du prompt"""
+        cache_key = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{cache_key}.json")
+    
+    def _get_cached_analysis(self, prompt: str) -> Optional[Dict]:
+        """Récupérer une analyse IA depuis le cache"""
+        if not self.cache_dir:
+            return None
+        
+        cache_file = self._get_analysis_cache_file(prompt)
+        try:
+            with open(cache_file, 'rb') as f:
+                data = f.read()
+            return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+        except OSError:
+            return None
+        except ValueError:
+            # Cache corrompu, le supprimer
+            os.remove(cache_file)
+            return None
+    
+    def _cache_analysis(self, prompt: str, result: Dict):
+        """Sauvegarder une analyse IA dans le cache"""
+        if not self.cache_dir:
+            return
+        
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            if ORJSON_AVAILABLE:
+                data = orjson.dumps(result)
+            else:
+                data = json.dumps(result, ensure_ascii=False).encode('utf-8')
+            with open(self._get_analysis_cache_file(prompt), 'wb') as f:
+                f.write(data)
+        except Exception as e:
+            print(f"⚠️  Impossible de sauvegarder le cache: {e}")
+    
     def _create_structure_analysis_prompt(self, html_samples: List[Dict]) -> str:
         """Créer le prompt avancé pour analyser la structure universellement"""
         
@@ -529,45 +771,17 @@ IMPORTANT : Privilégie la PRÉCISION sur la EXHAUSTIVITÉ. Mieux vaut identifie
         
         return prompt
 
-    def _generalize_xpath_patterns(self, content_zones: Dict) -> Dict:
-        """Généraliser les XPath trop spécifiques pour une meilleure universalité"""
-        import re
-
-        generalized = content_zones.copy()
-
-        for key in ['main_content_xpath', 'editorial_links_xpath', 'content_text_xpath']:
-            if key in generalized and generalized[key]:
-                xpath = generalized[key]
-
-                # Supprimer les identifiants uniques (post-1234, article-567, etc.)
-                xpath = re.sub(r'\[contains\(@class,\s*[\'"]\w+-\d+[\'"]\)\]', '', xpath)
-                xpath = re.sub(r'\[contains\(@id,\s*[\'"]\w+-\d+[\'"]\)\]', '', xpath)
-
-                # Nettoyer les doubles crochets
-                xpath = re.sub(r'\[\]\[', '[', xpath)
-                xpath = re.sub(r'\]\[\]', ']', xpath)
-
-                # Si le XPath devient trop vide, utiliser des fallbacks
-                if not xpath or xpath in ['//', '//*']:
-                    if key == 'main_content_xpath':
-                        xpath = '//main | //article | //[contains(@class, "content")] | //[contains(@class, "post")]'
-                    elif key == 'editorial_links_xpath':
-                        xpath = '//main//a | //article//a'
-                    elif key == 'content_text_xpath':
-                        xpath = '//main//text() | //article//text()'
-
-                generalized[key] = xpath
-
-        return generalized
-
-    def _analyze_page_context(self, url: str) -> str:
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def _analyze_page_context(url: str) -> str:
         """Analyser le contexte d'une page pour aider l'IA"""
+        url_lower = url.lower()
         
-        if 'contact' in url.lower():
+        if 'contact' in url_lower:
             return "Page contact - Contenu informatif + formulaire"
-        elif 'blog' in url.lower() or 'article' in url.lower():
+        elif 'blog' in url_lower or 'article' in url_lower:
             return "Page article/blog - Contenu éditorial principal"
-        elif any(term in url.lower() for term in ['produit', 'service', 'expertise']):
+        elif any(term in url_lower for term in ['produit', 'service', 'expertise']):
             return "Page produit/service - Description + liens connexes"
         elif url.count('/') <= 3:
             return "Page accueil/section - Mix contenu + navigation"
@@ -585,26 +799,27 @@ IMPORTANT : Privilégie la PRÉCISION sur la EXHAUSTIVITÉ. Mieux vaut identifie
         content_zones = ai_analysis["content_zones"]
 
         # Généraliser les XPath trop spécifiques
-        content_zones = self._generalize_xpath_patterns(content_zones)
+        content_zones = generalize_xpath_patterns(content_zones)
 
-        # Template XML pour Screaming Frog
+        # Template XML pour Screaming Frog. Les XPath sont échappés pour l'attribut :
+        # un XPath comme //div[@class="x"] ou contenant & ne doit pas casser le XML
         xml_config = f"""<?xml version="1.0" encoding="UTF-8"?>
 <seospiderconfig>
   <configuration>
     <extraction>
       <!-- Contenu principal -->
       <custom name="MainContent" 
-               xpath="{content_zones.get('content_text_xpath', '//article//text()')}"
+               xpath={quoteattr(content_zones.get('content_text_xpath', '//article//text()'))}
                type="text"/>
 
        <!-- Liens éditoriaux seulement -->
        <custom name="EditorialLinks"
-               xpath="{content_zones.get('editorial_links_xpath', '//article//a')}"
+               xpath={quoteattr(content_zones.get('editorial_links_xpath', '//article//a'))}
                type="links"/>
 
        <!-- Zone de contenu complète -->
        <custom name="ContentZone"
-               xpath="{content_zones.get('main_content_xpath', '//article')}"
+               xpath={quoteattr(content_zones.get('main_content_xpath', '//article'))}
                type="html"/>
     </extraction>
     
@@ -706,27 +921,39 @@ IMPORTANT : Privilégie la PRÉCISION sur la EXHAUSTIVITÉ. Mieux vaut identifie
     
     def _fetch_html(self, url: str) -> Optional[str]:
         """Récupérer le contenu HTML d'une page"""
+        self.html_rate_limiter.wait()
         try:
-            headers = {
-                'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
-            }
-            response = requests.get(url, headers=headers, timeout=10)
-            response.raise_for_status()
-            return response.text
+            with self.session.get(url, timeout=HTTP_TIMEOUT, stream=True) as response:
+                response.raise_for_status()
+                body = bytearray()
+                for chunk in response.iter_content(chunk_size=HTML_CHUNK_BYTES):
+                    body += chunk
+                    if len(body) >= HTML_MAX_BYTES:
+                        break
+                return body[:HTML_MAX_BYTES].decode(response.encoding or 'utf-8', errors='replace')
         except Exception as e:
             print(f"   ❌ {url}: {e}")
             return None
     
     def _clean_html_for_ai(self, html: str) -> str:
         """Nettoyer HTML pour l'analyse IA"""
+        if LXML_AVAILABLE:
+            # Directement sur l'arbre C de lxml, sans l'arbre d'objets Python de BeautifulSoup
+            try:
+                doc = lxml.html.document_fromstring(html)
+                etree.strip_elements(doc, 'script', 'style', 'noscript', with_tail=False)
+                body = doc.find('body')
+                return etree.tostring(body if body is not None else doc, encoding='unicode')[:8000]
+            except Exception:
+                pass
+        
         if not BS4_AVAILABLE:
             # Fallback regex basique
-            html = re.sub(r'<script[^>]*>.*?</script>', '', html, flags=re.DOTALL | re.IGNORECASE)
-            html = re.sub(r'<style[^>]*>.*?</style>', '', html, flags=re.DOTALL | re.IGNORECASE)
+            html = SCRIPT_STYLE_RE.sub('', html)
             return html[:8000]
         
         try:
-            soup = BeautifulSoup(html, 'html.parser')
+            soup = BeautifulSoup(html, HTML_PARSER)
             
             # Supprimer scripts, styles, commentaires
             for tag in soup(['script', 'style', 'noscript']):
@@ -765,7 +992,7 @@ IMPORTANT : Privilégie la PRÉCISION sur la EXHAUSTIVITÉ. Mieux vaut identifie
                     with open('/proc/version', 'r') as f:
                         if 'microsoft' in f.read().lower():
                             is_wsl = True
-            except:
+            except Exception:
                 pass
 
             if is_wsl:
@@ -0,0 +1,332 @@
+// Graphique de réseau du maillage interne (D3.js v7)
+// Chargé par les rapports HTML, qui définissent au préalable la variable networkData
+
+// Configuration du graphique
+const width = 1160;
+const height = 600;
+const margin = {top: 20, right: 20, bottom: 20, left: 20};
+
+// Au-delà de ce nombre de nœuds, le SVG (un élément DOM par nœud, lien et libellé)
+// devient trop lent : le graphique est alors dessiné sur un canvas
+const CANVAS_NODE_THRESHOLD = 1500;
+const useCanvas = networkData.nodes.length > CANVAS_NODE_THRESHOLD;
+
+// Zoom
+const zoom = d3.zoom()
+    .scaleExtent([0.1, 3]);
+
+// Échelles pour la taille et couleur des nœuds
+const maxInbound = d3.max(networkData.nodes, d => d.inbound) || 1;
+const radiusScale = d3.scaleSqrt()
+    .domain([0, maxInbound])
+    .range([4, 25]);
+
+const colorScale = d3.scaleLinear()
+    .domain([0, maxInbound * 0.3, maxInbound * 0.7, maxInbound])
+    .range(['#dc3545', '#ffc107', '#28a745', '#007bff']);
+
+// Petits graphes : positions (normalisées entre 0 et 1) déjà calculées par le script Python,
+// aucune simulation de forces n'est lancée
+const staticLayout = networkData.nodes.length > 0 && networkData.nodes.every(d => d.x !== undefined);
+let simulation = null;
+
+if (staticLayout) {
+    const nodeById = new Map();
+    networkData.nodes.forEach((d, i) => {
+        d.index = i;
+        d.x = margin.left + d.x * (width - margin.left - margin.right);
+        d.y = margin.top + d.y * (height - margin.top - margin.bottom);
+        nodeById.set(d.id, d);
+    });
+    // Liens vers les objets nœuds, comme le ferait d3.forceLink
+    networkData.edges.forEach(edge => {
+        edge.source = nodeById.get(edge.source);
+        edge.target = nodeById.get(edge.target);
+    });
+} else {
+    // Simulation de forces (d3-force-reuse, s'il est chargé, ne reconstruit le quadtree
+    // de Barnes-Hut que toutes les quelques itérations)
+    const forceManyBody = d3.forceManyBodyReuse || d3.forceManyBody;
+    simulation = d3.forceSimulation(networkData.nodes)
+        .force("link", d3.forceLink(networkData.edges).id(d => d.id).distance(80))
+        .force("charge", forceManyBody().strength(-300))
+        .force("center", d3.forceCenter(width / 2, height / 2))
+        .force("collision", d3.forceCollide().radius(d => radiusScale(d.inbound) + 2));
+
+    // Disposition calculée avant l'affichage : pas d'animation des forces au chargement,
+    // la simulation ne reprend que pendant le déplacement d'un nœud
+    const WARMUP_TICKS = 100;
+    simulation.stop();
+    for (let i = 0; i < WARMUP_TICKS; ++i) simulation.tick();
+}
+
+// Tooltip
+const tooltip = d3.select("body").append("div")
+    .attr("class", "tooltip")
+    .style("opacity", 0);
+
+function showTooltip(event, d) {
+    tooltip.transition().duration(200).style("opacity", .9);
+    // Libellés et URLs issus du crawl : insérés en texte, jamais interprétés comme du HTML
+    tooltip.html("");
+    tooltip.append("strong").text(d.label);
+    tooltip.append("br");
+    tooltip.append("span").text(`Liens entrants: ${d.inbound}`);
+    tooltip.append("br");
+    tooltip.append("span").text(`Liens sortants: ${d.outbound}`);
+    tooltip.append("br");
+    tooltip.append("small").text(d.id);
+    tooltip.style("left", (event.pageX + 10) + "px")
+    .style("top", (event.pageY - 28) + "px");
+}
+
+function hideTooltip() {
+    tooltip.transition().duration(500).style("opacity", 0);
+}
+
+// État des contrôles
+let labelsVisible = true;
+let orphansHighlighted = false;
+
+function nodeStroke(d) {
+    return orphansHighlighted && d.inbound === 0 ? "#ff0000" : "#fff";
+}
+
+function nodeStrokeWidth(d) {
+    return orphansHighlighted && d.inbound === 0 ? 3 : 1.5;
+}
+
+// Rendu SVG (petits graphes) : éléments interactifs, nœuds déplaçables
+function renderSvg() {
+    const svg = d3.select("#network-graph")
+        .append("svg")
+        .attr("width", width)
+        .attr("height", height);
+
+    const g = svg.append("g");
+
+    zoom.on("zoom", function(event) {
+        g.attr("transform", event.transform);
+    });
+    svg.call(zoom);
+
+    // Créer les liens
+    const links = g.append("g")
+        .selectAll("line")
+        .data(networkData.edges)
+        .enter().append("line")
+        .attr("stroke", "#999")
+        .attr("stroke-opacity", 0.6)
+        .attr("stroke-width", 1);
+
+    // Créer les nœuds
+    const nodes = g.append("g")
+        .selectAll("circle")
+        .data(networkData.nodes)
+        .enter().append("circle")
+        .attr("r", d => radiusScale(d.inbound))
+        .attr("fill", d => colorScale(d.inbound))
+        .attr("stroke", "#fff")
+        .attr("stroke-width", 1.5)
+        .call(d3.drag()
+            .on("start", dragstarted)
+            .on("drag", dragged)
+            .on("end", dragended));
+
+    // Labels des nœuds
+    const labels = g.append("g")
+        .selectAll("text")
+        .data(networkData.nodes)
+        .enter().append("text")
+        .text(d => d.label)
+        .attr("font-size", "10px")
+        .attr("text-anchor", "middle")
+        .attr("dy", ".35em")
+        .attr("fill", "#333")
+        .style("pointer-events", "none")
+        .style("opacity", 0.8);
+
+    // Events pour les nœuds
+    nodes.on("mouseover", showTooltip)
+        .on("mouseout", hideTooltip);
+
+    // Positionnement des éléments (au chargement puis pendant les déplacements) :
+    // les positions sont d'abord lues en une passe, puis écrites dans le DOM
+    const xs = new Float32Array(networkData.nodes.length);
+    const ys = new Float32Array(networkData.nodes.length);
+
+    function ticked() {
+        networkData.nodes.forEach((n, i) => {
+            xs[i] = n.x;
+            ys[i] = n.y;
+        });
+
+        links
+            .attr("x1", d => xs[d.source.index])
+            .attr("y1", d => ys[d.source.index])
+            .attr("x2", d => xs[d.target.index])
+            .attr("y2", d => ys[d.target.index]);
+
+        nodes
+            .attr("cx", (d, i) => xs[i])
+            .attr("cy", (d, i) => ys[i]);
+
+        labels
+            .attr("x", (d, i) => xs[i])
+            .attr("y", (d, i) => ys[i]);
+    }
+
+    if (simulation) simulation.on("tick", ticked);
+    ticked();
+
+    return {
+        zoomTarget: svg,
+        redraw: ticked,
+        update() {
+            labels.style("opacity", labelsVisible ? 0.8 : 0);
+            nodes.attr("stroke", nodeStroke)
+                .attr("stroke-width", nodeStrokeWidth);
+        }
+    };
+}
+
+// Rendu canvas (grands graphes) : tout est redessiné à chaque tick, sans nœud DOM
+function renderCanvas() {
+    const ratio = window.devicePixelRatio || 1;
+    const canvas = d3.select("#network-graph")
+        .append("canvas")
+        .attr("width", width * ratio)
+        .attr("height", height * ratio)
+        .style("width", width + "px")
+        .style("height", height + "px");
+    const context = canvas.node().getContext("2d");
+    let transform = d3.zoomIdentity;
+
+    function draw() {
+        context.save();
+        context.setTransform(ratio, 0, 0, ratio, 0, 0);
+        context.clearRect(0, 0, width, height);
+        context.translate(transform.x, transform.y);
+        context.scale(transform.k, transform.k);
+
+        // Tous les liens en un seul tracé
+        context.beginPath();
+        for (const edge of networkData.edges) {
+            context.moveTo(edge.source.x, edge.source.y);
+            context.lineTo(edge.target.x, edge.target.y);
+        }
+        context.strokeStyle = "rgba(153, 153, 153, 0.6)";
+        context.lineWidth = 1;
+        context.stroke();
+
+        for (const d of networkData.nodes) {
+            context.beginPath();
+            context.arc(d.x, d.y, radiusScale(d.inbound), 0, 2 * Math.PI);
+            context.fillStyle = colorScale(d.inbound);
+            context.fill();
+            context.lineWidth = nodeStrokeWidth(d);
+            context.strokeStyle = nodeStroke(d);
+            context.stroke();
+        }
+
+        if (labelsVisible) {
+            context.globalAlpha = 0.8;
+            context.fillStyle = "#333";
+            context.font = "10px sans-serif";
+            context.textAlign = "center";
+            context.textBaseline = "middle";
+            for (const d of networkData.nodes) {
+                context.fillText(d.label, d.x, d.y);
+            }
+        }
+        context.restore();
+    }
+
+    // Nœud sous le pointeur (en coordonnées du graphe), ou undefined
+    function nodeAt(event) {
+        const [x, y] = transform.invert(d3.pointer(event, canvas.node()));
+        const d = simulation
+            ? simulation.find(x, y)
+            : d3.least(networkData.nodes, n => (n.x - x) ** 2 + (n.y - y) ** 2);
+        return d && Math.hypot(d.x - x, d.y - y) <= radiusScale(d.inbound) ? d : undefined;
+    }
+
+    zoom.on("zoom", function(event) {
+        transform = event.transform;
+        draw();
+    });
+    canvas.call(zoom);
+
+    canvas.on("mousemove", function(event) {
+        const d = nodeAt(event);
+        if (d) {
+            showTooltip(event, d);
+        } else {
+            hideTooltip();
+        }
+    })
+    .on("mouseout", hideTooltip);
+
+    if (simulation) simulation.on("tick", draw);
+    draw();
+
+    return {
+        zoomTarget: canvas,
+        redraw: draw,
+        update: draw
+    };
+}
+
+const view = useCanvas ? renderCanvas() : renderSvg();
+
+// Fonctions de contrôle
+function resetZoom() {
+    view.zoomTarget.transition().duration(750).call(
+        zoom.transform,
+        d3.zoomIdentity
+    );
+}
+
+function toggleLabels() {
+    labelsVisible = !labelsVisible;
+    view.update();
+
+    // Mettre à jour le bouton
+    d3.select('button:nth-child(2)')
+        .classed('active', labelsVisible);
+}
+
+function highlightOrphans() {
+    orphansHighlighted = !orphansHighlighted;
+    view.update();
+
+    // Mettre à jour le bouton
+    d3.select('button:nth-child(3)')
+        .classed('active', orphansHighlighted);
+}
+
+// Fonctions de drag (sans simulation, seul le nœud déplacé bouge)
+function dragstarted(event, d) {
+    if (!simulation) return;
+    if (!event.active) simulation.alphaTarget(0.3).restart();
+    d.fx = d.x;
+    d.fy = d.y;
+}
+
+function dragged(event, d) {
+    if (!simulation) {
+        d.x = event.x;
+        d.y = event.y;
+        view.redraw();
+        return;
+    }
+    d.fx = event.x;
+    d.fy = event.y;
+}
+
+function dragended(event, d) {
+    if (!simulation) return;
+    if (!event.active) simulation.alphaTarget(0);
+    d.fx = null;
+    d.fy = null;
+}
@@ -23,19 +23,19 @@ def install_dependencies():
     print("⏳ Cette opération peut prendre plusieurs minutes...")
     
     try:
-        # Installer les packages
-        for package in packages:
-            print(f"\n🔄 Installation de {package}...")
-            result = subprocess.run([
-                sys.executable, "-m", "pip", "install", package
-            ], capture_output=True, text=True)
-            
-            if result.returncode == 0:
-                print(f"✅ {package} installé avec succès")
-            else:
-                print(f"❌ Erreur lors de l'installation de {package}:")
-                print(result.stderr)
-                return False
+        # Un seul appel pip pour tous les packages : une résolution des dépendances commune
+        # et un seul démarrage de pip, wheels précompilées de préférence
+        print("\n🔄 Installation des packages...")
+        result = subprocess.run([
+            sys.executable, "-m", "pip", "install", "--prefer-binary"
+        ] + packages, capture_output=True, text=True)
+        
+        if result.returncode == 0:
+            print(f"✅ {len(packages)} packages installés avec succès")
+        else:
+            print("❌ Erreur lors de l'installation des packages:")
+            print(result.stderr)
+            return False
         
         print("\n🎉 Toutes les dépendances ont été installées avec succès !")
         print("\nℹ️  L'analyse sémantique CamemBERT sera maintenant disponible automatiquement.")
@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Serveur d'embeddings pour l'analyse sémantique
+Garde le modèle chargé en mémoire entre deux exécutions des scripts d'audit : seul le premier
+lancement paie le chargement. Démarré automatiquement par get_semantic_analyzer(), il s'arrête
+après SEMANTIC_SERVER_IDLE_TIMEOUT secondes sans requête.
+"""
+
+import os
+import sys
+import json
+import socket
+import threading
+import socketserver
+import numpy as np
+
+from ext_analyseur_semantique import (
+    CamemBERTSemanticAnalyzer, SEMANTIC_SERVER_SOCKET, SEMANTIC_SERVER_IDLE_TIMEOUT, _ping_semantic_server
+)
+
+class SemanticRequestHandler(socketserver.StreamRequestHandler):
+    """Une requête JSON par ligne ; les embeddings suivent la réponse en float32 brut"""
+
+    def handle(self):
+        with self.server.active_lock:
+            self.server.active_requests += 1
+        try:
+            for line in self.rfile:
+                self.wfile.write(self.answer(json.loads(line)))
+        finally:
+            with self.server.active_lock:
+                self.server.active_requests -= 1
+
+    def answer(self, request) -> bytes:
+        """Réponse JSON (suivie des données binaires éventuelles) à une requête"""
+        op = request.get("op")
+        if op == "ping":
+            # Hors du verrou : un autre audit voit le serveur actif même pendant un long encodage
+            return json.dumps({"ok": True}).encode('utf-8') + b'\n'
+
+        analyzer = self.server.analyzer
+        payload = b''
+        # L'analyseur et son cache ne sont pas partagés entre threads : une opération à la fois
+        with self.server.analyzer_lock:
+            if op == "encode":
+                embeddings = analyzer.encode_with_cache(request.get("texts", []))
+                if embeddings.size == 0:
+                    response = {"error": "Aucun embedding calculé"}
+                else:
+                    payload = np.ascontiguousarray(embeddings, dtype=np.float32).tobytes()
+                    response = {"shape": list(embeddings.shape), "nbytes": len(payload)}
+            elif op == "stats":
+                response = analyzer.get_cache_stats()
+            elif op == "clear":
+                analyzer.clear_cache()
+                response = {"ok": True}
+            else:
+                response = {"error": f"Opération inconnue: {op}"}
+
+        return json.dumps(response).encode('utf-8') + b'\n' + payload
+
+class SemanticServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    """Une connexion par thread ; les opérations sur l'analyseur restent sérialisées"""
+
+    timeout = SEMANTIC_SERVER_IDLE_TIMEOUT
+
+    def __init__(self, analyzer: CamemBERTSemanticAnalyzer):
+        super().__init__(SEMANTIC_SERVER_SOCKET, SemanticRequestHandler)
+        self.analyzer = analyzer
+        self.analyzer_lock = threading.Lock()
+        self.active_lock = threading.Lock()
+        self.active_requests = 0
+        self.idle = False
+        # Inode du socket créé : à l'arrêt, ne supprimer que celui-ci (pas celui d'un autre serveur)
+        self.socket_inode = os.stat(SEMANTIC_SERVER_SOCKET).st_ino
+
+    def handle_timeout(self):
+        # Pas d'arrêt pendant une requête en cours, même longue
+        with self.active_lock:
+            self.idle = self.active_requests == 0
+
+def _is_stale_socket() -> bool:
+    """Le socket existe mais aucun serveur n'y écoute (et non un serveur occupé ou lent)"""
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+        try:
+            sock.connect(SEMANTIC_SERVER_SOCKET)
+        except ConnectionRefusedError:
+            return True
+        except OSError:
+            return False
+    return False
+
+def main():
+    """Charger le modèle puis répondre aux requêtes jusqu'à inactivité"""
+    if _ping_semantic_server() or (os.path.exists(SEMANTIC_SERVER_SOCKET) and not _is_stale_socket()):
+        print("✅ Serveur d'embeddings déjà actif")
+        return 0
+
+    # Le socket n'est créé qu'une fois le modèle chargé : répondre au ping signifie être prêt
+    analyzer = CamemBERTSemanticAnalyzer()
+    if not analyzer._load_model():
+        return 1
+
+    # Socket d'un serveur arrêté (connexion refusée) : le remplacer. Vérifié après le chargement
+    # du modèle, un autre serveur ayant pu démarrer entre-temps
+    if os.path.exists(SEMANTIC_SERVER_SOCKET):
+        if not _is_stale_socket():
+            print("✅ Serveur d'embeddings déjà actif")
+            return 0
+        os.remove(SEMANTIC_SERVER_SOCKET)
+
+    try:
+        server = SemanticServer(analyzer)
+    except OSError as e:
+        # Un autre serveur a créé le socket entre la vérification et la création
+        print(f"✅ Serveur d'embeddings déjà actif ({e})")
+        return 0
+
+    with server:
+        print(f"🧠 Serveur d'embeddings à l'écoute sur {SEMANTIC_SERVER_SOCKET}")
+        try:
+            while not server.idle:
+                server.handle_request()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            try:
+                if os.stat(SEMANTIC_SERVER_SOCKET).st_ino == server.socket_inode:
+                    os.remove(SEMANTIC_SERVER_SOCKET)
+            except FileNotFoundError:
+                pass
+
+    print("👋 Serveur d'embeddings arrêté")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -9,6 +9,13 @@ import json
 import sys
 from pathlib import Path
 
+# Import optionnel d'orjson pour lire la configuration
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 def check_files():
     """Vérifie la présence des fichiers essentiels"""
     required_files = [
@@ -38,8 +45,8 @@ def check_config():
         return False, "Fichier ext_configuration_audit.json manquant"
 
     try:
-        with open(config_file, 'r', encoding='utf-8') as f:
-            config = json.load(f)
+        data = Path(config_file).read_bytes()
+        config = orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
 
         required_keys = ['screaming_frog_path', 'export_path', 'analysis_thresholds']
         for key in required_keys:
@@ -47,7 +54,7 @@ def check_config():
                 return False, f"Clé manquante dans la configuration: {key}"
 
         return True, "Configuration valide"
-    except json.JSONDecodeError as e:
+    except json.JSONDecodeError as e:  # orjson.JSONDecodeError en hérite
         return False, f"Erreur JSON dans ext_configuration_audit.json: {e}"
     except Exception as e:
         return False, f"Erreur lors de la lecture de la configuration: {e}"
@@ -75,6 +82,8 @@ def check_dependencies():
     except ImportError:
         dependencies_status['anthropic'] = "❌ Manquant (optionnel pour IA)"
 
+    dependencies_status['orjson'] = "✅ Installé" if ORJSON_AVAILABLE else "❌ Manquant (optionnel, accélère la lecture/écriture JSON)"
+
     # Dépendances ML
     try:
         from sentence_transformers import SentenceTransformer